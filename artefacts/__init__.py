@@ -1,5 +1,43 @@
 # flake8: noqa
 
-from .version import __version__
-from .deserializers import Manifest, RunResults, Catalog, Sources
-from .config import Config
+# The package's attributes are imported when they are first accessed, so that
+# `import artefacts` doesn't build the pydantic models or read the config.
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .version import __version__
+    from .deserializers import Manifest, RunResults, Catalog, Sources, load_all
+    from .config import Config
+
+_LAZY_ATTRIBUTES = {
+    "__version__": ".version",
+    "Manifest": ".deserializers",
+    "RunResults": ".deserializers",
+    "Catalog": ".deserializers",
+    "Sources": ".deserializers",
+    "load_all": ".deserializers",
+    "Config": ".config",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        # Submodules, like `artefacts.state`, are imported on first access too
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,228 @@
+"""
+artefacts.analysis
+==================
+
+Analyses of how a dbt invocation spent its time, combining the timings in
+the run_results artifact with the DAG in the manifest.
+
+>>> from artefacts.analysis import RunAnalysis
+>>> analysis = RunAnalysis()
+>>> path = analysis.critical_path()
+>>> path.duration == sum(analysis.execution_times[u] for u in path.unique_ids)
+True
+>>> path.duration <= analysis.total_work
+True
+>>> timelines = analysis.thread_timelines()
+>>> list(timelines) == sorted(timelines)
+True
+>>> all(0 <= timeline.utilisation <= 1 for timeline in timelines.values())
+True
+
+"""
+
+import datetime
+import typing
+
+if typing.TYPE_CHECKING:
+    from .models import ManifestModel, RunResultsModel
+
+
+class CriticalPath(typing.NamedTuple):
+    unique_ids: typing.List[str]
+    """The executed nodes on the path, from the first to the last."""
+
+    duration: float
+    """The sum of the execution_time of the nodes on the path, in seconds."""
+
+
+class ThreadInterval(typing.NamedTuple):
+    unique_id: str
+    started_at: datetime.datetime
+    completed_at: datetime.datetime
+
+    @property
+    def duration(self) -> float:
+        return (self.completed_at - self.started_at).total_seconds()
+
+
+class ThreadTimeline(typing.NamedTuple):
+    thread_id: str
+    intervals: typing.List[ThreadInterval]
+    """The nodes the thread ran, ordered by when they started."""
+
+    busy: float
+    """The seconds the thread spent running nodes."""
+
+    idle: float
+    """The seconds of the run during which the thread wasn't running a node."""
+
+    @property
+    def utilisation(self) -> float:
+        """The share of the run that the thread was busy."""
+
+        total = self.busy + self.idle
+        return self.busy / total if total else 0.0
+
+    def gaps(self) -> typing.List[typing.Tuple[datetime.datetime, datetime.datetime]]:
+        """The periods between the nodes that the thread ran."""
+
+        gaps = list()
+        for previous, interval in zip(self.intervals, self.intervals[1:]):
+            if interval.started_at > previous.completed_at:
+                gaps.append((previous.completed_at, interval.started_at))
+        return gaps
+
+
+class RunAnalysis:
+    """Where the time of a dbt invocation went.
+
+    Args:
+        manifest (ManifestModel): The manifest of the invocation. Defaults to
+                                  the project's manifest.
+        run_results (RunResultsModel): The results of the invocation. Defaults
+                                       to the project's run_results.
+    """
+
+    def __init__(
+        self,
+        manifest: "ManifestModel" = None,
+        run_results: "RunResultsModel" = None,
+    ):
+        from .deserializers import Manifest, RunResults
+
+        self.manifest = manifest if manifest is not None else Manifest()
+        self.run_results = run_results if run_results is not None else RunResults()
+
+        self.execution_times: typing.Dict[str, float] = dict()
+        """The execution_time of each node that ran, keyed by unique_id."""
+
+        for result in self.run_results.results:
+            self.execution_times[result.unique_id] = result.execution_time
+
+    @property
+    def total_work(self) -> float:
+        """The sum of the execution_time of every node that ran, in seconds."""
+
+        return sum(self.execution_times.values())
+
+    def critical_path(self) -> CriticalPath:
+        """The chain of dependent nodes with the largest total execution_time.
+
+        No number of threads can complete the run faster than the duration of
+        its critical path. Nodes that didn't run, like sources, don't add to
+        the duration but still connect the nodes around them.
+        """
+
+        graph = self.manifest.graph
+        finish = [0.0] * len(graph)
+        previous = [-1] * len(graph)
+
+        for unique_id in graph.topological_order():
+            position = graph.position(unique_id)
+            for parent in graph.parent_positions(position):
+                if finish[parent] > finish[position]:
+                    finish[position] = finish[parent]
+                    previous[position] = parent
+            finish[position] += self.execution_times.get(unique_id, 0.0)
+
+        # Nodes that ran but are not in the manifest form paths of their own
+        best_duration, best_path = 0.0, []
+        for unique_id, execution_time in self.execution_times.items():
+            if unique_id not in graph and execution_time > best_duration:
+                best_duration, best_path = execution_time, [unique_id]
+
+        if finish and max(finish) > best_duration:
+            position = max(range(len(finish)), key=finish.__getitem__)
+            best_duration, best_path = finish[position], []
+            while position != -1:
+                best_path.append(graph.unique_ids[position])
+                position = previous[position]
+            best_path.reverse()
+
+        executed = [u for u in best_path if u in self.execution_times]
+        return CriticalPath(unique_ids=executed, duration=best_duration)
+
+    def intervals(self) -> typing.List[typing.Tuple[str, ThreadInterval]]:
+        """The thread and the period of each node that ran, from the start of
+        its first timing step to the end of its last one. Results without
+        timings are not included."""
+
+        intervals = list()
+        for result in self.run_results.results:
+            starts = [t.started_at for t in result.timing if t.started_at]
+            ends = [t.completed_at for t in result.timing if t.completed_at]
+            if starts and ends:
+                interval = ThreadInterval(result.unique_id, min(starts), max(ends))
+                intervals.append((result.thread_id, interval))
+        return intervals
+
+    @property
+    def makespan(self) -> float:
+        """The seconds from the start of the first node to the end of the last,
+        or the run's elapsed_time if the results have no timings."""
+
+        intervals = [i for _, i in self.intervals()]
+        if not intervals:
+            return self.run_results.elapsed_time
+        started_at = min(i.started_at for i in intervals)
+        completed_at = max(i.completed_at for i in intervals)
+        return (completed_at - started_at).total_seconds()
+
+    def thread_timelines(self) -> typing.Dict[str, ThreadTimeline]:
+        """The busy and idle time of each thread, keyed by thread_id."""
+
+        by_thread: typing.Dict[str, typing.List[ThreadInterval]] = dict()
+        for thread_id, interval in self.intervals():
+            by_thread.setdefault(thread_id, []).append(interval)
+
+        makespan = self.makespan
+        timelines = dict()
+        for thread_id in sorted(by_thread):
+            intervals = sorted(by_thread[thread_id], key=lambda i: i.started_at)
+            busy = sum(i.duration for i in intervals)
+            timelines[thread_id] = ThreadTimeline(
+                thread_id=thread_id,
+                intervals=intervals,
+                busy=busy,
+                idle=max(makespan - busy, 0.0),
+            )
+        return timelines
+
+    @property
+    def utilisation(self) -> float:
+        """The share of the run that the threads were busy, on average."""
+
+        timelines = self.thread_timelines().values()
+        if not timelines:
+            return 0.0
+        return sum(t.utilisation for t in timelines) / len(timelines)
+
+    @property
+    def parallelism(self) -> float:
+        """The total work divided by the duration of the critical path, which
+        is the most threads that the run could keep busy on average."""
+
+        duration = self.critical_path().duration
+        return self.total_work / duration if duration else 0.0
+
+    def speedup(self, threads: int = None) -> float:
+        """The most that the run could be sped up with a number of threads,
+        compared to its makespan.
+
+        With `threads` threads the run takes at least the larger of the total
+        work divided between the threads and the critical path. The bound
+        ignores the order in which dbt schedules nodes, so the achievable
+        speedup can be lower. :func:`artefacts.simulation.simulate` predicts
+        the duration with dbt's scheduling.
+
+        Args:
+            threads (int): The number of threads. Defaults to unlimited threads.
+        """
+
+        if threads is not None and threads < 1:
+            raise ValueError("The number of threads must be at least 1")
+
+        lower_bound = self.critical_path().duration
+        if threads is not None:
+            lower_bound = max(lower_bound, self.total_work / threads)
+        return self.makespan / lower_bound if lower_bound else 1.0
@@ -259,6 +259,42 @@ def selectors() -> typing.List[dict]:
     return list(manifest.selectors.values())
 
 
+def select(
+    select: typing.Union[str, typing.List[str]] = None,
+    exclude: typing.Union[str, typing.List[str]] = None,
+    selector: str = None,
+    indirect_selection: str = "eager",
+) -> typing.List:
+    """A list of the resources matching dbt's node selection syntax.
+
+    Args:
+        select (str): Equivalent to dbt's `--select` argument, eg
+                      'tag:nightly+ +model_a'. Defaults to all resources.
+        exclude (str): Equivalent to dbt's `--exclude` argument.
+        selector (str): The name of a YAML selector defined in the project.
+                        Cannot be combined with `select` or `exclude`.
+        indirect_selection (str): Either 'eager' or 'cautious'. Controls which
+                                  tests of the selected resources are included.
+                                  Default 'eager'.
+
+    >>> resources = artefacts.api.select('tag:internal', indirect_selection='cautious')
+    >>> all('internal' in r.tags for r in resources if r.resource_type != 'test')
+    True
+    >>> [r.name for r in artefacts.api.select('+customers') if r.name == 'customers']
+    ['customers']
+
+    """
+
+    manifest = Manifest()
+    unique_ids = manifest.selector.select(
+        select=select,
+        exclude=exclude,
+        selector=selector,
+        indirect_selection=indirect_selection,
+    )
+    return [manifest.index[u] for u in unique_ids]
+
+
 def tags() -> typing.List[ManifestMetricNode]:
     """A dictionary mapping tags to their various resources
 
@@ -0,0 +1,144 @@
+"""
+artefacts.cache
+===============
+
+A persistent cache of parsed artifacts, so that a new process can load an
+unchanged artifact without parsing and validating its JSON again.
+
+The cache is enabled by setting the :code:`cache_dir` config option. Each
+artifact is pickled into the cache directory under a key derived from the
+contents of its file, the version of artefacts and the model it was parsed
+into, so the cache never returns an artifact parsed from different contents
+or by a different version of artefacts.
+
+>>> import tempfile
+>>> from artefacts.cache import ArtifactCache
+>>> cache = ArtifactCache(tempfile.mkdtemp())
+>>> path = artefacts.Config().dbt_target_dir + '/run_results.json'
+>>> key = cache.key(path, artefacts.models.RunResultsModel)
+>>> run_results = cache.dump(key, artefacts.RunResults())
+>>> cache.load(key) == run_results
+True
+
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import typing
+
+from .version import __version__
+
+if typing.TYPE_CHECKING:
+    from .config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheKey(typing.NamedTuple):
+    prefix: str
+    """Identifies the artifact file and how it was parsed."""
+
+    digest: str
+    """Identifies the contents of the file, and the version of artefacts."""
+
+    @property
+    def filename(self) -> str:
+        return f"{self.prefix}-{self.digest}.pickle"
+
+
+class ArtifactCache:
+    """A directory of pickled artifacts.
+
+    Args:
+        cache_dir (str): The directory to store the artifacts in. It is created
+                         when the first artifact is stored.
+    """
+
+    chunk_size = 2**20
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = os.path.abspath(cache_dir)
+
+    @classmethod
+    def from_config(cls, config: "Config") -> typing.Optional["ArtifactCache"]:
+        """The cache configured by the :code:`cache_dir` option, if any."""
+
+        if not config.cache_dir:
+            return None
+        return cls(config.cache_dir)
+
+    def key(self, path: str, model, *variant: typing.Any) -> CacheKey:
+        """The key of an artifact file parsed into `model`. Any `variant` values
+        that change how the file is parsed are included in the key."""
+
+        path = os.path.abspath(path)
+        name = os.path.basename(path).split(".")[0]
+
+        # Entries for the same file and parser share a prefix, so an entry is
+        # replaced when the file changes but not when it's parsed differently.
+        parser = (path, model.__module__, model.__qualname__, *variant)
+        parser_hash = hashlib.blake2b(repr(parser).encode(), digest_size=6)
+
+        digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+        with open(path, "rb") as fh:
+            while True:
+                chunk = fh.read(self.chunk_size)
+                if not chunk:
+                    break
+                digest.update(chunk)
+
+        return CacheKey(f"{name}-{parser_hash.hexdigest()}", digest.hexdigest())
+
+    def load(self, key: CacheKey) -> typing.Any:
+        """The cached artifact, or `None` if it isn't cached or can't be read."""
+
+        filename = os.path.join(self.cache_dir, key.filename)
+        try:
+            with open(filename, "rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Ignoring unreadable cache entry {filename}", exc_info=True)
+            self._remove(filename)
+            return None
+
+    def dump(self, key: CacheKey, artifact: typing.Any) -> typing.Any:
+        """Store the artifact, replacing older entries for the same file, and
+        return it. Failing to write the cache is logged but not raised."""
+
+        filename = os.path.join(self.cache_dir, key.filename)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Write to a temporary file first, so that a concurrent process
+            # never reads a partially written entry.
+            fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(artifact, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_filename, filename)
+            except BaseException:
+                self._remove(tmp_filename)
+                raise
+        except Exception:
+            logger.warning(f"Failed to write cache entry {filename}", exc_info=True)
+            return artifact
+
+        pattern = os.path.join(glob.escape(self.cache_dir), f"{key.prefix}-*.pickle")
+        for stale in glob.glob(pattern):
+            if stale != filename:
+                self._remove(stale)
+        return artifact
+
+    @staticmethod
+    def _remove(filename: str):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
@@ -0,0 +1,254 @@
+"""
+artefacts.columnar
+==================
+
+Columnar exports of the results in a run_results artifact, for analysing
+large numbers of results with dataframe libraries.
+
+The columns are built in a single pass over the artifact's raw JSON, without
+building a :class:`RunResultNode` for each result. They can be returned as a
+dictionary of lists, which pandas and polars accept directly, as a NumPy
+structured array, or as an Arrow table. NumPy and pyarrow are optional, and
+only need to be installed to use their formats.
+
+>>> from artefacts.columnar import results_table
+>>> table = results_table()
+>>> results = artefacts.RunResults().results
+>>> table['unique_id'] == [result.unique_id for result in results]
+True
+>>> timing = next(t for t in results[0].timing if t.name == 'compile')
+>>> started_at = table['compile_started_at'][0].replace('Z', '+00:00')
+>>> datetime.datetime.fromisoformat(started_at) == timing.started_at
+True
+
+"""
+
+import datetime
+import importlib
+import json
+import typing
+
+from .loaders import FileSystemLoader, json_decoder, open_artifact
+
+Columns = typing.Dict[str, list]
+
+TIMING_STEPS = ["compile", "execute"]
+"""The steps of a result's timing that become columns of the results table."""
+
+RESULT_COLUMNS = {
+    "unique_id": "string",
+    "status": "string",
+    "thread_id": "string",
+    "execution_time": "float",
+    "failures": "integer",
+    "message": "string",
+    **{
+        f"{step}_{e}_at": "timestamp"
+        for step in TIMING_STEPS
+        for e in ["started", "completed"]
+    },
+}
+"""The fixed columns of the results table, and their types."""
+
+TIMING_COLUMNS = {
+    "unique_id": "string",
+    "name": "string",
+    "started_at": "timestamp",
+    "completed_at": "timestamp",
+}
+"""The columns of the timing table, and their types."""
+
+FORMATS = ["dict", "numpy", "arrow"]
+
+
+def _import(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            f"The {name} package is required for this format. "
+            f"Install it with `pip install {name}`."
+        ) from None
+
+
+def _raw_run_results(source, Loader, config, json_backend) -> dict:
+    if isinstance(source, dict):
+        return source
+    if source is None:
+        from .deserializers import ArtifactDeserializer
+
+        config = ArtifactDeserializer.get_or_set_config(config=config)
+        return Loader(config=config).load("run_results")
+    with open_artifact(source) as fh:
+        return json_decoder(json_backend)(fh.read())
+
+
+def _column_type(values: list) -> str:
+    types = {type(v) for v in values if v is not None}
+    if not types:
+        return "string"
+    if types == {int}:
+        return "integer"
+    if types <= {int, float}:
+        return "float"
+    if types == {bool}:
+        return "boolean"
+    return "string"
+
+
+def _results_columns(raw: dict) -> typing.Tuple[Columns, Columns, dict]:
+    results = raw.get("results") or []
+    columns: Columns = {name: [None] * len(results) for name in RESULT_COLUMNS}
+    adapter_columns: Columns = dict()
+    timing: Columns = {name: [] for name in TIMING_COLUMNS}
+
+    for row, result in enumerate(results):
+        unique_id = result.get("unique_id")
+        columns["unique_id"][row] = unique_id
+        columns["status"][row] = result.get("status")
+        columns["thread_id"][row] = result.get("thread_id")
+        columns["execution_time"][row] = result.get("execution_time")
+        columns["failures"][row] = result.get("failures")
+        columns["message"][row] = result.get("message")
+
+        for step in result.get("timing") or []:
+            name = step.get("name")
+            timing["unique_id"].append(unique_id)
+            timing["name"].append(name)
+            timing["started_at"].append(step.get("started_at"))
+            timing["completed_at"].append(step.get("completed_at"))
+            if name in TIMING_STEPS:
+                columns[f"{name}_started_at"][row] = step.get("started_at")
+                columns[f"{name}_completed_at"][row] = step.get("completed_at")
+
+        for key, value in (result.get("adapter_response") or dict()).items():
+            name = f"adapter_response_{key}"
+            if name not in adapter_columns:
+                adapter_columns[name] = [None] * len(results)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            adapter_columns[name][row] = value
+
+    types = dict(RESULT_COLUMNS)
+    for name, values in adapter_columns.items():
+        types[name] = _column_type(values)
+        if types[name] == "string":
+            values[:] = [v if v is None else str(v) for v in values]
+    columns.update(adapter_columns)
+    return columns, timing, types
+
+
+def _parse_timestamp(value: typing.Optional[str]):
+    if value is None:
+        return None
+    # fromisoformat only accepts a "Z" suffix from Python 3.11
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _to_numpy(columns: Columns, types: dict):
+    np = _import("numpy")
+
+    arrays = list()
+    for name, values in columns.items():
+        kind = types[name]
+        if kind == "timestamp":
+            stripped = ["NaT" if v is None else v.rstrip("Z") for v in values]
+            arrays.append(np.array(stripped, dtype="datetime64[us]"))
+        elif kind == "float" or (kind == "integer" and None in values):
+            arrays.append(
+                np.array([np.nan if v is None else v for v in values], dtype="f8")
+            )
+        elif kind == "integer":
+            arrays.append(np.array(values, dtype="i8"))
+        else:
+            arrays.append(np.array(values, dtype=object))
+
+    dtype = [(name, array.dtype) for name, array in zip(columns, arrays)]
+    table = np.empty(len(arrays[0]) if arrays else 0, dtype=dtype)
+    for name, array in zip(columns, arrays):
+        table[name] = array
+    return table
+
+
+def _to_arrow(columns: Columns, types: dict):
+    pa = _import("pyarrow")
+
+    arrow_types = {
+        "string": pa.string(),
+        "float": pa.float64(),
+        "integer": pa.int64(),
+        "boolean": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    arrays = dict()
+    for name, values in columns.items():
+        if types[name] == "timestamp":
+            values = [_parse_timestamp(v) for v in values]
+        arrays[name] = pa.array(values, type=arrow_types[types[name]])
+    return pa.table(arrays)
+
+
+def _convert(columns: Columns, types: dict, format: str):
+    if format == "dict":
+        return columns
+    if format == "numpy":
+        return _to_numpy(columns, types)
+    if format == "arrow":
+        return _to_arrow(columns, types)
+    raise ValueError(
+        f"Invalid format {format!r}, expected one of: {', '.join(FORMATS)}"
+    )
+
+
+def results_table(
+    source: typing.Union[str, dict] = None,
+    format: str = "dict",
+    Loader=FileSystemLoader,
+    config=None,
+    json_backend: str = "auto",
+):
+    """A table of the results in a run_results artifact, with one row per
+    result.
+
+    The table has the :code:`RESULT_COLUMNS`, and a column for each key of the
+    results' :code:`adapter_response`, named like
+    :code:`adapter_response_rows_affected`. Timestamps are strings in the
+    :code:`dict` format, and UTC timestamps in the other formats.
+
+    Args:
+        source: The path of a run_results file, or its decoded JSON. Defaults
+                to the project's run_results artifact.
+        format (str): :code:`dict` for a dictionary of lists, :code:`numpy` for
+                      a structured array or :code:`arrow` for a pyarrow Table.
+        Loader: The loader used to read the project's artifact.
+        config (Config): The config used to read the project's artifact.
+        json_backend (str): The JSON library used to decode a `source` path.
+    """
+
+    raw = _raw_run_results(source, Loader, config, json_backend)
+    columns, _, types = _results_columns(raw)
+    return _convert(columns, types, format)
+
+
+def timing_table(
+    source: typing.Union[str, dict] = None,
+    format: str = "dict",
+    Loader=FileSystemLoader,
+    config=None,
+    json_backend: str = "auto",
+):
+    """A table of the timing entries in a run_results artifact, with one row
+    per step of each result, and the :code:`TIMING_COLUMNS`. The arguments are
+    the same as for :func:`results_table`.
+
+    >>> from artefacts.columnar import timing_table
+    >>> table = timing_table()
+    >>> table['name'][:2]
+    ['compile', 'execute']
+
+    """
+
+    raw = _raw_run_results(source, Loader, config, json_backend)
+    _, timing, _ = _results_columns(raw)
+    return _convert(timing, TIMING_COLUMNS, format)
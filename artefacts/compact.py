@@ -0,0 +1,192 @@
+"""
+artefacts.compact
+=================
+
+Compact, read-only representations of the nodes in a manifest, for
+long-lived processes that keep a large manifest in memory.
+
+When the :code:`compact_nodes` option is enabled, the values of
+:code:`Manifest().nodes` are compact nodes instead of pydantic models. A
+compact node has the same attributes as the model it replaces, but stores
+them in :code:`__slots__` instead of a dictionary. Strings that repeat across
+nodes, like package names and tags, are interned so that every node shares one
+copy, and long SQL bodies are kept compressed until they are read.
+
+>>> manifest = artefacts.Manifest()
+>>> model = next(manifest.iter_resource_type('model'))
+>>> node = compact(model)
+>>> type(node).__name__
+'CompactManifestModelNode'
+>>> node.name == model.name and node.raw_sql == model.raw_sql
+True
+>>> node.to_model() == model
+True
+
+"""
+
+import sys
+import typing
+import zlib
+
+from .mixins import ArtifactNodeReader
+from .models import (
+    ManifestAnalysisNode,
+    ManifestModelNode,
+    ManifestOperationNode,
+    ManifestSeedNode,
+    ManifestSnapshotNode,
+    ManifestTestNode,
+)
+
+INTERNED_FIELDS = {
+    "package_name",
+    "resource_type",
+    "database",
+    "db_schema",
+    "root_path",
+    "name",
+    "alias",
+    "description",
+}
+"""Fields whose string values are interned. A node's alias is usually the
+same as its name, and most descriptions are empty."""
+
+INTERNED_LIST_FIELDS = {"tags", "fqn"}
+"""Fields whose lists of strings are interned."""
+
+COMPRESSED_FIELDS = {"raw_sql", "compiled_sql"}
+"""Fields whose strings are compressed until they are read."""
+
+MIN_COMPRESSED_LENGTH = 256
+"""Shorter strings are not compressed, because they would hardly shrink."""
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _compress(value):
+    if isinstance(value, str) and len(value) >= MIN_COMPRESSED_LENGTH:
+        return zlib.compress(value.encode("utf-8"), 1)
+    return value
+
+
+def _decompress(value):
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+class CompactNode(ArtifactNodeReader):
+    """The base class of the compact nodes.
+
+    Compact nodes are read-only, and only support reading attributes. Use
+    :meth:`to_model` to get the equivalent pydantic model.
+    """
+
+    __slots__ = ("_target_dir",)
+
+    model: typing.ClassVar[type]
+    """The pydantic model that the node replaces."""
+
+    fields: typing.ClassVar[typing.Tuple[str, ...]]
+    """The names of the model's fields, in order."""
+
+    def __init__(self, node):
+        for name in self.fields:
+            value = getattr(node, name)
+            if name in INTERNED_FIELDS:
+                value = _intern(value)
+            elif name in INTERNED_LIST_FIELDS and value is not None:
+                value = [_intern(v) for v in value]
+            elif name in COMPRESSED_FIELDS:
+                name, value = f"_{name}", _compress(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.unique_id}>"
+
+    def __reduce__(self):
+        state = tuple(object.__getattribute__(self, s) for s in self.__slots__)
+        return (_unpickle_compact_node, (self.__class__.__name__, state))
+
+    def dict(self) -> dict:
+        """The node's fields and their values."""
+
+        return {name: getattr(self, name) for name in self.fields}
+
+    def to_model(self):
+        """The equivalent pydantic model of the node."""
+
+        return self.model.construct(**self.dict())
+
+
+def _compressed_property(name):
+    def getter(self):
+        return _decompress(getattr(self, f"_{name}"))
+
+    return property(getter, doc=f"The {name} attribute, decompressed when read.")
+
+
+def _compact_class(model) -> typing.Type[CompactNode]:
+    fields = tuple(model.__fields__)
+    namespace = {
+        "__slots__": tuple(
+            f"_{name}" if name in COMPRESSED_FIELDS else name for name in fields
+        ),
+        "__module__": __name__,
+        "__doc__": f"A compact, read-only :class:`{model._qualpath()}`.",
+        "model": model,
+        "fields": fields,
+    }
+    for name in COMPRESSED_FIELDS.intersection(fields):
+        namespace[name] = _compressed_property(name)
+    return type(f"Compact{model.__name__}", (CompactNode,), namespace)
+
+
+COMPACT_CLASSES: typing.Dict[type, typing.Type[CompactNode]] = {
+    model: _compact_class(model)
+    for model in [
+        ManifestModelNode,
+        ManifestTestNode,
+        ManifestOperationNode,
+        ManifestSnapshotNode,
+        ManifestSeedNode,
+        ManifestAnalysisNode,
+    ]
+}
+"""The compact class of each node model."""
+
+# The classes are module attributes so that compact nodes can be pickled
+globals().update({c.__name__: c for c in COMPACT_CLASSES.values()})
+
+
+def _unpickle_compact_node(class_name, state):
+    cls = globals()[class_name]
+    node = cls.__new__(cls)
+    for slot, value in zip(cls.__slots__, state):
+        object.__setattr__(node, slot, value)
+    return node
+
+
+def compact(node):
+    """The compact representation of a node. Nodes that are already compact,
+    or that have no compact representation, are returned unchanged."""
+
+    for model in type(node).__mro__:
+        if model in COMPACT_CLASSES:
+            return COMPACT_CLASSES[model](node)
+    return node
+
+
+def compact_nodes(nodes: typing.Mapping) -> dict:
+    """A dictionary of the compact representations of the nodes in a mapping,
+    like :code:`ManifestModel.nodes`."""
+
+    return {unique_id: compact(node) for unique_id, node in nodes.items()}
@@ -1,12 +1,35 @@
 from collections.abc import Mapping
 import toml
 import os
+import typing
+
+
+def to_bool(value) -> bool:
+    """Interpret a config value, which may come from an environment variable."""
+
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
 
 
 class Config(Mapping):
     defaults = {
         "dbt_project_dir": ".",
         "dbt_target_dir": "target",
+        "lazy_load": False,
+        "compact_nodes": False,
+        "deduplicate": False,
+        "profile_load": False,
+        "trusted": False,
+        "reload_on_change": True,
+        "cache_dir": None,
+        "json_backend": "auto",
+        "object_store_url": None,
+        "object_store_check_interval": 0,
+        "object_store_region": None,
+        "object_store_access_key_id": None,
+        "object_store_secret_access_key": None,
+        "object_store_session_token": None,
     }
 
     def __init__(self, **kwargs):
@@ -52,3 +75,69 @@ class Config(Mapping):
         return os.path.abspath(
             os.path.join(self["dbt_project_dir"], self["dbt_target_dir"])
         )
+
+    @property
+    def lazy_load(self) -> bool:
+        return to_bool(self["lazy_load"])
+
+    @property
+    def compact_nodes(self) -> bool:
+        return to_bool(self["compact_nodes"])
+
+    @property
+    def deduplicate(self) -> bool:
+        return to_bool(self["deduplicate"])
+
+    @property
+    def profile_load(self) -> bool:
+        return to_bool(self["profile_load"])
+
+    @property
+    def trusted(self) -> bool:
+        return to_bool(self["trusted"])
+
+    @property
+    def reload_on_change(self) -> bool:
+        return to_bool(self["reload_on_change"])
+
+    @property
+    def cache_dir(self) -> typing.Optional[str]:
+        return self["cache_dir"] or None
+
+    @property
+    def json_backend(self) -> str:
+        return str(self["json_backend"]).strip().lower()
+
+    @property
+    def object_store_url(self) -> typing.Optional[str]:
+        return self["object_store_url"] or None
+
+    @property
+    def object_store_check_interval(self) -> float:
+        return float(self["object_store_check_interval"] or 0)
+
+    # The object store's region and credentials fall back to the standard AWS
+    # environment variables, so they don't need to be repeated for artefacts.
+
+    @property
+    def object_store_region(self) -> str:
+        return (
+            self["object_store_region"]
+            or os.environ.get("AWS_REGION")
+            or os.environ.get("AWS_DEFAULT_REGION")
+            or "us-east-1"
+        )
+
+    @property
+    def object_store_access_key_id(self) -> typing.Optional[str]:
+        return self["object_store_access_key_id"] or os.environ.get("AWS_ACCESS_KEY_ID")
+
+    @property
+    def object_store_secret_access_key(self) -> typing.Optional[str]:
+        return self["object_store_secret_access_key"] or os.environ.get(
+            "AWS_SECRET_ACCESS_KEY"
+        )
+
+    @property
+    def object_store_session_token(self) -> typing.Optional[str]:
+        return self["object_store_session_token"] or os.environ.get("AWS_SESSION_TOKEN")
@@ -0,0 +1,209 @@
+"""
+artefacts.dedup
+===============
+
+Deduplication of the values that repeat between the resources of an artifact.
+
+The resources of a large project repeat many of the same values. Generated
+tests share their configs, macro dependencies and test metadata, and the
+columns of a catalog repeat the same handful of data types. When the
+:code:`deduplicate` option is enabled, each artifact is walked once after it
+is parsed. Every string is interned, and identical dictionaries, lists and
+models are replaced by a single shared instance, so each distinct value is
+only kept in memory once.
+
+Shared values are used by every resource that had an identical value, so they
+must not be modified in place.
+
+>>> from artefacts.dedup import deduplicate, memory_report
+>>> catalog = artefacts.Catalog()
+>>> report = deduplicate(catalog)
+>>> report.saved_bytes > 0
+True
+>>> memory_report(catalog).total_bytes > 0
+True
+
+"""
+
+import gc
+import sys
+import types
+import typing
+
+import pydantic
+
+from .compact import CompactNode
+from .models import LazyMapping, ManifestNodeReference
+
+
+_SCALAR_TYPES = {int, float, bool, type(None)}
+
+
+class DeduplicationReport(typing.NamedTuple):
+    strings_interned: int
+    """The number of strings that were replaced by an equal interned string."""
+
+    structures_shared: int
+    """The number of dictionaries, lists and models that were replaced by an
+    identical shared instance."""
+
+    saved_bytes: int
+    """An estimate of the memory released by replacing the duplicates, in
+    bytes."""
+
+
+class MemoryReport(typing.NamedTuple):
+    total_bytes: int
+    """The memory used by the artifact and everything it references."""
+
+    deduplication: typing.Optional[DeduplicationReport]
+    """The report of the artifact's deduplication, if it was deduplicated."""
+
+    @property
+    def saved_bytes(self) -> int:
+        """The memory saved by deduplicating the artifact, in bytes."""
+
+        return self.deduplication.saved_bytes if self.deduplication else 0
+
+
+class Deduplicator:
+    """Replaces values by a shared instance of an identical value.
+
+    A value's children are deduplicated before the value itself, so identical
+    values always have the same children, and values can be compared by the
+    identities of their children instead of by their contents.
+    """
+
+    def __init__(self):
+        self._shared: typing.Dict[tuple, typing.Any] = dict()
+        self._bytes: typing.Dict[bytes, bytes] = dict()
+        self.strings_interned = 0
+        self.structures_shared = 0
+        self.saved_bytes = 0
+
+    def report(self) -> DeduplicationReport:
+        return DeduplicationReport(
+            strings_interned=self.strings_interned,
+            structures_shared=self.structures_shared,
+            saved_bytes=self.saved_bytes,
+        )
+
+    @staticmethod
+    def _key(value):
+        # Equal scalars of different types, like 1 and True, are distinct
+        if type(value) in _SCALAR_TYPES:
+            return (type(value), value)
+        return id(value)
+
+    def _share(self, key, value, size=None):
+        shared = self._shared.setdefault(key, value)
+        if shared is not value:
+            self.structures_shared += 1
+            self.saved_bytes += sys.getsizeof(value) if size is None else size
+        return shared
+
+    def __call__(self, value):
+        kind = type(value)
+        if kind is str:
+            interned = sys.intern(value)
+            if interned is not value:
+                self.strings_interned += 1
+                self.saved_bytes += sys.getsizeof(value)
+            return interned
+        if kind in _SCALAR_TYPES:
+            return value
+        if kind is dict:
+            # Keys are left alone, because decoders already reuse one object
+            # for each repeated key
+            key = self._key
+            for k, v in value.items():
+                value[k] = self(v)
+            items = tuple((k, key(v)) for k, v in value.items())
+            return self._share((dict, items), value)
+        if kind is list:
+            value[:] = map(self, value)
+            return self._share((list, tuple(map(self._key, value))), value)
+        if kind is tuple:
+            value = tuple(map(self, value))
+            return self._share((tuple, tuple(map(self._key, value))), value)
+        if kind is bytes:
+            shared = self._bytes.setdefault(value, value)
+            if shared is not value:
+                self.structures_shared += 1
+                self.saved_bytes += sys.getsizeof(value)
+            return shared
+        if kind is ManifestNodeReference:
+            unique_id = self(value.unique_id)
+            return self._share((kind, id(unique_id)), value)
+        if isinstance(value, LazyMapping):
+            # Only the resources that were parsed are deduplicated
+            for k, v in list(value._parsed.items()):
+                value._parsed[k] = self(v)
+            return value
+        if isinstance(value, pydantic.BaseModel):
+            return self._model(value)
+        if isinstance(value, CompactNode):
+            for slot in value.__slots__:
+                shared = self(object.__getattribute__(value, slot))
+                object.__setattr__(value, slot, shared)
+            return value
+        return value
+
+    def _model(self, model: pydantic.BaseModel):
+        values = model.__dict__
+        for name, value in values.items():
+            values[name] = self(value)
+        if model.__private_attributes__:  # The artifacts themselves
+            return model
+        key = self._key
+        items = tuple((name, key(v)) for name, v in values.items())
+        fields_set = model.__fields_set__
+        size = sum(map(sys.getsizeof, (model, values, fields_set)))
+        return self._share((type(model), frozenset(fields_set), items), model, size)
+
+
+def deduplicate(artifact) -> DeduplicationReport:
+    """Intern the strings of an artifact, and share the identical values
+    between its resources, in place.
+
+    Args:
+        artifact: A parsed artifact, like :code:`Manifest()` or
+                  :code:`Catalog()`.
+    """
+
+    deduplicator = Deduplicator()
+    deduplicator(artifact)
+    report = deduplicator.report()
+    if "_deduplication" in artifact.__private_attributes__:
+        artifact._deduplication = report
+    return report
+
+
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType)
+
+
+def _deep_size(obj) -> int:
+    seen = set()
+    size = 0
+    objects = [obj]
+    while objects:
+        referents = list()
+        for o in objects:
+            if id(o) in seen or isinstance(o, _SKIPPED_TYPES):
+                continue
+            seen.add(id(o))
+            size += sys.getsizeof(o)
+            referents.append(o)
+        objects = gc.get_referents(*referents)
+    return size
+
+
+def memory_report(artifact) -> MemoryReport:
+    """The memory used by an artifact, and the memory saved by deduplicating
+    it. The size of the artifact is measured by walking every object it
+    references, which takes a moment for a large artifact."""
+
+    return MemoryReport(
+        total_bytes=_deep_size(artifact),
+        deduplication=getattr(artifact, "_deduplication", None),
+    )
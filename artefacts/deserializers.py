@@ -1,9 +1,17 @@
 import abc
+import concurrent.futures
+import contextlib
+import contextvars
+import os
+import typing
 from typing import ClassVar
 
 from .models import ManifestModel, RunResultsModel, SourcesModel, CatalogModel
 from .loaders import FileSystemLoader
+from .cache import ArtifactCache
 from .config import Config
+from .mixins import bind_target_dir
+from . import profiling
 
 import artefacts.state
 
@@ -18,35 +26,170 @@ class ArtifactDeserializer(abc.ABC):
         pass
 
     def __new__(cls, Loader=FileSystemLoader, config=None):
-        if artefacts.state.exists(cls.artifact_name):
-            return artefacts.state.get(cls.artifact_name)
-        else:
+        config = cls.get_or_set_config(config=config)
+
+        def load():
             artifact = cls.deserialize(Loader=Loader, config=config)
-            return artefacts.state.set(cls.artifact_name, artifact)
+            bind_target_dir(artifact, config.dbt_target_dir)
+            return artifact
+
+        return artefacts.state.get_or_load(
+            cls.artifact_name,
+            load,
+            fingerprint=cls.fingerprint(Loader=Loader, config=config),
+            target_dir=config.dbt_target_dir,
+        )
+
+    @classmethod
+    def fingerprint(cls, Loader=FileSystemLoader, config=None):
+        """The fingerprint of the artifact's file, used for reloading the
+        artifact when the file changes. `None` if changes are not tracked."""
+
+        config = cls.get_or_set_config(config=config)
+        if not config.reload_on_change:
+            return None
+
+        loader = Loader(config=config)
+        if hasattr(loader, "fingerprint"):
+            return loader.fingerprint(cls.artifact_name)
+        return None
 
     @classmethod
     def get_or_set_config(cls, config=None):
-        if artefacts.state.exists("config"):
-            return artefacts.state.get("config")
-        elif config is None:
-            config = Config()
-            return artefacts.state.set("config", config)
-        else:
-            return artefacts.state.set("config", config)
+        """Return `config` if one is passed, otherwise the config of the current
+        store. The first config that is used becomes the store's config.
+
+        A config passed after the store's config is set is only used for its
+        own call, and is stored for the artifacts of its target directory,
+        which are reloaded with it."""
+
+        stored = artefacts.state.get_or_load("config", lambda: config or Config())
+        if config is None:
+            return stored
+        if config is not stored:
+            artefacts.state.set("config", config, target_dir=config.dbt_target_dir)
+        return config
 
     @classmethod
-    def deserialize(cls, Loader=FileSystemLoader, config=None):
+    def config_for_target_dir(cls, target_dir: str):
+        """The config used for the artifacts in a target directory. Defaults to
+        the config of the current store, for that target directory."""
+
+        stored = artefacts.state.get("config", target_dir=target_dir)
+        if stored is not None:
+            return stored
+
+        config = cls.get_or_set_config()
+        if config.dbt_target_dir == target_dir:
+            return config
+        return Config(**{**config, "dbt_target_dir": target_dir})
+
+    @classmethod
+    def deserialize(cls, Loader=FileSystemLoader, config=None, trusted=None):
+        """Load and parse the artifact, without using the state store.
+
+        Args:
+            Loader: The loader class used to read the artifact.
+            config (Config): Defaults to the config of the current store.
+            trusted (bool): Build the artifact's models without validating
+                            them. Defaults to the config's :code:`trusted`
+                            option.
+        """
+
         config = cls.get_or_set_config(config=config)
-        loader = Loader(config=config)
-        raw_artifact = loader.load(cls.artifact_name)
-        parsed_artifact = cls.model.parse_obj(raw_artifact)
-        return parsed_artifact
+        if trusted is not None and trusted != config.trusted:
+            config = Config(**{**config, "trusted": trusted})
+        if not profiling.is_profiling(config):
+            return cls.load(Loader(config=config), config)
+
+        with profiling.recording(cls.artifact_name) as stats:
+            artifact = cls.load(Loader(config=config), config)
+            stats.measure(artifact)
+            artifact._load_stats = stats
+        stats.log()
+        return artifact
+
+    @classmethod
+    def load(cls, loader, config):
+        cache = ArtifactCache.from_config(config)
+        if cache is not None and hasattr(loader, "artifact_path"):
+            path = loader.artifact_path(cls.artifact_name)
+            # Trusted artifacts aren't validated, so they are never served to
+            # loads that validate the artifact
+            variant = (
+                config.lazy_load,
+                config.compact_nodes,
+                config.deduplicate,
+                config.trusted,
+            )
+            key = cache.key(path, cls.model, *variant)
+            with profiling.phase("cache"):
+                cached = cache.load(key)
+            if cached is not None:
+                return cached
+            artifact = cls.build(loader, config)
+            with profiling.phase("cache"):
+                return cache.dump(key, artifact)
+
+        return cls.build(loader, config)
+
+    @classmethod
+    def build(cls, loader, config):
+        artifact = cls.parse(loader, config)
+        if config.deduplicate:
+            from .dedup import deduplicate
+
+            with profiling.phase("deduplicate"):
+                deduplicate(artifact)
+        return artifact
+
+    @classmethod
+    def parse(cls, loader, config):
+        # Loaders that can validate the artifact while reading it, like the
+        # StreamingFileSystemLoader, build the model themselves.
+        if hasattr(loader, "load_model"):
+            with profiling.phase("stream"):
+                return loader.load_model(cls.artifact_name, cls.model)
+
+        with profiling.phase("read"):
+            raw_artifact = loader.load(cls.artifact_name)
+
+        # Trusted artifacts are built without validation, unless they are
+        # loaded lazily, which validates each resource when it is accessed.
+        if config.trusted and not config.lazy_load:
+            from .trusted import construct
+
+            with profiling.phase("construct"):
+                return construct(cls.model, raw_artifact)
+
+        with profiling.phase("validate"):
+            if config.lazy_load:
+                return cls.model._parse_obj_lazy(raw_artifact)
+
+            # Profiled artifacts are validated a field at a time, to time the
+            # validation of each section.
+            stats = profiling.active()
+            if stats is not None:
+                return profiling.parse_obj(cls.model, raw_artifact, stats)
+
+            parsed_artifact = cls.model.parse_obj(raw_artifact)
+            return parsed_artifact
 
 
 class Manifest(ManifestModel, ArtifactDeserializer):
     artifact_name: ClassVar = "manifest"
     model = ManifestModel
 
+    @classmethod
+    def parse(cls, loader, config):
+        manifest = super().parse(loader, config)
+        if config.compact_nodes:
+            from .compact import compact_nodes
+
+            with profiling.phase("compact"):
+                manifest.nodes = compact_nodes(manifest.nodes)
+        return manifest
+
 
 class RunResults(RunResultsModel, ArtifactDeserializer):
     artifact_name: ClassVar = "run_results"
@@ -61,3 +204,125 @@ class Sources(SourcesModel, ArtifactDeserializer):
 class Catalog(CatalogModel, ArtifactDeserializer):
     artifact_name: ClassVar = "catalog"
     model = CatalogModel
+
+
+ARTIFACT_DESERIALIZERS: typing.Dict[str, typing.Type[ArtifactDeserializer]] = {
+    Artifact.artifact_name: Artifact
+    for Artifact in [Manifest, RunResults, Sources, Catalog]
+}
+
+
+def _deserialize(artifact_name, Loader, config, profiled=False):
+    # Runs in a worker of `load_all`. A worker process has its own state store
+    # and context, so it is told whether the caller is profiling.
+    try:
+        with profiling.profile() if profiled else contextlib.nullcontext():
+            return ARTIFACT_DESERIALIZERS[artifact_name].deserialize(
+                Loader=Loader, config=config
+            )
+    except FileNotFoundError:
+        return None
+
+
+def load_all(
+    artifact_names: typing.Iterable[str] = None,
+    Loader=FileSystemLoader,
+    config=None,
+    processes: bool = None,
+    max_workers: int = None,
+) -> typing.Dict[str, typing.Any]:
+    """Load several artifacts concurrently, and place them in the state store.
+
+    The artifacts are parsed and validated in a pool of processes, which then
+    send the parsed artifacts back to be stored, so the validation of the
+    manifest, catalog and run_results is not serialized by the GIL. Artifacts
+    that are already loaded and unchanged are not loaded again, and artifacts
+    whose files don't exist are skipped.
+
+    Args:
+        artifact_names: The artifacts to load. Defaults to all artifacts.
+        Loader: The loader class used to read the artifacts.
+        config (Config): The config to load the artifacts with.
+        processes (bool): Parse the artifacts in a process pool. If `False`,
+                          a thread pool is used, which only overlaps the time
+                          spent reading the files. Defaults to using
+                          processes when more than one CPU is available.
+        max_workers (int): The size of the pool. Defaults to one worker per
+                           artifact.
+
+    Returns:
+        A dictionary of the loaded artifacts, keyed by artifact name.
+
+    >>> from artefacts.deserializers import load_all
+    >>> sorted(load_all(['manifest', 'run_results']))
+    ['manifest', 'run_results']
+
+    """
+
+    names = list(artifact_names or ARTIFACT_DESERIALIZERS)
+    for name in names:
+        if name not in ARTIFACT_DESERIALIZERS:
+            raise ValueError(f"Invalid artifact name: {name}")
+
+    config = ArtifactDeserializer.get_or_set_config(config=config)
+    store = artefacts.state.current()
+    fingerprints = {
+        name: ARTIFACT_DESERIALIZERS[name].fingerprint(Loader=Loader, config=config)
+        for name in names
+    }
+    to_load = [
+        name
+        for name in names
+        if not store.exists(
+            name, fingerprint=fingerprints[name], target_dir=config.dbt_target_dir
+        )
+    ]
+
+    if processes is None:
+        processes = (os.cpu_count() or 1) > 1
+
+    profiled = profiling.is_profiling(config)
+    futures = dict()
+    if to_load:
+        Executor = (
+            concurrent.futures.ProcessPoolExecutor
+            if processes
+            else concurrent.futures.ThreadPoolExecutor
+        )
+        with Executor(max_workers=max_workers or len(to_load)) as executor:
+            for name in to_load:
+                if processes:
+                    future = executor.submit(
+                        _deserialize, name, Loader, config, profiled
+                    )
+                else:
+                    # Threads run in a copy of the caller's context, so they
+                    # use the caller's state store.
+                    context = contextvars.copy_context()
+                    future = executor.submit(
+                        context.run, _deserialize, name, Loader, config
+                    )
+                futures[name] = future
+
+    loaded = dict()
+    for name in names:
+        if name not in futures:
+            loaded[name] = store.get(name, target_dir=config.dbt_target_dir)
+            continue
+
+        artifact = futures[name].result()
+        if artifact is None:  # The artifact's file doesn't exist
+            continue
+        if processes and profiled:
+            profiling.collect(artifact._load_stats)
+        bind_target_dir(artifact, config.dbt_target_dir)
+
+        # Another thread may have loaded the artifact in the meantime, in
+        # which case its artifact is kept.
+        loaded[name] = store.get_or_load(
+            name,
+            lambda: artifact,
+            fingerprint=fingerprints[name],
+            target_dir=config.dbt_target_dir,
+        )
+    return loaded
@@ -0,0 +1,266 @@
+"""
+artefacts.diff
+==============
+
+Compares two manifests to find the resources that were added, removed or
+modified, like dbt's :code:`state:new` and :code:`state:modified` selection
+methods, and the resources downstream of them.
+
+The manifests are compared in their raw JSON form, without building a model
+for each resource, so that a large project can be compared on every pull
+request. Resources are compared in the same way as dbt does:
+
+* :code:`body`: The checksum of the resource's file changed.
+* :code:`configs`: The resource's config changed. The database, schema and
+  alias are only compared before they are rendered, so that a development
+  manifest can be compared with a production one.
+* :code:`persisted_descriptions`: The description of the resource or its
+  columns changed, and the descriptions are persisted to the database.
+* :code:`macros`: A macro the resource depends on, directly or through other
+  macros, changed.
+* :code:`relation` and :code:`properties`: The table of a source, or the
+  properties of a source, exposure or metric, changed.
+
+>>> from artefacts.diff import diff_manifests
+>>> production = artefacts.Config().dbt_target_dir
+>>> diff = diff_manifests(production)
+>>> diff.new, diff.removed, diff.modified
+(set(), set(), {})
+
+"""
+
+import os
+import typing
+
+from .graph import Graph
+from .loaders import FileSystemLoader, json_decoder, open_artifact
+
+
+NODE_TYPES = ["nodes", "sources", "exposures", "metrics"]
+"""The sections of the manifest that are compared."""
+
+RELATION_CONFIG_KEYS = ("database", "schema", "alias")
+"""Config keys that are only compared before they are rendered."""
+
+SOURCE_RELATION_KEYS = ("database", "schema", "identifier")
+
+SOURCE_PROPERTY_KEYS = (
+    "quoting",
+    "freshness",
+    "loaded_at_field",
+    "loader",
+    "external",
+)
+
+IGNORED_KEYS = {
+    "created_at",
+    "root_path",
+    "original_file_path",
+    "path",
+    "patch_path",
+    "build_path",
+    "compiled_path",
+    "deferred",
+}
+"""Keys of exposures and metrics that don't change their contents."""
+
+
+class ManifestDiff(typing.NamedTuple):
+    new: typing.Set[str]
+    """The resources that are only in the new manifest."""
+
+    removed: typing.Set[str]
+    """The resources that are only in the old manifest."""
+
+    modified: typing.Dict[str, typing.List[str]]
+    """The resources that changed, with the reasons they changed."""
+
+    impacted: typing.Set[str]
+    """The resources downstream of new or modified resources, which are not
+    new or modified themselves."""
+
+    @property
+    def changed(self) -> typing.Set[str]:
+        """The new and modified resources, like :code:`state:modified`."""
+
+        return self.new | set(self.modified)
+
+    def modified_by(self, reason: str) -> typing.Set[str]:
+        """The resources that were modified for a reason, like
+        :code:`state:modified.body`."""
+
+        return {u for u, reasons in self.modified.items() if reason in reasons}
+
+
+def _raw_manifest(source, Loader, config, json_backend) -> dict:
+    if isinstance(source, dict):
+        return source
+    if source is None:
+        from .deserializers import ArtifactDeserializer
+
+        config = ArtifactDeserializer.get_or_set_config(config=config)
+        return Loader(config=config).load("manifest")
+    if os.path.isdir(source):
+        from .config import Config
+
+        directory = Config(
+            dbt_project_dir=source, dbt_target_dir=".", json_backend=json_backend
+        )
+        return Loader(config=directory).load("manifest")
+    with open_artifact(source) as fh:
+        return json_decoder(json_backend)(fh.read())
+
+
+def _graph(raw: dict) -> Graph:
+    if raw.get("parent_map") is not None:
+        return Graph(raw["parent_map"])
+    return Graph.from_child_map(raw.get("child_map") or dict())
+
+
+class _MacroComparison:
+    """Whether macros changed, including the macros they call."""
+
+    def __init__(self, old_macros: dict, new_macros: dict):
+        self.old_macros = old_macros
+        self.new_macros = new_macros
+        self._changed: typing.Dict[str, bool] = dict()
+
+    def changed(self, unique_id: str) -> bool:
+        if unique_id in self._changed:
+            return self._changed[unique_id]
+
+        # Recursive macros are assumed unchanged while they are compared
+        self._changed[unique_id] = False
+        old, new = self.old_macros.get(unique_id), self.new_macros.get(unique_id)
+        if old is None or new is None:
+            changed = old is not new
+        else:
+            changed = old.get("macro_sql") != new.get("macro_sql") or any(
+                self.changed(m) for m in _depends_on(new, "macros")
+            )
+        self._changed[unique_id] = changed
+        return changed
+
+
+def _depends_on(resource: dict, key: str) -> typing.List[str]:
+    return (resource.get("depends_on") or dict()).get(key) or []
+
+
+def _persisted_descriptions_changed(old: dict, new: dict) -> bool:
+    persist_docs = (new.get("config") or dict()).get("persist_docs") or dict()
+    if persist_docs.get("relation"):
+        if old.get("description") != new.get("description"):
+            return True
+    if persist_docs.get("columns"):
+        old_columns = old.get("columns") or dict()
+        new_columns = new.get("columns") or dict()
+        if set(old_columns) != set(new_columns):
+            return True
+        for name, column in new_columns.items():
+            if column.get("description") != old_columns[name].get("description"):
+                return True
+    return False
+
+
+def _configs_changed(old: dict, new: dict) -> bool:
+    old_unrendered = old.get("unrendered_config") or dict()
+    if old_unrendered != (new.get("unrendered_config") or dict()):
+        return True
+    old_config, new_config = old.get("config") or dict(), new.get("config") or dict()
+    for key in old_config.keys() | new_config.keys():
+        if key in RELATION_CONFIG_KEYS:
+            continue
+        if old_config.get(key) != new_config.get(key):
+            return True
+    return False
+
+
+def _compare_node(old: dict, new: dict, macros: _MacroComparison) -> typing.List[str]:
+    reasons = list()
+    if old.get("checksum") != new.get("checksum"):
+        reasons.append("body")
+    if _configs_changed(old, new):
+        reasons.append("configs")
+    if _persisted_descriptions_changed(old, new):
+        reasons.append("persisted_descriptions")
+    old_macros, new_macros = _depends_on(old, "macros"), _depends_on(new, "macros")
+    if old_macros != new_macros or any(macros.changed(m) for m in new_macros):
+        reasons.append("macros")
+    return reasons
+
+
+def _compare_source(old: dict, new: dict) -> typing.List[str]:
+    reasons = list()
+    if any(old.get(k) != new.get(k) for k in SOURCE_RELATION_KEYS):
+        reasons.append("relation")
+    if _configs_changed(old, new):
+        reasons.append("configs")
+    if any(old.get(k) != new.get(k) for k in SOURCE_PROPERTY_KEYS):
+        reasons.append("properties")
+    if _persisted_descriptions_changed(old, new):
+        reasons.append("persisted_descriptions")
+    return reasons
+
+
+def _compare_properties(old: dict, new: dict) -> typing.List[str]:
+    for key in old.keys() | new.keys():
+        if key not in IGNORED_KEYS and old.get(key) != new.get(key):
+            return ["properties"]
+    return []
+
+
+def diff_manifests(
+    old: typing.Union[str, dict],
+    new: typing.Union[str, dict] = None,
+    Loader=FileSystemLoader,
+    config=None,
+    json_backend: str = "auto",
+) -> ManifestDiff:
+    """Compare two manifests, like dbt's :code:`--state` comparison.
+
+    Args:
+        old: The manifest to compare with, usually from production. Either the
+             path of a manifest file, the path of the target directory that
+             contains it, or its decoded JSON.
+        new: The manifest to compare, in the same forms as `old`. Defaults to
+             the project's manifest.
+        Loader: The loader used to read the project's manifest.
+        config (Config): The config used to read the project's manifest.
+        json_backend (str): The JSON library used to decode manifest paths.
+    """
+
+    old_raw = _raw_manifest(old, Loader, config, json_backend)
+    new_raw = _raw_manifest(new, Loader, config, json_backend)
+    macros = _MacroComparison(
+        old_raw.get("macros") or dict(), new_raw.get("macros") or dict()
+    )
+
+    new_ids: typing.Set[str] = set()
+    removed: typing.Set[str] = set()
+    modified: typing.Dict[str, typing.List[str]] = dict()
+    for section in NODE_TYPES:
+        old_nodes = old_raw.get(section) or dict()
+        new_nodes = new_raw.get(section) or dict()
+        removed.update(u for u in old_nodes if u not in new_nodes)
+        for unique_id, node in new_nodes.items():
+            old_node = old_nodes.get(unique_id)
+            if old_node is None:
+                new_ids.add(unique_id)
+                continue
+            if section == "nodes":
+                reasons = _compare_node(old_node, node, macros)
+            elif section == "sources":
+                reasons = _compare_source(old_node, node)
+            else:
+                reasons = _compare_properties(old_node, node)
+            if reasons:
+                modified[unique_id] = reasons
+
+    graph = _graph(new_raw)
+    changed = [u for u in new_ids | set(modified) if u in graph]
+    impacted = set(graph.descendants_of(changed))
+    impacted -= new_ids
+    impacted -= set(modified)
+    return ManifestDiff(
+        new=new_ids, removed=removed, modified=modified, impacted=impacted
+    )
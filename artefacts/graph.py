@@ -0,0 +1,327 @@
+"""
+artefacts.graph
+===============
+
+A compact representation of the DAG described by a manifest's `parent_map`,
+for answering lineage questions without walking `ManifestNodeReference`
+objects one hop at a time.
+
+Each resource is assigned an integer, and the edges of the graph are stored in
+two arrays per direction, in the compressed sparse row format: the parents of
+resource `i` are `parent_indices[parent_offsets[i]:parent_offsets[i + 1]]`.
+
+>>> graph = artefacts.Manifest().graph
+>>> 'source.poffertjes_shop.raw.orders' in graph.ancestors(
+...     'model.poffertjes_shop.customers'
+... )
+True
+
+"""
+
+import typing
+from array import array
+from collections import deque
+
+if typing.TYPE_CHECKING:
+    from .models import ManifestModel
+
+
+class CycleError(ValueError):
+    """Raised when an operation requires the graph to be acyclic."""
+
+    def __init__(self, cycle: typing.List[str]):
+        self.cycle = cycle
+        super().__init__(f"Found a cycle in the graph: {' -> '.join(cycle)}")
+
+
+def _compress(adjacency: typing.List[typing.List[int]]):
+    offsets = array("i", [0])
+    indices = array("i")
+    for neighbours in adjacency:
+        indices.extend(neighbours)
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+class Graph:
+    """A directed acyclic graph of resources, with edges from parents to children.
+
+    Args:
+        parent_map: A mapping of each unique_id to the unique_ids of its parents.
+    """
+
+    def __init__(self, parent_map: typing.Mapping[str, typing.Iterable[str]]):
+        self._positions: typing.Dict[str, int] = dict()
+        self._ranks: typing.Optional[array] = None
+        self.unique_ids: typing.List[str] = list()
+        """The unique_ids of the resources in the graph, by position."""
+
+        parents: typing.List[typing.List[int]] = list()
+        for unique_id, parent_ids in parent_map.items():
+            position = self._add(unique_id, parents)
+            parents[position] = [self._add(p, parents) for p in parent_ids]
+
+        children: typing.List[typing.List[int]] = [[] for _ in parents]
+        for position, parent_positions in enumerate(parents):
+            for parent in parent_positions:
+                children[parent].append(position)
+
+        self.parent_offsets, self.parent_indices = _compress(parents)
+        self.child_offsets, self.child_indices = _compress(children)
+
+    def _add(self, unique_id, parents):
+        position = self._positions.get(unique_id)
+        if position is None:
+            position = self._positions[unique_id] = len(self.unique_ids)
+            self.unique_ids.append(unique_id)
+            parents.append([])
+        return position
+
+    @classmethod
+    def from_manifest(cls, manifest: "ManifestModel") -> "Graph":
+        """Build the graph from a manifest's `parent_map`, or from the inverse
+        of its `child_map` if the manifest has no `parent_map`."""
+
+        if manifest.parent_map is not None:
+            return cls(
+                {k: [r.unique_id for r in v] for k, v in manifest.parent_map.items()}
+            )
+
+        return cls.from_child_map(
+            {k: [r.unique_id for r in v] for k, v in (manifest.child_map or {}).items()}
+        )
+
+    @classmethod
+    def from_child_map(
+        cls, child_map: typing.Mapping[str, typing.Iterable[str]]
+    ) -> "Graph":
+        """Build the graph from a mapping of each unique_id to the unique_ids
+        of its children."""
+
+        parent_map: typing.Dict[str, typing.List[str]] = dict()
+        for unique_id, children in child_map.items():
+            parent_map.setdefault(unique_id, [])
+            for child in children:
+                parent_map.setdefault(child, []).append(unique_id)
+        return cls(parent_map)
+
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._positions
+
+    def position(self, unique_id: str) -> int:
+        """The integer position of a resource in the graph."""
+
+        try:
+            return self._positions[unique_id]
+        except KeyError:
+            raise KeyError(f"{unique_id} is not in the graph") from None
+
+    def parent_positions(self, position: int) -> typing.Sequence[int]:
+        """The positions of the direct parents of the resource at `position`,
+        for algorithms that walk the graph by position."""
+
+        start, end = self.parent_offsets[position], self.parent_offsets[position + 1]
+        return self.parent_indices[start:end]
+
+    def child_positions(self, position: int) -> typing.Sequence[int]:
+        """The positions of the direct children of the resource at `position`."""
+
+        start, end = self.child_offsets[position], self.child_offsets[position + 1]
+        return self.child_indices[start:end]
+
+    def parents(self, unique_id: str) -> typing.List[str]:
+        """The unique_ids of the resource's direct parents."""
+
+        return [
+            self.unique_ids[p] for p in self.parent_positions(self.position(unique_id))
+        ]
+
+    def children(self, unique_id: str) -> typing.List[str]:
+        """The unique_ids of the resource's direct children."""
+
+        return [
+            self.unique_ids[c] for c in self.child_positions(self.position(unique_id))
+        ]
+
+    def _traverse(self, neighbours, starts, depth):
+        seen = bytearray(len(self))
+        for start in starts:
+            seen[start] = 1
+
+        found = list()
+        frontier = list(starts)
+        level = 0
+        while frontier and (depth is None or level < depth):
+            level += 1
+            next_frontier = list()
+            for position in frontier:
+                for neighbour in neighbours(position):
+                    if not seen[neighbour]:
+                        seen[neighbour] = 1
+                        next_frontier.append(neighbour)
+            found.extend(next_frontier)
+            frontier = next_frontier
+        return found
+
+    def ancestors(self, unique_id: str, depth: int = None) -> typing.List[str]:
+        """The unique_ids of the resource's parents, their parents, and so on.
+
+        Args:
+            unique_id (str): The resource to start from.
+            depth (int): Only include resources up to this many edges away.
+                         Defaults to including all ancestors.
+        """
+
+        start = self.position(unique_id)
+        found = self._traverse(self.parent_positions, [start], depth)
+        return [self.unique_ids[p] for p in found]
+
+    def descendants(self, unique_id: str, depth: int = None) -> typing.List[str]:
+        """The unique_ids of the resource's children, their children, and so on.
+
+        Args:
+            unique_id (str): The resource to start from.
+            depth (int): Only include resources up to this many edges away.
+                         Defaults to including all descendants.
+        """
+
+        start = self.position(unique_id)
+        found = self._traverse(self.child_positions, [start], depth)
+        return [self.unique_ids[p] for p in found]
+
+    def ancestors_of(
+        self, unique_ids: typing.Iterable[str], depth: int = None
+    ) -> typing.List[str]:
+        """The combined ancestors of several resources, not including the
+        resources themselves."""
+
+        starts = [self.position(u) for u in unique_ids]
+        found = self._traverse(self.parent_positions, starts, depth)
+        return [self.unique_ids[p] for p in found]
+
+    def descendants_of(
+        self, unique_ids: typing.Iterable[str], depth: int = None
+    ) -> typing.List[str]:
+        """The combined descendants of several resources, not including the
+        resources themselves."""
+
+        starts = [self.position(u) for u in unique_ids]
+        found = self._traverse(self.child_positions, starts, depth)
+        return [self.unique_ids[p] for p in found]
+
+    def shortest_path(
+        self, source: str, target: str
+    ) -> typing.Optional[typing.List[str]]:
+        """The shortest chain of resources leading from `source` down to `target`,
+        including both ends, or `None` if `target` is not downstream of `source`.
+        """
+
+        start, end = self.position(source), self.position(target)
+        previous = array("i", [-1]) * len(self)
+        previous[start] = start
+        queue = deque([start])
+
+        while queue:
+            position = queue.popleft()
+            if position == end:
+                path = [end]
+                while path[-1] != start:
+                    path.append(previous[path[-1]])
+                return [self.unique_ids[p] for p in reversed(path)]
+
+            for child in self.child_positions(position):
+                if previous[child] == -1:
+                    previous[child] = position
+                    queue.append(child)
+
+        return None
+
+    def topological_ranks(self) -> typing.Sequence[int]:
+        """The rank of each resource in the topological order, by position.
+        Every resource has a higher rank than its parents.
+
+        Raises:
+            CycleError: If the graph contains a cycle.
+        """
+
+        if self._ranks is not None:
+            return self._ranks
+
+        in_degree = array("i", [0]) * len(self)
+        for position in range(len(self)):
+            in_degree[position] = len(self.parent_positions(position))
+
+        queue = deque(p for p in range(len(self)) if in_degree[p] == 0)
+        ranks = array("i", [-1]) * len(self)
+        rank = 0
+        while queue:
+            position = queue.popleft()
+            ranks[position] = rank
+            rank += 1
+            for child in self.child_positions(position):
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        if rank < len(self):
+            raise CycleError(self.find_cycle() or [])
+
+        self._ranks = ranks
+        return ranks
+
+    def topological_order(
+        self, unique_ids: typing.Iterable[str] = None
+    ) -> typing.List[str]:
+        """The unique_ids sorted so that every resource comes after its parents.
+
+        Args:
+            unique_ids: Only sort these resources. They are still ordered by
+                        the full graph, so a resource comes after its
+                        ancestors even when the resources between them are
+                        not included. Defaults to sorting the whole graph.
+
+        Raises:
+            CycleError: If the graph contains a cycle.
+        """
+
+        ranks = self.topological_ranks()
+        if unique_ids is None:
+            order = sorted(range(len(self)), key=ranks.__getitem__)
+        else:
+            order = sorted(
+                (self.position(u) for u in unique_ids), key=ranks.__getitem__
+            )
+        return [self.unique_ids[p] for p in order]
+
+    def find_cycle(self) -> typing.Optional[typing.List[str]]:
+        """Return the unique_ids forming a cycle in the graph, or `None` if the
+        graph is acyclic. The first resource is repeated at the end of the list.
+        """
+
+        # 0: unvisited, 1: on the current path, 2: finished
+        state = bytearray(len(self))
+        for root in range(len(self)):
+            if state[root]:
+                continue
+
+            path = [root]
+            iterators = [iter(self.child_positions(root))]
+            state[root] = 1
+            while iterators:
+                child = next(iterators[-1], None)
+                if child is None:
+                    state[path.pop()] = 2
+                    iterators.pop()
+                elif state[child] == 1:
+                    start = path.index(child)
+                    cycle = path[start:] + [child]
+                    return [self.unique_ids[p] for p in cycle]
+                elif state[child] == 0:
+                    state[child] = 1
+                    path.append(child)
+                    iterators.append(iter(self.child_positions(child)))
+
+        return None
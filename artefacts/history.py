@@ -0,0 +1,410 @@
+"""
+artefacts.history
+=================
+
+A local store of the results of many dbt invocations, for analysing how the
+runtimes and failures of nodes change over time.
+
+Run results are ingested from archived run_results.json files into a SQLite
+database, which is indexed by node and by time. Ingesting reads only the
+fields it stores from each file, without validating the whole artifact, and
+invocations that were already ingested are skipped, so a directory of
+archives can be ingested again after each run.
+
+>>> from artefacts.history import RunHistory
+>>> history = RunHistory()
+>>> run_results = artefacts.RunResults()
+>>> ingested = history.ingest([artefacts.Config().dbt_target_dir + '/run_results.json'])
+>>> ingested == [str(run_results.metadata.invocation_id)]
+True
+>>> rate = history.failure_rates([run_results.results[0].unique_id])[0]
+>>> rate.runs
+1
+
+"""
+
+import concurrent.futures
+import datetime
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import typing
+
+from .loaders import COMPRESSION_SUFFIXES, json_decoder, open_artifact
+
+
+FAILED_STATUSES = ("error", "fail", "runtime error")
+"""The statuses of results that count as failures."""
+
+PERIODS = {
+    "hour": "substr(generated_at, 1, 13)",
+    "day": "substr(generated_at, 1, 10)",
+    "week": "strftime('%Y-W%W', substr(generated_at, 1, 10))",
+    "month": "substr(generated_at, 1, 7)",
+}
+
+SCHEMA = """
+create table if not exists invocations (
+    invocation_id text primary key,
+    generated_at text not null,
+    dbt_version text,
+    elapsed_time real,
+    path text
+);
+
+create table if not exists results (
+    invocation_id text not null references invocations (invocation_id),
+    generated_at text not null,
+    unique_id text not null,
+    status text,
+    execution_time real,
+    thread_id text,
+    started_at text,
+    completed_at text,
+    failures integer,
+    message text
+);
+
+create index if not exists results_by_node on results (unique_id, generated_at);
+create index if not exists results_by_time on results (generated_at);
+create index if not exists results_by_invocation on results (invocation_id);
+"""
+
+INVOCATION_ID_PATTERN = re.compile(rb'"invocation_id"\s*:\s*"([^"]+)"')
+
+
+class Invocation(typing.NamedTuple):
+    invocation_id: str
+    generated_at: str
+    dbt_version: typing.Optional[str]
+    elapsed_time: typing.Optional[float]
+    path: typing.Optional[str]
+
+
+class NodeRun(typing.NamedTuple):
+    invocation_id: str
+    generated_at: str
+    unique_id: str
+    status: str
+    execution_time: float
+    thread_id: str
+    started_at: typing.Optional[str]
+    completed_at: typing.Optional[str]
+    failures: typing.Optional[int]
+    message: typing.Optional[str]
+
+
+class FailureRate(typing.NamedTuple):
+    unique_id: str
+    period: typing.Optional[str]
+    runs: int
+    failures: int
+    rate: float
+
+
+def _peek_invocation_id(path: str) -> typing.Optional[str]:
+    # dbt writes the metadata first, so the invocation_id is near the start
+    with open_artifact(path) as fh:
+        match = INVOCATION_ID_PATTERN.search(fh.read(4096))
+    return match.group(1).decode() if match else None
+
+
+def _read_run_results(path: str, json_backend: str = "auto"):
+    """Read the rows to ingest from a run_results file. Runs in the worker
+    processes of :meth:`RunHistory.ingest`."""
+
+    with open_artifact(path) as fh:
+        data = fh.read()
+    raw = json_decoder(json_backend)(data)
+
+    metadata = raw.get("metadata") or dict()
+    invocation_id = metadata.get("invocation_id")
+    if not invocation_id:  # Older artifacts are identified by their contents
+        invocation_id = hashlib.sha256(data).hexdigest()
+    generated_at = metadata.get("generated_at")
+
+    invocation = Invocation(
+        invocation_id=invocation_id,
+        generated_at=generated_at,
+        dbt_version=metadata.get("dbt_version"),
+        elapsed_time=raw.get("elapsed_time"),
+        path=os.path.abspath(path),
+    )
+
+    results = list()
+    for result in raw.get("results") or []:
+        timing = {t.get("name"): t for t in result.get("timing") or []}
+        execute = timing.get("execute") or dict()
+        results.append(
+            NodeRun(
+                invocation_id=invocation_id,
+                generated_at=generated_at,
+                unique_id=result["unique_id"],
+                status=result.get("status"),
+                execution_time=result.get("execution_time"),
+                thread_id=result.get("thread_id"),
+                started_at=execute.get("started_at"),
+                completed_at=execute.get("completed_at"),
+                failures=result.get("failures"),
+                message=result.get("message"),
+            )
+        )
+    return invocation, results
+
+
+def _percentile(values: typing.Sequence[float], percentile: float) -> float:
+    # Linear interpolation between the closest ranks, as numpy does by default
+    position = (len(values) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _timestamp(value) -> str:
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+class RunHistory:
+    """A SQLite database of the results of dbt invocations.
+
+    Args:
+        path (str): The path of the database file, which is created if it
+                    doesn't exist. Defaults to an in-memory database.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        if path != ":memory:":
+            self.connection.execute("pragma journal_mode = wal")
+            self.connection.execute("pragma synchronous = normal")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        """Close the connection to the database."""
+
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def find_run_results(directory: str) -> typing.List[str]:
+        """The paths of all run_results files in a directory and its
+        subdirectories, including compressed files."""
+
+        suffixes = (".json",) + tuple(
+            ".json" + suffix for suffix in COMPRESSION_SUFFIXES.values()
+        )
+        pattern = os.path.join(glob.escape(directory), "**", "*run_results*")
+        return sorted(
+            path
+            for path in glob.glob(pattern, recursive=True)
+            if path.endswith(suffixes) and os.path.isfile(path)
+        )
+
+    def ingested(self, invocation_id: str) -> bool:
+        """Whether the results of an invocation have been ingested."""
+
+        row = self.connection.execute(
+            "select 1 from invocations where invocation_id = ?", (invocation_id,)
+        ).fetchone()
+        return row is not None
+
+    def ingest(
+        self,
+        paths: typing.Union[str, typing.Iterable[str]],
+        processes: bool = None,
+        max_workers: int = None,
+        json_backend: str = "auto",
+    ) -> typing.List[str]:
+        """Ingest run_results files, and return the ingested invocation_ids.
+
+        Files are read in a pool of processes. Files whose invocation has
+        already been ingested are skipped without being read completely.
+
+        Args:
+            paths: A directory to search for run_results files, or a list of
+                   their paths.
+            processes (bool): Read the files in a process pool. Defaults to
+                              using processes when more than one CPU is
+                              available.
+            max_workers (int): The size of the process pool.
+            json_backend (str): The JSON library used to decode the files.
+        """
+
+        if isinstance(paths, str) and os.path.isdir(paths):
+            paths = self.find_run_results(paths)
+        elif isinstance(paths, str):
+            paths = [paths]
+
+        to_read = list()
+        for path in paths:
+            invocation_id = _peek_invocation_id(path)
+            if invocation_id is None or not self.ingested(invocation_id):
+                to_read.append(path)
+
+        if processes is None:
+            processes = (os.cpu_count() or 1) > 1 and len(to_read) > 1
+
+        backends = [json_backend] * len(to_read)
+        if processes:
+            max_workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(to_read) // (8 * max_workers))
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+                rows = list(
+                    executor.map(
+                        _read_run_results, to_read, backends, chunksize=chunksize
+                    )
+                )
+        else:
+            rows = list(map(_read_run_results, to_read, backends))
+
+        ingested = list()
+        with self.connection:
+            for invocation, results in rows:
+                cursor = self.connection.execute(
+                    "insert or ignore into invocations values (?, ?, ?, ?, ?)",
+                    invocation,
+                )
+                if cursor.rowcount == 0:  # The same invocation in another file
+                    continue
+                self.connection.executemany(
+                    "insert into results values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    results,
+                )
+                ingested.append(invocation.invocation_id)
+        return ingested
+
+    def invocations(self) -> typing.List[Invocation]:
+        """All ingested invocations, from oldest to newest."""
+
+        rows = self.connection.execute(
+            "select * from invocations order by generated_at"
+        )
+        return [Invocation(*row) for row in rows]
+
+    def _filters(self, unique_ids, since, until, statuses=None, clauses=()):
+        clauses, parameters = list(clauses), list()
+        if unique_ids is not None:
+            unique_ids = list(unique_ids)
+            clauses.append(f"unique_id in ({', '.join('?' for _ in unique_ids)})")
+            parameters.extend(unique_ids)
+        if since is not None:
+            clauses.append("generated_at >= ?")
+            parameters.append(_timestamp(since))
+        if until is not None:
+            clauses.append("generated_at < ?")
+            parameters.append(_timestamp(until))
+        if statuses is not None:
+            statuses = list(statuses)
+            clauses.append(f"status in ({', '.join('?' for _ in statuses)})")
+            parameters.extend(statuses)
+        where = f"where {' and '.join(clauses)}" if clauses else ""
+        return where, parameters
+
+    def runs(self, unique_id: str, since=None, until=None) -> typing.List[NodeRun]:
+        """The results of a node in every ingested invocation, from oldest to
+        newest."""
+
+        where, parameters = self._filters([unique_id], since, until)
+        rows = self.connection.execute(
+            f"select * from results {where} order by generated_at", parameters
+        )
+        return [NodeRun(*row) for row in rows]
+
+    def execution_time_percentiles(
+        self,
+        unique_ids: typing.Iterable[str] = None,
+        percentiles: typing.Sequence[float] = (50, 90, 99),
+        since=None,
+        until=None,
+        statuses: typing.Iterable[str] = None,
+    ) -> typing.Dict[str, typing.Dict[float, float]]:
+        """Percentiles of the execution_time of each node.
+
+        Args:
+            unique_ids: Only include these nodes. Defaults to all nodes.
+            percentiles: The percentiles to calculate, between 0 and 100.
+            since: Only include invocations generated at or after this time.
+            until: Only include invocations generated before this time.
+            statuses: Only include results with these statuses, for example
+                      :code:`['success']`. Defaults to all results.
+
+        Returns:
+            A dictionary of the percentiles of each node, keyed by unique_id.
+        """
+
+        where, parameters = self._filters(
+            unique_ids, since, until, statuses, ["execution_time is not null"]
+        )
+        rows = self.connection.execute(
+            f"""
+            select unique_id, execution_time from results {where}
+            order by unique_id, execution_time
+            """,
+            parameters,
+        )
+
+        times: typing.Dict[str, typing.List[float]] = dict()
+        for unique_id, execution_time in rows:
+            times.setdefault(unique_id, []).append(execution_time)
+
+        return {
+            unique_id: {p: _percentile(values, p) for p in percentiles}
+            for unique_id, values in times.items()
+        }
+
+    def failure_rates(
+        self,
+        unique_ids: typing.Iterable[str] = None,
+        period: str = None,
+        since=None,
+        until=None,
+    ) -> typing.List[FailureRate]:
+        """The share of each node's runs that failed, overall or per period.
+
+        Args:
+            unique_ids: Only include these nodes. Defaults to all nodes.
+            period (str): Group the runs by :code:`hour`, :code:`day`,
+                          :code:`week` or :code:`month`. Defaults to one
+                          group for all runs.
+            since: Only include invocations generated at or after this time.
+            until: Only include invocations generated before this time.
+        """
+
+        if period is not None and period not in PERIODS:
+            raise ValueError(
+                f"Invalid period {period!r}, expected one of: {', '.join(PERIODS)}"
+            )
+
+        where, parameters = self._filters(unique_ids, since, until)
+        failed = ", ".join("?" for _ in FAILED_STATUSES)
+        rows = self.connection.execute(
+            f"""
+            select
+                unique_id,
+                {PERIODS[period] if period else 'null'} as period,
+                count(*) as runs,
+                sum(status in ({failed})) as failures
+            from results {where}
+            group by unique_id, period
+            order by unique_id, period
+            """,
+            [*FAILED_STATUSES, *parameters],
+        )
+        return [
+            FailureRate(unique_id, period, runs, failures, failures / runs)
+            for unique_id, period, runs, failures in rows
+        ]
@@ -0,0 +1,201 @@
+"""
+artefacts.indexes
+=================
+
+Lookup tables that are built once per loaded artifact, so that finding a
+resource doesn't require scanning or merging the artifact's collections.
+
+"""
+
+import typing
+from collections import defaultdict
+
+if typing.TYPE_CHECKING:
+    from .models import ManifestModel
+
+
+class ManifestIndex:
+    """An index of the resources in a manifest.
+
+    The index only stores unique_ids, and looks up the resources themselves in
+    the manifest's collections when they are requested. This keeps the index
+    cheap to build, and keeps resources unparsed when the manifest was loaded
+    with :code:`lazy_load` enabled.
+
+    The resource_type and package_name of a resource are read from its
+    unique_id, which dbt formats as :code:`<resource_type>.<package_name>...`,
+    and the tags of resources that haven't been parsed yet are read from their
+    raw dictionaries.
+
+    >>> index = artefacts.Manifest().index
+    >>> index['model.poffertjes_shop.customers'].name
+    'customers'
+    >>> 'model.poffertjes_shop.base_employees' in index.disabled
+    True
+
+    """
+
+    def __init__(self, manifest: "ManifestModel"):
+        self._manifest = manifest
+        self._sections: typing.Dict[str, typing.Mapping] = dict()
+        self._disabled_resources: typing.Optional[dict] = None
+        self._resources: typing.Optional[dict] = None
+        self._by_tag: typing.Optional[typing.Dict[str, typing.List[str]]] = None
+
+        self.disabled: typing.Set[str] = set(manifest.raw_disabled)
+        """The unique_ids of all disabled resources."""
+
+        self.by_resource_type: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        """The unique_ids of all resources, keyed by their resource_type."""
+
+        self.by_package_name: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        """The unique_ids of all resources, keyed by their package_name."""
+
+        self.by_resource_type_and_package_name: typing.Dict[
+            typing.Tuple[str, str], typing.List[str]
+        ] = defaultdict(list)
+        """The unique_ids of all resources, keyed by (resource_type, package_name)."""
+
+        for section in (
+            manifest.nodes,
+            manifest.sources,
+            manifest.macros,
+            manifest.exposures,
+            manifest.metrics,
+        ):
+            for unique_id in section:
+                self._sections[unique_id] = section
+
+        # Disabled resources take precedence when a unique_id is duplicated,
+        # consistent with the order used by `ManifestModel.resources`.
+        unique_ids = dict.fromkeys(self._sections)
+        unique_ids.update(dict.fromkeys(self.disabled))
+        self.unique_ids: typing.List[str] = list(unique_ids)
+        """The unique_ids of all resources, in the order of the manifest."""
+
+        for unique_id in self.unique_ids:
+            resource_type, package_name = unique_id.split(".")[:2]
+            self.by_resource_type[resource_type].append(unique_id)
+            self.by_package_name[package_name].append(unique_id)
+            self.by_resource_type_and_package_name[
+                (resource_type, package_name)
+            ].append(unique_id)
+
+    def __getitem__(self, unique_id: str):
+        if unique_id in self.disabled:
+            return self._manifest.raw_disabled[unique_id][0]
+        return self._sections[unique_id][unique_id]
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._sections or unique_id in self.disabled
+
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+    def get(self, unique_id: str, default=None):
+        """Return the resource with the given unique_id, or `default`."""
+
+        if unique_id in self:
+            return self[unique_id]
+        return default
+
+    def iter_unique_ids(
+        self,
+        resource_type: str = None,
+        package_name: str = None,
+        include_disabled: bool = True,
+    ) -> typing.Iterator[str]:
+        """Iterate over the unique_ids matching a resource_type and/or package_name."""
+
+        if resource_type and package_name:
+            key = (resource_type, package_name)
+            unique_ids = self.by_resource_type_and_package_name.get(key, [])
+        elif resource_type:
+            unique_ids = self.by_resource_type.get(resource_type, [])
+        elif package_name:
+            unique_ids = self.by_package_name.get(package_name, [])
+        else:
+            unique_ids = self.unique_ids
+
+        for unique_id in unique_ids:
+            if include_disabled or unique_id not in self.disabled:
+                yield unique_id
+
+    def get_value(self, unique_id: str, name: str, default=None):
+        """The value of a field of the resource with the given unique_id.
+
+        The value is read from the resource's raw dictionary when it hasn't
+        been parsed yet, which keeps the resource unparsed. Only fields whose
+        name is the same in the artifact, like :code:`fqn` or :code:`config`,
+        can be read this way.
+        """
+
+        from .models import LazyMapping
+
+        section = self._sections.get(unique_id)
+        if unique_id not in self.disabled and isinstance(section, LazyMapping):
+            raw = section.get_raw(unique_id)
+            if raw is not None:
+                return raw.get(name, default)
+        return getattr(self[unique_id], name, default)
+
+    @property
+    def by_tag(self) -> typing.Dict[str, typing.List[str]]:
+        """The unique_ids of all resources, keyed by their tags, built the
+        first time it is accessed."""
+
+        if self._by_tag is None:
+            by_tag: typing.Dict[str, typing.List[str]] = defaultdict(list)
+            for unique_id in self.unique_ids:
+                for tag in self.get_value(unique_id, "tags") or []:
+                    by_tag[tag].append(unique_id)
+            self._by_tag = dict(by_tag)
+        return self._by_tag
+
+    @property
+    def resources(self) -> dict:
+        """A dictionary of all resources, built the first time it is accessed."""
+
+        if self._resources is None:
+            self._resources = {u: self[u] for u in self.unique_ids}
+        return self._resources
+
+    @property
+    def disabled_resources(self) -> dict:
+        """A dictionary of all disabled resources."""
+
+        if self._disabled_resources is None:
+            self._disabled_resources = {
+                k: v[0] for k, v in self._manifest.raw_disabled.items()
+            }
+        return self._disabled_resources
+
+
+class ResultsIndex:
+    """An index of the results in a run_results or sources artifact, keyed by
+    the unique_id of the node they belong to.
+
+    >>> index = artefacts.RunResults().index
+    >>> result = index.get('model.poffertjes_shop.customers')[0]
+    >>> result.unique_id
+    'model.poffertjes_shop.customers'
+
+    """
+
+    def __init__(self, results: typing.Iterable):
+        self.by_unique_id: typing.Dict[str, list] = defaultdict(list)
+        """The results of each node, keyed by the node's unique_id."""
+
+        for result in results:
+            self.by_unique_id[result.unique_id].append(result)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self.by_unique_id
+
+    def __len__(self) -> int:
+        return len(self.by_unique_id)
+
+    def get(self, unique_id: str) -> list:
+        """A list of the results for the node, which is empty if there are none."""
+
+        return list(self.by_unique_id.get(unique_id, []))
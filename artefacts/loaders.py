@@ -1,18 +1,403 @@
+import functools
+import gzip
+import importlib
+import io
 import json
+import logging
+import mmap
 import os
+import re
+import shutil
+import tempfile
+import typing
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+from pydantic.fields import MAPPING_LIKE_SHAPES, SHAPE_LIST
+
+from . import profiling
 from .config import Config
 
 
+logger = logging.getLogger(__name__)
+
+# The JSON libraries that can decode artifacts, in order of preference. Each
+# one's `loads` function accepts the bytes of an artifact.
+JSON_BACKENDS = ["orjson", "simdjson", "ujson", "json"]
+
+
+@functools.lru_cache(maxsize=None)
+def json_decoder(backend: str = "auto") -> typing.Callable[[bytes], typing.Any]:
+    """Returns the `loads` function of a JSON library.
+
+    Args:
+        backend (str): One of the :code:`JSON_BACKENDS`, or :code:`auto` to use
+                       the fastest library that is installed. A library that
+                       is not installed falls back to the stdlib's json.
+
+    >>> from artefacts.loaders import json_decoder
+    >>> json_decoder('json')(b'{"a": 1}')
+    {'a': 1}
+
+    """
+
+    if backend != "auto" and backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Invalid json_backend {backend!r}, expected one of: "
+            f"auto, {', '.join(JSON_BACKENDS)}"
+        )
+
+    for name in JSON_BACKENDS if backend == "auto" else [backend]:
+        try:
+            return importlib.import_module(name).loads
+        except ImportError:
+            continue
+
+    logger.warning(f"The {backend} library is not installed, falling back to json")
+    return json.loads
+
+
+# The suffixes of compressed artifacts, in the order they are searched for
+# when an artifact's uncompressed file doesn't exist.
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError(
+            "The zstandard package is required for zstd compressed artifacts. "
+            "Install it with `pip install zstandard`."
+        )
+
+
+def open_artifact(path: str) -> typing.BinaryIO:
+    """Open an artifact's file for reading bytes, decompressing it while it is
+    read if its name ends with a compression suffix.
+
+    >>> from artefacts.loaders import open_artifact
+    >>> path = artefacts.Config().dbt_target_dir + '/manifest.json'
+    >>> with open_artifact(path) as fh:
+    ...     fh.read(1)
+    b'{'
+
+    """
+
+    if path.endswith(COMPRESSION_SUFFIXES["gzip"]):
+        return gzip.open(path, "rb")
+    if path.endswith(COMPRESSION_SUFFIXES["zstd"]):
+        _require_zstandard()
+        return zstandard.open(path, "rb")
+    return open(path, "rb")
+
+
+def compress_artifact(path: str, compression: str = "gzip", remove: bool = False):
+    """Write a compressed copy of an artifact next to it, and return its path.
+
+    Args:
+        path (str): The path of the artifact, e.g. :code:`target/manifest.json`.
+        compression (str): Either :code:`gzip` or :code:`zstd`. Writing zstd
+                           requires the optional zstandard package.
+        remove (bool): Remove the uncompressed file once it is compressed.
+    """
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Invalid compression {compression!r}, expected one of: "
+            f"{', '.join(COMPRESSION_SUFFIXES)}"
+        )
+
+    compressed_path = path + COMPRESSION_SUFFIXES[compression]
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, open(path, "rb") as source:
+            if compression == "gzip":
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as fh:
+                    shutil.copyfileobj(source, fh, length=2**20)
+            else:
+                _require_zstandard()
+                compressor = zstandard.ZstdCompressor(level=3)
+                compressor.copy_stream(source, raw)
+        os.replace(tmp_path, compressed_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    if remove:
+        os.remove(path)
+    return compressed_path
+
+
+def compress_artifacts(
+    target_dir: str, compression: str = "gzip", remove: bool = False
+) -> typing.List[str]:
+    """Compress every artifact in a target directory, for archiving a run.
+    Returns the paths of the compressed artifacts."""
+
+    compressed = list()
+    for name in ["manifest", "run_results", "catalog", "sources"]:
+        path = os.path.join(target_dir, f"{name}.json")
+        if os.path.exists(path):
+            compressed.append(compress_artifact(path, compression, remove=remove))
+    return compressed
+
+
 class FileSystemLoader:
-    def __init__(self, config=Config()):
+    def __init__(self, config=None):
+        config = Config() if config is None else config
         self.config = config
+        self.json_loads = json_decoder(config.json_backend)
+
+    def artifact_path(self, artifact_name):
+        """The path of the artifact's file. If the uncompressed file doesn't
+        exist, a compressed file like `manifest.json.gz` is used instead."""
+
+        if artifact_name.endswith(tuple(COMPRESSION_SUFFIXES.values())):
+            return os.path.join(self.config.dbt_target_dir, artifact_name)
 
-    def load(self, artifact_name):
         if not artifact_name.endswith(".json"):
             artifact_name += ".json"
 
-        artifact_fp = os.path.join(self.config.dbt_target_dir, artifact_name)
+        path = os.path.join(self.config.dbt_target_dir, artifact_name)
+        if not os.path.exists(path):
+            for suffix in COMPRESSION_SUFFIXES.values():
+                if os.path.exists(path + suffix):
+                    return path + suffix
+        return path
+
+    def fingerprint(self, artifact_name):
+        """Identifies the current version of the artifact's file, so a cached
+        artifact can be reloaded when the file changes. Returns `None` if the
+        file does not exist."""
+
+        path = self.artifact_path(artifact_name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def load(self, artifact_name):
+        with open_artifact(self.artifact_path(artifact_name)) as fh:
+            return self.decode(fh.read())
+
+    def decode(self, data):
+        """Decode the JSON document in `data` with the configured backend."""
+
+        with profiling.phase("decode"):
+            try:
+                return self.json_loads(data)
+            except ValueError:
+                # The faster libraries are stricter than the stdlib, which also
+                # accepts values like NaN that Python's json module writes.
+                if self.json_loads is json.loads:
+                    raise
+                return json.loads(bytes(data))
+
+
+class MmapFileSystemLoader(FileSystemLoader):
+    """Loads artifacts by memory-mapping their files.
+
+    The decoder reads the document directly from the operating system's page
+    cache, instead of from a copy of the file held in Python's memory, which
+    lowers the peak memory of loading large artifacts. This requires a
+    :code:`json_backend` that accepts buffers, like orjson. Other backends
+    receive a copy of the file, as with the :code:`FileSystemLoader`, and so
+    are compressed artifacts, which can't be mapped.
+
+    >>> from artefacts.loaders import MmapFileSystemLoader
+    >>> manifest = artefacts.Manifest.deserialize(Loader=MmapFileSystemLoader)
+    >>> type(manifest)
+    <class 'artefacts.models.ManifestModel'>
+
+    """
+
+    def load(self, artifact_name):
+        path = self.artifact_path(artifact_name)
+        if path.endswith(tuple(COMPRESSION_SUFFIXES.values())):
+            return super().load(artifact_name)  # Compressed files can't be mapped
+
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:  # Empty files can't be mapped
+                return self.decode(b"")
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    try:
+                        return self.decode(view)
+                    except TypeError:  # The backend only accepts str or bytes
+                        pass
+                return self.decode(mapped[:])
+
+
+class StreamingFileSystemLoader(FileSystemLoader):
+    """Loads artifacts by decoding and validating them one entry at a time.
+
+    The large sections of an artifact, like the manifest's `nodes` or `macros`,
+    are read from the file entry by entry. Each entry is validated into its
+    model as soon as it is decoded, so the raw dictionary of the full artifact
+    is never held in memory alongside the parsed models.
+
+    >>> from artefacts.loaders import StreamingFileSystemLoader
+    >>> manifest = artefacts.Manifest.deserialize(Loader=StreamingFileSystemLoader)
+    >>> type(manifest)
+    <class 'artefacts.models.ManifestModel'>
+
+    """
+
+    chunk_size = 2**20
+
+    def load_model(self, artifact_name, model):
+        values = dict()
+        errors = list()
+        fields = {f.alias: f for f in model.__fields__.values()}
+
+        path = self.artifact_path(artifact_name)
+        with io.TextIOWrapper(open_artifact(path), encoding="utf-8") as fh:
+            stream = JSONStream(fh, chunk_size=self.chunk_size)
+
+            for key in stream.iter_object():
+                field = fields.get(key)
+                if field is None:
+                    stream.decode_value()
+                elif field.shape in MAPPING_LIKE_SHAPES and stream.peek() == "{":
+                    values[field.name] = {
+                        k: model._validate_item(field, k, stream.decode_value(), errors)
+                        for k in stream.iter_object()
+                    }
+                elif field.shape == SHAPE_LIST and stream.peek() == "[":
+                    values[field.name] = [
+                        model._validate_item(field, i, v, errors)
+                        for i, v in enumerate(stream.iter_array())
+                    ]
+                else:
+                    value = stream.decode_value()
+                    values[field.name] = model._validate_field(
+                        field, value, values, errors
+                    )
+
+        return model._construct_validated(values, errors)
+
+
+class JSONStream:
+    """An incremental reader for a JSON document stored in a file.
+
+    The file is read in chunks of `chunk_size` characters, and only the
+    containers that the caller iterates over are decoded lazily. Every other
+    value is decoded in full with the standard library's decoder.
+
+    >>> import io
+    >>> stream = JSONStream(io.StringIO('{"a": [1, 2], "b": {"c": 3}}'), 4)
+    >>> [(k, stream.decode_value()) for k in stream.iter_object()]
+    [('a', [1, 2]), ('b', {'c': 3})]
+
+    """
+
+    _whitespace = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, fh, chunk_size=2**20):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read(self, size):
+        # Drop the part of the buffer that has already been consumed
+        if self.pos >= self.chunk_size:
+            consumed, self.pos = self.pos, 0
+            self.buffer = self.buffer[consumed:]
+
+        chunk = self.fh.read(size)
+        if not chunk:
+            self.eof = True
+        self.buffer += chunk
+        return bool(chunk)
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Skip any whitespace and return the next character in the document."""
+
+        while True:
+            self.pos = self._whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read(self.chunk_size):
+                raise self._error("Unexpected end of document")
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def decode_value(self):
+        """Decode the next value in the document."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # Grow the buffer geometrically so that decoding a value
+                # larger than `chunk_size` stays linear in its size.
+                self._read(max(self.chunk_size, len(self.buffer) - self.pos))
+                continue
+
+            # A number at the very end of the buffer might be truncated.
+            if end == len(self.buffer) and not self.eof:
+                self._read(self.chunk_size)
+                continue
+
+            self.pos = end
+            return value
+
+    def _delimiter(self, closing: str) -> bool:
+        char = self.peek()
+        self.pos += 1
+        if char == closing:
+            return True
+        elif char != ",":
+            raise self._error("Expecting ',' delimiter")
+        return False
+
+    def iter_object(self):
+        """Iterate over the keys of the next object in the document.
+
+        The caller is responsible for consuming each key's value, for example
+        with :meth:`decode_value`, before requesting the next key.
+        """
+
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self.expect(":")
+            yield key
+            if self._delimiter("}"):
+                return
+
+    def iter_array(self):
+        """Iterate over the decoded values of the next array in the document."""
+
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
 
-        with open(artifact_fp, "r") as fh:
-            return json.load(fh)
+        while True:
+            yield self.decode_value()
+            if self._delimiter("]"):
+                return
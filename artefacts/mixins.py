@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Optional
 
 
 if TYPE_CHECKING:
@@ -6,6 +7,13 @@ if TYPE_CHECKING:
 
 
 class ArtifactReader:
+    __slots__ = ()
+
+    _target_dir: Optional[str] = None
+    """The target directory of the artifact the reader was loaded from, if it
+    was loaded into the state store. Readers read the other artifacts of the
+    same dbt project."""
+
     @property
     def run_results_artifact(self) -> "RunResultsModel":
         """A reference to the :class:`RunResults` artifact."""
@@ -33,28 +41,29 @@ class ArtifactReader:
     def get_artifact(self, artifact_name):
         import artefacts.deserializers
 
-        if artefacts.state.exists(artifact_name):
-            return artefacts.state.get(artifact_name)
+        target_dir = getattr(self, "_target_dir", None)
+        artifact = artefacts.state.get(artifact_name, target_dir=target_dir)
+        if artifact is not None:
+            return artifact
         else:
-            Artifact = {
-                "manifest": artefacts.deserializers.Manifest,
-                "run_results": artefacts.deserializers.RunResults,
-                "sources": artefacts.deserializers.Sources,
-                "catalog": artefacts.deserializers.Catalog,
-            }.get(artifact_name)
+            Artifact = artefacts.deserializers.ARTIFACT_DESERIALIZERS.get(artifact_name)
 
             if Artifact is None:
                 raise AttributeError(f"Invalid artifact name: {artifact_name}")
 
-            return Artifact()
+            if target_dir is None:
+                return Artifact()
+            return Artifact(config=Artifact.config_for_target_dir(target_dir))
 
 
 class ArtifactNodeReader(ArtifactReader):
+    __slots__ = ()
+
     @property
     def manifest(self):
         """A reference to details about the node contained in the manifest."""
 
-        return self.manifest_artifact.resources.get(self.unique_id)
+        return self.manifest_artifact.index.get(self.unique_id)
 
     @property
     def catalog(self):
@@ -66,19 +75,13 @@ class ArtifactNodeReader(ArtifactReader):
     def run_results(self):
         """A reference to results from running the node, if it exists."""
 
-        return [
-            r
-            for r in self.run_results_artifact.results
-            if r.unique_id == self.unique_id
-        ]
+        return self.run_results_artifact.index.get(self.unique_id)
 
     @property
     def freshness_check_results(self):
         """A reference to any freshness check result of the node, if it exists."""
 
-        return [
-            r for r in self.sources_artifact.results if r.unique_id == self.unique_id
-        ]
+        return self.sources_artifact.index.get(self.unique_id)
 
     @property
     def parents(self):
@@ -92,6 +95,38 @@ class ArtifactNodeReader(ArtifactReader):
 
         return self.manifest_artifact.child_map[self.unique_id]
 
+    def ancestors(self, depth: int = None):
+        """A list of the node's parents, their parents, and so on.
+
+        Args:
+            depth (int): Only include nodes up to this many levels upstream.
+                         Defaults to including all ancestors.
+        """
+
+        from artefacts.models import ManifestNodeReference
+
+        graph = self.manifest_artifact.graph
+        return [
+            ManifestNodeReference(u, target_dir=getattr(self, "_target_dir", None))
+            for u in graph.ancestors(self.unique_id, depth)
+        ]
+
+    def descendants(self, depth: int = None):
+        """A list of the node's children, their children, and so on.
+
+        Args:
+            depth (int): Only include nodes up to this many levels downstream.
+                         Defaults to including all descendants.
+        """
+
+        from artefacts.models import ManifestNodeReference
+
+        graph = self.manifest_artifact.graph
+        return [
+            ManifestNodeReference(u, target_dir=getattr(self, "_target_dir", None))
+            for u in graph.descendants(self.unique_id, depth)
+        ]
+
     @property
     def tests(self):
         """A list of any tests that reference the node"""
@@ -107,4 +142,39 @@ class ArtifactNodeReader(ArtifactReader):
     @property
     def disabled(self):
         """Whether the resource has been disabled"""
-        return self.unique_id in self.manifest_artifact.disabled
+        return self.unique_id in self.manifest_artifact.index.disabled
+
+
+def _bind_node(value, target_dir: str):
+    if isinstance(value, list):
+        for item in value:
+            _bind_node(item, target_dir)
+    elif isinstance(value, ArtifactReader):
+        # Bypasses the read-only `__setattr__` of compact nodes
+        object.__setattr__(value, "_target_dir", target_dir)
+
+
+def bind_target_dir(artifact, target_dir: str):
+    """Record the target directory that an artifact was loaded from on the
+    artifact and on each of its nodes, so that the nodes read the other
+    artifacts of the same dbt project from the state store.
+
+    The nodes of a lazily loaded mapping are bound when they are parsed.
+    """
+
+    from .models import LazyMapping
+
+    object.__setattr__(artifact, "_target_dir", target_dir)
+    for name in artifact.__fields__:
+        value = getattr(artifact, name)
+        if isinstance(value, LazyMapping):
+            value._target_dir = target_dir
+            values = list(value._parsed.values())
+        elif isinstance(value, Mapping):
+            values = value.values()
+        elif isinstance(value, list):
+            values = value
+        else:
+            continue
+        for item in values:
+            _bind_node(item, target_dir)
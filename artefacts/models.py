@@ -3,10 +3,14 @@ import uuid
 import pydantic
 from typing import Union, Literal, Dict, List, Iterable, Optional
 from typing_extensions import Annotated
-from collections import defaultdict
+from collections.abc import Mapping
 import packaging.version
+from pydantic.fields import MAPPING_LIKE_SHAPES
 
-from artefacts.mixins import ArtifactNodeReader
+from artefacts.mixins import ArtifactNodeReader, _bind_node
+from artefacts.indexes import ManifestIndex, ResultsIndex
+from artefacts.graph import Graph
+from artefacts.selection import NodeSelector
 
 
 class Model(pydantic.BaseModel):
@@ -30,6 +34,128 @@ class Model(pydantic.BaseModel):
             f"https://tjwaterman99.github.io/artefacts/reference.html#{cls._qualpath()}"
         )
 
+    # The helpers below let callers validate an artifact one field, or one
+    # entry of a mapping/list field, at a time instead of through `parse_obj`.
+    # Errors are collected into `errors` so they can be raised together by
+    # `_construct_validated`, matching the behavior of `parse_obj`.
+
+    @classmethod
+    def _validate_field(cls, field, value, values, errors):
+        validated, error = field.validate(value, values, loc=field.alias, cls=cls)
+        if error:
+            errors.append(error)
+        return validated
+
+    @classmethod
+    def _validate_item(cls, field, key, value, errors):
+        validated, error = field.sub_fields[0].validate(
+            value, {}, loc=(field.alias, key), cls=cls
+        )
+        if error:
+            errors.append(error)
+        return validated
+
+    @classmethod
+    def _construct_validated(cls, values, errors):
+        for name, field in cls.__fields__.items():
+            if field.required and name not in values:
+                errors.append(
+                    pydantic.error_wrappers.ErrorWrapper(
+                        pydantic.errors.MissingError(), loc=field.alias
+                    )
+                )
+
+        if errors:
+            raise pydantic.ValidationError(errors, cls)
+
+        return cls.construct(_fields_set=set(values), **values)
+
+    @classmethod
+    def _parse_obj_lazy(cls, obj):
+        values = dict()
+        errors = list()
+
+        for name, field in cls.__fields__.items():
+            if field.alias not in obj:
+                continue
+
+            value = obj[field.alias]
+            if field.shape in MAPPING_LIKE_SHAPES and isinstance(value, dict):
+                values[name] = LazyMapping(cls, field, value)
+            else:
+                values[name] = cls._validate_field(field, value, values, errors)
+
+        return cls._construct_validated(values, errors)
+
+
+class LazyMapping(Mapping):
+    """A read-only mapping that validates its values the first time they are
+    accessed.
+
+    When the `lazy_load` option is enabled, the mapping attributes of an
+    artifact, like :code:`ManifestModel.nodes` or :code:`ManifestModel.macros`,
+    are LazyMappings. They hold onto the raw dictionaries from the artifact and
+    only build each pydantic model when its key is first looked up, so the
+    cost of validating resources that are never used is never paid.
+    """
+
+    def __init__(self, model, field, raw: dict):
+        self._model = model
+        self._field = field
+        self._raw = raw
+        self._parsed = dict()
+        self._target_dir = None
+
+    def __getitem__(self, key):
+        try:
+            return self._parsed[key]
+        except KeyError:
+            pass
+
+        raw = self._raw[key]
+        if raw is None and key in self._parsed:  # Parsed by another thread
+            return self._parsed[key]
+
+        errors = list()
+        value = self._model._validate_item(self._field, key, raw, errors)
+        if errors:
+            raise pydantic.ValidationError(errors, self._model)
+
+        if self._target_dir is not None:
+            _bind_node(value, self._target_dir)
+
+        # The raw value is released once parsed, but the key is kept so the
+        # mapping preserves the artifact's ordering.
+        self._parsed[key] = value
+        self._raw[key] = None
+        return value
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def get_raw(self, key) -> Optional[dict]:
+        """The raw dictionary of a value, or `None` once the value is parsed."""
+
+        return self._raw[key]
+
+    def __repr__(self):
+        return f"<LazyMapping {len(self._parsed)}/{len(self._raw)} parsed>"
+
+    def __reduce__(self):
+        # Pydantic's fields can't be pickled, so the field is looked up on the
+        # model by its name when the mapping is unpickled.
+        state = (self._model, self._field.name, self._raw, self._parsed)
+        return (_unpickle_lazy_mapping, state)
+
+
+def _unpickle_lazy_mapping(model, field_name, raw, parsed):
+    mapping = LazyMapping(model, model.__fields__[field_name], raw)
+    mapping._parsed = parsed
+    return mapping
+
 
 class ManifestModelNode(ArtifactNodeReader, Model):
     """
@@ -144,6 +270,7 @@ class ManifestModelNode(ArtifactNodeReader, Model):
     """ The relation_name attribute """
 
     _test_path = "manifest.nodes['model.poffertjes_shop.products']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 class ManifestTestNode(ArtifactNodeReader, Model):
@@ -258,10 +385,14 @@ class ManifestTestNode(ArtifactNodeReader, Model):
     relation_name: Optional[str]
     "The relation_name attribute"
 
+    test_metadata: Optional[Dict]
+    "The test_metadata attribute"
+
     _test_path = (
         "manifest.nodes['test.poffertjes_shop.not_null_base_"
         "customers_customer_id.59e00b9238']"
     )
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 class ManifestOperationNode(ArtifactNodeReader, Model):
@@ -379,6 +510,7 @@ class ManifestOperationNode(ArtifactNodeReader, Model):
     _test_path = (
         "manifest.nodes['operation.poffertjes_shop.poffertjes_" "shop-on-run-start-0']"
     )
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 class ManifestSnapshotNode(ArtifactNodeReader, Model):
@@ -494,6 +626,7 @@ class ManifestSnapshotNode(ArtifactNodeReader, Model):
     """ The relation_name attribute """
 
     _test_path = "manifest.nodes['snapshot.poffertjes_shop.orders_snapshot']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 class ManifestSeedNode(ArtifactNodeReader, Model):
@@ -609,6 +742,7 @@ class ManifestSeedNode(ArtifactNodeReader, Model):
     """ The relation_name attribute """
 
     _test_path = "manifest.nodes['seed.poffertjes_shop.shoppes']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 class ManifestAnalysisNode(ArtifactNodeReader, Model):
@@ -724,6 +858,7 @@ class ManifestAnalysisNode(ArtifactNodeReader, Model):
     """ The relation_name attribute """
 
     _test_path = "manifest.nodes['analysis.poffertjes_shop.poffertjes_per_person']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
 
 ManifestModelUnion = Union[
@@ -797,18 +932,56 @@ class ManifestModel(Model):
     child_map: Optional[Dict[str, List["ManifestNodeReference"]]]
     """ The child_map attribute """
 
+    _index = pydantic.PrivateAttr(default=None)
+    _graph = pydantic.PrivateAttr(default=None)
+    _selector = pydantic.PrivateAttr(default=None)
+    _deduplication = pydantic.PrivateAttr(default=None)
+    _load_stats = pydantic.PrivateAttr(default=None)
+    _target_dir = pydantic.PrivateAttr(default=None)
+
+    @property
+    def graph(self) -> Graph:
+        """The DAG of the resources in the manifest, built from the parent_map.
+
+        The graph is built the first time it is accessed, and supports
+        queries like ancestors, descendants, shortest paths and topological
+        ordering.
+        """
+
+        if self._graph is None:
+            self._graph = Graph.from_manifest(self)
+        return self._graph
+
+    @property
+    def selector(self) -> NodeSelector:
+        """Evaluates dbt selection syntax against the manifest.
+
+        The selector is built the first time it is accessed, and is reused by
+        later selections from the manifest.
+        """
+
+        if self._selector is None:
+            self._selector = NodeSelector(self)
+        return self._selector
+
+    @property
+    def index(self) -> ManifestIndex:
+        """An index of the resources in the manifest.
+
+        The index is built the first time it is accessed, and is used for
+        looking up resources by unique_id, resource_type, package_name and
+        disabled status.
+        """
+
+        if self._index is None:
+            self._index = ManifestIndex(self)
+        return self._index
+
     @property
     def resources(self) -> Dict:
         """A dictionary containing all resources defined in the dbt project"""
 
-        return {
-            **self.nodes,
-            **self.sources,
-            **self.macros,
-            **self.exposures,
-            **self.metrics,
-            **self.disabled,
-        }
+        return self.index.resources
 
     @property
     def disabled(self) -> Dict:
@@ -818,7 +991,7 @@ class ManifestModel(Model):
         https://github.com/tjwaterman99/artefacts/issues/89
         """
 
-        return {k: v[0] for k, v in self.raw_disabled.items()}
+        return self.index.disabled_resources
 
     @property
     def tags(self) -> Dict:
@@ -826,13 +999,10 @@ class ManifestModel(Model):
         A dictionary mapping tags to their various resources
         """
 
-        result = defaultdict(list)
-
-        for k, v in self.resources.items():
-            for tag in v.tags:
-                result[tag].append(v)
-        else:
-            return dict(result)
+        return {
+            tag: [self.index[u] for u in unique_ids]
+            for tag, unique_ids in self.index.by_tag.items()
+        }
 
     def iter_resource_type(
         self,
@@ -849,13 +1019,13 @@ class ManifestModel(Model):
             include_disabled: (bool): Include disabled resources. Default `False`.
         """
 
-        for k, v in self.resources.items():
-            if package_name and v.package_name != package_name:
-                continue
-            if v.disabled and include_disabled is False:
-                continue
-            if v.resource_type == resource_type:
-                yield v
+        unique_ids = self.index.iter_unique_ids(
+            resource_type=resource_type,
+            package_name=package_name,
+            include_disabled=include_disabled,
+        )
+        for unique_id in unique_ids:
+            yield self.index[unique_id]
 
 
 class RunResultsModel(Model):
@@ -875,6 +1045,22 @@ class RunResultsModel(Model):
     args: Optional[Dict]
     """ The args attribute """
 
+    _index = pydantic.PrivateAttr(default=None)
+    _deduplication = pydantic.PrivateAttr(default=None)
+    _load_stats = pydantic.PrivateAttr(default=None)
+    _target_dir = pydantic.PrivateAttr(default=None)
+
+    @property
+    def index(self) -> ResultsIndex:
+        """An index of the artifact's results, keyed by unique_id.
+
+        The index is built the first time it is accessed.
+        """
+
+        if self._index is None:
+            self._index = ResultsIndex(self.results)
+        return self._index
+
 
 class CatalogModel(Model):
     """The catalog artifact."""
@@ -893,6 +1079,10 @@ class CatalogModel(Model):
     errors: Optional[List[str]]
     """ The errors attribute """
 
+    _deduplication = pydantic.PrivateAttr(default=None)
+    _load_stats = pydantic.PrivateAttr(default=None)
+    _target_dir = pydantic.PrivateAttr(default=None)
+
 
 class SourcesModel(Model):
     """The sources artifact."""
@@ -908,6 +1098,22 @@ class SourcesModel(Model):
     elapsed_time: float
     """ The elapsed_time attribute """
 
+    _index = pydantic.PrivateAttr(default=None)
+    _deduplication = pydantic.PrivateAttr(default=None)
+    _load_stats = pydantic.PrivateAttr(default=None)
+    _target_dir = pydantic.PrivateAttr(default=None)
+
+    @property
+    def index(self) -> ResultsIndex:
+        """An index of the artifact's results, keyed by unique_id.
+
+        The index is built the first time it is accessed.
+        """
+
+        if self._index is None:
+            self._index = ResultsIndex(self.results)
+        return self._index
+
 
 class Metadata(Model):
     """Data about the context in which the artifact was generated."""
@@ -1134,6 +1340,7 @@ class SourcesFreshnessResult(ArtifactNodeReader, Model):
     """Result details from checking the freshness of a source."""
 
     _test_path = "sources.results[0]"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     unique_id: str
     """ The unique_id attribute """
@@ -1173,6 +1380,7 @@ class RunResultNode(ArtifactNodeReader, Model):
     """Details about the results of running a specific model, test, etc."""
 
     _test_path = "run_results.results[0]"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     status: str
     """ The status attribute """
@@ -1210,8 +1418,9 @@ class ManifestNodeReference(ArtifactNodeReader):
             raise TypeError("ManifestNodeReferences must be strings")
         return cls(value)
 
-    def __init__(self, unique_id: str):
+    def __init__(self, unique_id: str, target_dir: str = None):
         self.unique_id = unique_id
+        self._target_dir = target_dir
 
     def __repr__(self):
         return f"<ManifestNodeReference {self.unique_id}>"
@@ -1230,13 +1439,14 @@ class ManifestNodeReference(ArtifactNodeReader):
         The manifest node this reference points to.
         """
 
-        return self.manifest_artifact.resources[self.unique_id]
+        return self.manifest_artifact.index[self.unique_id]
 
 
 class ManifestSourceNode(ArtifactNodeReader, Model):
     """Details about a Source node."""
 
     _test_path = "manifest.sources['source.poffertjes_shop.raw.products']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     fqn: List[str]
     """ The fqn attribute """
@@ -1351,6 +1561,7 @@ class ManifestMacroNode(ArtifactNodeReader, Model):
     _test_path = (
         'manifest.macros["macro.poffertjes_shop.create_or_replace_table_raw_orders"]'
     )
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     unique_id: str
     """ The unique_id attribute """
@@ -1432,6 +1643,7 @@ class ManifestExposureNode(ArtifactNodeReader, Model):
     """Details about an Exposure node."""
 
     _test_path = 'manifest.exposures["exposure.poffertjes_shop.revenue_summary"]'
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     fqn: List[str]
     """ The fqn attribute """
@@ -1513,6 +1725,7 @@ class ManifestMetricNode(ArtifactNodeReader, Model):
     """Details about a Metric node."""
 
     _test_path = "manifest.metrics['metric.poffertjes_shop.revenue']"
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     fqn: List[str]
     """ The fqn attribute """
@@ -1591,6 +1804,7 @@ class CatalogNode(ArtifactNodeReader, Model):
     """Details about a Catalog node."""
 
     _test_path = 'catalog.nodes["model.poffertjes_shop.customers"]'
+    _target_dir = pydantic.PrivateAttr(default=None)
 
     metadata: "CatalogNodeMetadata"
     """ The metadata attribute """
@@ -0,0 +1,471 @@
+"""
+artefacts.object_store
+======================
+
+A loader for artifacts stored in an S3-compatible object store, like Amazon
+S3 or MinIO, or served by any HTTP server that supports ETags.
+
+Downloaded artifacts are kept in a local cache that is addressed by the hash
+of their contents. Each request for an artifact sends the ETag of the cached
+copy, so an artifact that hasn't changed is never downloaded twice, and the
+copy of an artifact that changed is removed from the cache once the new one is
+downloaded. With the :code:`object_store_check_interval` option, the cached
+copy is used without a request until the interval has passed.
+
+.. code-block:: python
+
+    from artefacts import Config, Manifest
+    from artefacts.object_store import ObjectStoreLoader
+
+    config = Config(object_store_url="http://localhost:9000/dbt-artifacts/target")
+    manifest = Manifest(Loader=ObjectStoreLoader, config=config)
+
+"""
+
+import contextlib
+import datetime
+import hashlib
+import hmac
+import http.client
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import typing
+import urllib.parse
+
+from .config import Config
+from .loaders import COMPRESSION_SUFFIXES, FileSystemLoader
+
+
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b"").hexdigest()
+
+
+class ObjectStoreError(OSError):
+    """Raised when the object store responds with an unexpected status."""
+
+    def __init__(self, status: int, reason: str, url: str):
+        self.status = status
+        super().__init__(f"{status} {reason}: {url}")
+
+
+def sign_v4(
+    method: str,
+    host: str,
+    path: str,
+    headers: typing.Dict[str, str],
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    session_token: str = None,
+    now: datetime.datetime = None,
+    service: str = "s3",
+) -> typing.Dict[str, str]:
+    """Sign a request without a body with AWS Signature Version 4, and return
+    the headers to send, including the `Authorization` header.
+
+    Args:
+        method (str): The HTTP method of the request.
+        host (str): The value of the request's `Host` header.
+        path (str): The path of the request, which is not yet URI encoded.
+        headers (dict): Other headers to send and sign.
+    """
+
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date = now.strftime("%Y%m%d")
+
+    signed = {k.lower(): " ".join(str(v).split()) for k, v in headers.items()}
+    signed["host"] = host
+    signed["x-amz-content-sha256"] = EMPTY_PAYLOAD_HASH
+    signed["x-amz-date"] = amz_date
+    if session_token:
+        signed["x-amz-security-token"] = session_token
+
+    names = sorted(signed)
+    canonical_request = "\n".join(
+        [
+            method,
+            urllib.parse.quote(path, safe="/-_.~"),
+            "",
+            "".join(f"{name}:{signed[name]}\n" for name in names),
+            ";".join(names),
+            EMPTY_PAYLOAD_HASH,
+        ]
+    )
+
+    scope = f"{date}/{region}/{service}/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    key = f"AWS4{secret_access_key}".encode()
+    for part in [date, region, service, "aws4_request"]:
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    signed["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key_id}/{scope},"
+        f"SignedHeaders={';'.join(names)},Signature={signature}"
+    )
+    del signed["host"]  # Set by http.client
+    return signed
+
+
+class ConnectionPool:
+    """A pool of persistent HTTP connections to a single host, which are
+    reused across requests and threads."""
+
+    def __init__(self, scheme: str, host: str, timeout: float, maxsize: int = 8):
+        self.scheme = scheme
+        self.host = host
+        self.timeout = timeout
+        self._connections: "queue.LifoQueue[http.client.HTTPConnection]" = (
+            queue.LifoQueue(maxsize=maxsize)
+        )
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, timeout=self.timeout)
+
+    @contextlib.contextmanager
+    def request(
+        self, method: str, path: str, headers: typing.Dict[str, str]
+    ) -> typing.Iterator[http.client.HTTPResponse]:
+        """Send a request, and yield its response. The connection is returned
+        to the pool if the response was read completely."""
+
+        try:
+            connection = self._connections.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # A pooled connection may have been closed by the server while it
+            # was idle, so the request is retried once on a new connection.
+            connection.close()
+            connection = self._connect()
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+
+        try:
+            yield response
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.isclosed() and not response.will_close:
+            try:
+                self._connections.put_nowait(connection)
+                return
+            except queue.Full:
+                pass
+        connection.close()
+
+
+class CachedObject(typing.NamedTuple):
+    url: str
+    etag: typing.Optional[str]
+    sha256: str
+    path: str
+
+
+class ObjectStoreLoader(FileSystemLoader):
+    """Loads artifacts from an object store over HTTP.
+
+    The location of the artifacts is set by the :code:`object_store_url` config
+    option, for example :code:`https://my-bucket.s3.amazonaws.com/prod/target`
+    or :code:`http://localhost:9000/my-bucket/prod/target` for MinIO. When
+    credentials are configured, requests are signed for S3. Downloaded files
+    are cached in the :code:`objects` folder of the :code:`cache_dir`, or of
+    :code:`~/.cache/artefacts` when the option isn't set.
+
+    Like the :code:`FileSystemLoader`, a compressed object such as
+    `manifest.json.gz` is used when the uncompressed object doesn't exist.
+    """
+
+    timeout = 60.0
+    retries = 3
+    chunk_size = 2**20
+
+    _pools: typing.Dict[typing.Tuple[str, str], ConnectionPool] = dict()
+    _pools_lock = threading.Lock()
+
+    # The monotonic time of the last check of each cached object, by the path
+    # of its ref, which is shared by all loaders
+    _checked: typing.Dict[str, float] = dict()
+
+    def __init__(self, config=None):
+        config = Config() if config is None else config
+        super().__init__(config=config)
+        if not config.object_store_url:
+            raise ValueError("The ObjectStoreLoader requires an object_store_url")
+
+        url = urllib.parse.urlsplit(config.object_store_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported object_store_url: {url.geturl()}")
+        self.scheme, self.host = url.scheme, url.netloc
+        self.prefix = url.path.rstrip("/") + "/"
+
+        cache_dir = config.cache_dir or os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "artefacts",
+        )
+        self.cache_dir = os.path.abspath(os.path.join(cache_dir, "objects"))
+        self._objects: typing.Dict[str, CachedObject] = dict()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The connection pool to the object store, which is shared by all
+        loaders using the same host."""
+
+        key = (self.scheme, self.host)
+        with self._pools_lock:
+            if key not in self._pools:
+                self._pools[key] = ConnectionPool(
+                    self.scheme, self.host, timeout=self.timeout
+                )
+            return self._pools[key]
+
+    def _headers(self, method: str, path: str, headers: typing.Dict[str, str]):
+        access_key_id = self.config.object_store_access_key_id
+        secret_access_key = self.config.object_store_secret_access_key
+        if not (access_key_id and secret_access_key):
+            return headers
+
+        return sign_v4(
+            method,
+            self.host,
+            path,
+            headers,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            region=self.config.object_store_region,
+            session_token=self.config.object_store_session_token,
+        )
+
+    def _request(self, method: str, path: str, headers: typing.Dict[str, str]):
+        return self.pool.request(method, path, self._headers(method, path, headers))
+
+    def object_names(self, artifact_name: str) -> typing.List[str]:
+        """The names of the objects that may hold the artifact, in order."""
+
+        if artifact_name.endswith(tuple(COMPRESSION_SUFFIXES.values())):
+            return [artifact_name]
+        if not artifact_name.endswith(".json"):
+            artifact_name += ".json"
+        return [artifact_name] + [
+            artifact_name + suffix for suffix in COMPRESSION_SUFFIXES.values()
+        ]
+
+    def _ref_path(self, path: str) -> str:
+        url = f"{self.scheme}://{self.host}{path}"
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, "refs", f"{name}.json")
+
+    def _read_ref(self, path: str) -> typing.Optional[CachedObject]:
+        try:
+            with open(self._ref_path(path)) as fh:
+                cached = CachedObject(**json.load(fh))
+        except (OSError, ValueError, TypeError):
+            return None
+        return cached if os.path.exists(cached.path) else None
+
+    def _write_ref(self, path: str, cached: CachedObject):
+        ref_path = self._ref_path(path)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(ref_path))
+        with os.fdopen(fd, "w") as fh:
+            json.dump(cached._asdict(), fh)
+        os.replace(tmp_path, ref_path)
+
+    def _referenced_blobs(self) -> typing.Set[str]:
+        refs_dir = os.path.join(self.cache_dir, "refs")
+        try:
+            names = os.listdir(refs_dir)
+        except OSError:
+            return set()
+
+        blobs = set()
+        for name in names:
+            try:
+                with open(os.path.join(refs_dir, name)) as fh:
+                    blobs.add(json.load(fh)["path"])
+            except (OSError, ValueError, TypeError, KeyError):
+                continue
+        return blobs
+
+    def _remove_blob(self, blob_path: str):
+        # Blobs are addressed by their contents, so the same blob may be the
+        # cached copy of another object as well
+        if blob_path in self._referenced_blobs():
+            return
+        with contextlib.suppress(OSError):
+            os.remove(blob_path)
+
+    def _is_fresh(self, path: str) -> bool:
+        interval = self.config.object_store_check_interval
+        checked = self._checked.get(self._ref_path(path))
+        return checked is not None and time.monotonic() - checked < interval
+
+    def fetch(self, artifact_name: str) -> CachedObject:
+        """Download the artifact unless the cached copy is current, and return
+        the cached copy.
+
+        Raises:
+            FileNotFoundError: If the artifact is not in the object store.
+        """
+
+        if artifact_name in self._objects:
+            return self._objects[artifact_name]
+
+        for object_name in self.object_names(artifact_name):
+            cached = self._fetch(self.prefix + object_name)
+            if cached is not None:
+                self._objects[artifact_name] = cached
+                return cached
+
+        url = f"{self.scheme}://{self.host}{self.prefix}{artifact_name}"
+        raise FileNotFoundError(f"No artifact found at {url}")
+
+    def _fetch(self, path: str) -> typing.Optional[CachedObject]:
+        cached = self._read_ref(path)
+        if cached is not None and self._is_fresh(path):
+            return cached
+
+        headers = dict()
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        # Blobs keep the artifact's suffix, so compressed blobs are
+        # decompressed when they are opened.
+        suffix = ".json"
+        for compression_suffix in COMPRESSION_SUFFIXES.values():
+            if path.endswith(compression_suffix):
+                suffix += compression_suffix
+
+        blobs_dir = os.path.join(self.cache_dir, "blobs")
+        os.makedirs(blobs_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=blobs_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                status, etag, sha256 = self._download(path, headers, fh)
+            if status == 404:
+                return None
+            self._checked[self._ref_path(path)] = time.monotonic()
+            if status == 304:
+                return cached
+            blob_path = os.path.join(blobs_dir, sha256 + suffix)
+            os.replace(tmp_path, blob_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        url = f"{self.scheme}://{self.host}{path}"
+        previous, cached = cached, CachedObject(
+            url=url, etag=etag, sha256=sha256, path=blob_path
+        )
+        self._write_ref(path, cached)
+        if previous is not None and previous.path != blob_path:
+            self._remove_blob(previous.path)
+        return cached
+
+    def _download(self, path: str, headers: typing.Dict[str, str], fh):
+        """Download an object into `fh`, and return the response's status, the
+        object's ETag and the sha256 of its contents. If the connection drops,
+        the download is resumed with a Range request."""
+
+        digest = hashlib.sha256()
+        received = 0
+        etag = None
+
+        for attempt in range(self.retries):
+            request_headers = dict(headers)
+            if received:
+                request_headers = {"Range": f"bytes={received}-", "If-Range": etag}
+
+            try:
+                with self._request("GET", path, request_headers) as response:
+                    if response.status in (304, 404):
+                        response.read()
+                        return response.status, None, None
+                    if response.status == 200 and received:
+                        # The object changed, or the server ignored the Range
+                        fh.seek(0)
+                        fh.truncate()
+                        digest, received = hashlib.sha256(), 0
+                    elif response.status not in (200, 206):
+                        response.read()
+                        raise ObjectStoreError(response.status, response.reason, path)
+
+                    etag = etag or response.getheader("ETag")
+                    expected = response.getheader("Content-Length")
+                    remaining = None if expected is None else int(expected)
+                    while True:
+                        chunk = response.read(self.chunk_size)
+                        if not chunk:
+                            break
+                        fh.write(chunk)
+                        digest.update(chunk)
+                        received += len(chunk)
+                        if remaining is not None:
+                            remaining -= len(chunk)
+
+                    if remaining:
+                        raise http.client.IncompleteRead(b"", remaining)
+                    return 200, etag, digest.hexdigest()
+            except (http.client.HTTPException, ConnectionError):
+                if attempt == self.retries - 1 or (received and not etag):
+                    raise
+
+    def artifact_path(self, artifact_name):
+        """The path of the artifact's copy in the local cache, which is
+        downloaded first if it isn't current."""
+
+        return self.fetch(artifact_name).path
+
+    def fingerprint(self, artifact_name):
+        """The ETag of the artifact, or `None` if it doesn't exist."""
+
+        try:
+            cached = self.fetch(artifact_name)
+        except FileNotFoundError:
+            return None
+        return (cached.url, cached.etag, cached.sha256)
+
+    def read_range(self, artifact_name: str, start: int, length: int) -> bytes:
+        """Read part of an artifact's object, without downloading all of it.
+        The range is read from the cache if the artifact was downloaded by
+        this loader."""
+
+        if artifact_name in self._objects:
+            with open(self._objects[artifact_name].path, "rb") as fh:
+                fh.seek(start)
+                return fh.read(length)
+
+        for object_name in self.object_names(artifact_name):
+            path = self.prefix + object_name
+            headers = {"Range": f"bytes={start}-{start + length - 1}"}
+            with self._request("GET", path, headers) as response:
+                body = response.read()
+                if response.status == 404:
+                    continue
+                if response.status == 206:
+                    return body
+                if response.status == 200:  # The server ignored the Range
+                    end = start + length
+                    return body[start:end]
+                raise ObjectStoreError(response.status, response.reason, path)
+
+        raise FileNotFoundError(f"No artifact found for {artifact_name}")
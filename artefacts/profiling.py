@@ -0,0 +1,233 @@
+"""
+artefacts.profiling
+===================
+
+Timings of the phases of loading an artifact, and the size of each of its
+sections, for finding out where the time goes when an artifact loads slowly.
+
+When the :code:`profile_load` option is enabled, or inside the :func:`profile`
+context manager, every artifact that is deserialized records a
+:class:`LoadStats`. The stats break the load down into phases, like reading
+the file, decoding its JSON and validating its models, and count the entries
+of each section of the artifact, like the manifest's nodes and macros, with
+the time spent validating them and the memory they use.
+
+>>> from artefacts.profiling import profile, load_stats
+>>> with profile() as profiles:
+...     manifest = artefacts.Manifest.deserialize()
+>>> stats = profiles[0]
+>>> list(stats.phases)
+['read', 'decode', 'validate']
+>>> stats.sections['nodes'].count == len(manifest.nodes)
+True
+>>> load_stats(manifest) is stats
+True
+
+The stats are also logged by the :code:`artefacts.profiling` logger. Each
+phase and section is logged as a debug event, followed by an info event that
+summarises the load. The values of each event are in the :code:`artefacts`
+attribute of its log record, for structured logging handlers.
+
+"""
+
+import contextlib
+import contextvars
+import logging
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+class SectionStats(typing.NamedTuple):
+    count: int
+    """The number of entries in the section."""
+
+    seconds: typing.Optional[float]
+    """The time spent validating the section. `None` when the section was not
+    validated on its own, like when it is loaded lazily or streamed."""
+
+    memory_bytes: int
+    """The memory used by the section, including values it shares with other
+    sections."""
+
+
+class LoadStats:
+    """The profile of loading an artifact.
+
+    Phases are timed exclusively, so the time spent decoding a file is not
+    also counted as time spent reading it, and the phases add up to the total
+    time of the load.
+    """
+
+    def __init__(self, artifact_name: str):
+        self.artifact_name = artifact_name
+
+        self.phases: typing.Dict[str, float] = dict()
+        """The seconds spent in each phase of the load, in the order they
+        started."""
+
+        self.sections: typing.Dict[str, SectionStats] = dict()
+        """The stats of each mapping and list in the artifact, keyed by its
+        name in the artifact's JSON, like :code:`nodes` or :code:`disabled`."""
+
+        self._nested: typing.List[float] = list()
+        self._validated: typing.Dict[str, float] = dict()
+
+    def __repr__(self):
+        return f"<LoadStats {self.artifact_name} {self.seconds:.3f}s>"
+
+    @property
+    def seconds(self) -> float:
+        """The total time of the load."""
+
+        return sum(self.phases.values())
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        """Time a phase of the load. Phases that are started inside the phase
+        are subtracted from its time."""
+
+        self.phases.setdefault(name, 0.0)
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def measure(self, artifact):
+        """Record the count and memory of each section of a loaded artifact."""
+
+        from .dedup import _deep_size
+
+        for name, field in artifact.__fields__.items():
+            value = getattr(artifact, name)
+            if value is None or isinstance(value, (str, bytes)):
+                continue
+            if not hasattr(value, "__len__"):
+                continue
+            self.sections[field.alias] = SectionStats(
+                count=len(value),
+                seconds=self._validated.get(field.alias),
+                memory_bytes=_deep_size(value),
+            )
+
+    def as_dict(self) -> dict:
+        """The stats as a dictionary of builtin types, for logging."""
+
+        return {
+            "artifact_name": self.artifact_name,
+            "seconds": self.seconds,
+            "phases": dict(self.phases),
+            "sections": {k: v._asdict() for k, v in self.sections.items()},
+        }
+
+    def log(self):
+        """Log an event for each phase and section, and a summary."""
+
+        name = self.artifact_name
+        for phase, seconds in self.phases.items():
+            event = {"artifact_name": name, "phase": phase, "seconds": seconds}
+            logger.debug(
+                f"Loading the {name} artifact: {phase} took {seconds:.3f}s",
+                extra={"artefacts": event},
+            )
+        for section, stats in self.sections.items():
+            event = {"artifact_name": name, "section": section, **stats._asdict()}
+            logger.debug(
+                f"Loaded {stats.count} {section} of the {name} artifact, "
+                f"using {stats.memory_bytes / 2**20:.1f}MB",
+                extra={"artefacts": event},
+            )
+        logger.info(
+            f"Loaded the {name} artifact in {self.seconds:.3f}s",
+            extra={"artefacts": self.as_dict()},
+        )
+
+
+_active: "contextvars.ContextVar[typing.Optional[LoadStats]]" = contextvars.ContextVar(
+    "artefacts_load_stats", default=None
+)
+_collectors: "contextvars.ContextVar[tuple]" = contextvars.ContextVar(
+    "artefacts_load_stats_collectors", default=()
+)
+
+
+def active() -> typing.Optional[LoadStats]:
+    """The stats of the artifact that is being loaded, if it is profiled."""
+
+    return _active.get()
+
+
+def phase(name: str) -> typing.ContextManager:
+    """Time a phase of the current load, if it is profiled."""
+
+    stats = _active.get()
+    return stats.phase(name) if stats is not None else contextlib.nullcontext()
+
+
+def is_profiling(config) -> bool:
+    """Whether artifacts loaded with the config are profiled."""
+
+    return config.profile_load or bool(_collectors.get())
+
+
+@contextlib.contextmanager
+def recording(artifact_name: str) -> typing.Iterator[LoadStats]:
+    """Record the stats of loading an artifact, and collect them in the
+    active :func:`profile` contexts."""
+
+    stats = LoadStats(artifact_name)
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+    collect(stats)
+
+
+def collect(stats: LoadStats):
+    for profiles in _collectors.get():
+        profiles.append(stats)
+
+
+@contextlib.contextmanager
+def profile() -> typing.Iterator[typing.List[LoadStats]]:
+    """Profile the artifacts that are deserialized inside the context, and
+    collect their stats in the list it returns.
+
+    Artifacts that are already in the state store are not deserialized again,
+    so use :code:`deserialize` or a new store to profile them.
+    """
+
+    profiles: typing.List[LoadStats] = list()
+    token = _collectors.set(_collectors.get() + (profiles,))
+    try:
+        yield profiles
+    finally:
+        _collectors.reset(token)
+
+
+def parse_obj(model, obj: dict, stats: LoadStats):
+    """Validate an artifact one field at a time, like `parse_obj`, recording
+    the time spent validating each field."""
+
+    values: typing.Dict[str, typing.Any] = dict()
+    errors: typing.List[typing.Any] = list()
+    for name, field in model.__fields__.items():
+        if field.alias not in obj:
+            continue
+        start = time.perf_counter()
+        values[name] = model._validate_field(field, obj[field.alias], values, errors)
+        stats._validated[field.alias] = time.perf_counter() - start
+    return model._construct_validated(values, errors)
+
+
+def load_stats(artifact) -> typing.Optional[LoadStats]:
+    """The stats of loading an artifact, if it was profiled."""
+
+    return getattr(artifact, "_load_stats", None)
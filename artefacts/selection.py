@@ -0,0 +1,445 @@
+"""
+artefacts.selection
+===================
+
+An implementation of dbt's node selection syntax, evaluated against a loaded
+manifest instead of by re-parsing the dbt project.
+
+Both the command line syntax, as used by :code:`dbt ls --select`, and the YAML
+selectors stored in :code:`ManifestModel.selectors` are supported.
+
+>>> selector = NodeSelector(artefacts.Manifest())
+>>> 'model.poffertjes_shop.customers' in selector.select('+customers')
+True
+
+"""
+
+import fnmatch
+import os
+import re
+import typing
+
+if typing.TYPE_CHECKING:
+    from .models import ManifestModel
+
+
+SELECTABLE_RESOURCE_TYPES = {
+    "model",
+    "test",
+    "seed",
+    "snapshot",
+    "analysis",
+    "source",
+    "exposure",
+    "metric",
+}
+
+INDIRECT_SELECTION_MODES = ("eager", "cautious")
+
+# The same pattern dbt uses to parse a selection criterion from the CLI
+CRITERION_PATTERN = re.compile(
+    r"\A"
+    r"(?P<childrens_parents>(\@))?"
+    r"(?P<parents>((?P<parents_depth>(\d*))\+))?"
+    r"((?P<method>([\w.]+)):)?(?P<value>(.*?))"
+    r"(?P<children>(\+(?P<children_depth>(\d*))))?"
+    r"\Z"
+)
+
+
+class SelectionError(ValueError):
+    """Raised when a selection criterion or YAML selector is invalid."""
+
+
+class Criterion(typing.NamedTuple):
+    method: str
+    value: str
+    parents: bool = False
+    parents_depth: typing.Optional[int] = None
+    children: bool = False
+    children_depth: typing.Optional[int] = None
+    childrens_parents: bool = False
+
+    @classmethod
+    def parse(cls, raw: str) -> "Criterion":
+        """Parse a single criterion, like :code:`2+tag:nightly+`."""
+
+        match = CRITERION_PATTERN.match(raw)
+        if match is None or not match.group("value"):
+            raise SelectionError(f"Invalid selection criterion: '{raw}'")
+
+        groups = match.groupdict()
+        if groups["childrens_parents"] and groups["parents"]:
+            raise SelectionError(
+                f"Invalid selection criterion: '{raw}'. "
+                "The '@' and '+' operators cannot be combined."
+            )
+
+        value = groups["value"]
+        return cls(
+            method=groups["method"] or cls.default_method(value),
+            value=value,
+            parents=bool(groups["parents"]),
+            parents_depth=int(groups["parents_depth"] or 0) or None,
+            children=bool(groups["children"]),
+            children_depth=int(groups["children_depth"] or 0) or None,
+            childrens_parents=bool(groups["childrens_parents"]),
+        )
+
+    @staticmethod
+    def default_method(value: str) -> str:
+        if os.path.sep in value or (os.path.altsep and os.path.altsep in value):
+            return "path"
+        elif value.lower().endswith((".sql", ".py", ".csv")):
+            return "file"
+        return "fqn"
+
+
+def _matches(pattern: str, value: typing.Optional[str]) -> bool:
+    if value is None:
+        return False
+    return fnmatch.fnmatchcase(value, pattern)
+
+
+class NodeSelector:
+    """Evaluates dbt selection syntax against a manifest.
+
+    Only enabled models, tests, seeds, snapshots, analyses, sources, exposures
+    and metrics can be selected, matching the resources listed by
+    :code:`dbt ls`.
+
+    The :code:`state`, :code:`result` and :code:`source_status` methods
+    depend on artifacts from a previous run, and are not supported.
+
+    Args:
+        manifest: The manifest to select resources from.
+    """
+
+    def __init__(self, manifest: "ManifestModel"):
+        self.manifest = manifest
+        self.index = manifest.index
+        self.graph = manifest.graph
+        self.unique_ids: typing.List[str] = [
+            u
+            for u in self.index.iter_unique_ids(include_disabled=False)
+            if u.split(".")[0] in SELECTABLE_RESOURCE_TYPES
+        ]
+        self._selectable = set(self.unique_ids)
+
+    def _values(self, name, resource_types=None):
+        # Values are read through the index, so the resources of a lazily
+        # loaded manifest aren't parsed to be selected
+        for unique_id in self.unique_ids:
+            if resource_types is None or unique_id.split(".")[0] in resource_types:
+                yield unique_id, self.index.get_value(unique_id, name)
+
+    # Selection methods. Each returns the unique_ids matching a value.
+
+    def _select_tag(self, value):
+        return {
+            u
+            for t, ids in self.index.by_tag.items()
+            if _matches(value, t)
+            for u in ids
+            if u in self._selectable
+        }
+
+    def _select_resource_type(self, value):
+        return {
+            u
+            for u in self.index.by_resource_type.get(value, [])
+            if u in self._selectable
+        }
+
+    def _select_package(self, value):
+        return {
+            u
+            for p, ids in self.index.by_package_name.items()
+            if _matches(value, p)
+            for u in ids
+            if u in self._selectable
+        }
+
+    def _select_fqn(self, value):
+        parts = value.split(".")
+        selected = set()
+        for unique_id, fqn in self._values("fqn"):
+            if not fqn:
+                continue
+            if _matches(value, fqn[-1]):
+                selected.add(unique_id)
+                continue
+            flat_fqn = [item for segment in fqn for item in segment.split(".")]
+            for position, part in enumerate(parts):
+                if part == "*":
+                    selected.add(unique_id)
+                    break
+                if position >= len(flat_fqn) or not _matches(part, flat_fqn[position]):
+                    break
+            else:
+                selected.add(unique_id)
+        return selected
+
+    def _select_path(self, value):
+        path = os.path.normpath(value)
+        selected = set()
+        for unique_id, file_path in self._values("original_file_path"):
+            if file_path is None:
+                continue
+            file_path = os.path.normpath(file_path)
+            if (
+                file_path == path
+                or file_path.startswith(path.rstrip(os.path.sep) + os.path.sep)
+                or fnmatch.fnmatchcase(file_path, path)
+            ):
+                selected.add(unique_id)
+        return selected
+
+    def _select_file(self, value):
+        return {
+            u
+            for u, file_path in self._values("original_file_path")
+            if _matches(value, os.path.basename(file_path or ""))
+        }
+
+    def _select_source(self, value):
+        parts = value.split(".")
+        if len(parts) > 3:
+            raise SelectionError(f"Invalid source selector value: '{value}'")
+
+        selected = set()
+        for unique_id, name in self._values("name", {"source"}):
+            # Values are either `source_name`, `source_name.table_name` or
+            # `package_name.source_name.table_name`
+            names = [self.index.get_value(unique_id, "source_name"), name]
+            if len(parts) == 3:
+                names = [unique_id.split(".")[1]] + names
+            if all(_matches(p, n) for p, n in zip(parts, names)):
+                selected.add(unique_id)
+        return selected
+
+    def _select_exposure(self, value):
+        return {u for u, n in self._values("name", {"exposure"}) if _matches(value, n)}
+
+    def _select_metric(self, value):
+        return {u for u, n in self._values("name", {"metric"}) if _matches(value, n)}
+
+    def _select_test_name(self, value):
+        return {
+            u
+            for u, metadata in self._values("test_metadata", {"test"})
+            if _matches(value, (metadata or {}).get("name"))
+        }
+
+    def _select_test_type(self, value):
+        if value in ("generic", "schema"):
+            generic = True
+        elif value in ("singular", "data"):
+            generic = False
+        else:
+            raise SelectionError(f"Invalid test_type selector value: '{value}'")
+
+        return {
+            u
+            for u, metadata in self._values("test_metadata", {"test"})
+            if (metadata is not None) == generic
+        }
+
+    def _select_config(self, key, value):
+        selected = set()
+        for unique_id, config in self._values("config"):
+            if config is None:
+                continue
+            if not isinstance(config, dict):
+                config = config.dict()
+
+            for part in key.split("."):
+                if not isinstance(config, dict) or part not in config:
+                    break
+                config = config[part]
+            else:
+                if isinstance(config, (list, tuple)):
+                    if any(_matches(value, str(item)) for item in config):
+                        selected.add(unique_id)
+                elif isinstance(config, bool):
+                    if str(config).lower() == value.lower():
+                        selected.add(unique_id)
+                elif _matches(value, str(config)):
+                    selected.add(unique_id)
+        return selected
+
+    def _select_method(
+        self, method: str, value: str, indirect_selection: str = "eager"
+    ) -> typing.Set[str]:
+        if method.startswith("config."):
+            return self._select_config(method.split(".", 1)[1], value)
+        elif method == "selector":
+            return self.select_selector(value, indirect_selection)
+
+        select = getattr(self, f"_select_{method}", None)
+        if select is None:
+            raise SelectionError(f"Unsupported selection method: '{method}'")
+        return select(value)
+
+    # Combining criteria
+
+    def _select_criterion(
+        self, criterion: Criterion, indirect_selection: str = "eager"
+    ) -> typing.Set[str]:
+        selected = self._select_method(
+            criterion.method, criterion.value, indirect_selection
+        )
+        result = set(selected)
+        selected = {u for u in selected if u in self.graph}
+
+        if criterion.childrens_parents:
+            descendants = self.graph.descendants_of(selected)
+            result.update(descendants)
+            result.update(self.graph.ancestors_of(result))
+        else:
+            if criterion.parents:
+                result.update(
+                    self.graph.ancestors_of(selected, criterion.parents_depth)
+                )
+            if criterion.children:
+                result.update(
+                    self.graph.descendants_of(selected, criterion.children_depth)
+                )
+
+        return result & self._selectable
+
+    def _with_tests(self, selected: typing.Set[str], mode: str) -> typing.Set[str]:
+        if mode not in INDIRECT_SELECTION_MODES:
+            raise SelectionError(
+                f"Invalid indirect selection mode: '{mode}'. "
+                f"Expected one of {INDIRECT_SELECTION_MODES}"
+            )
+
+        result = set(selected)
+        selected = {u for u in selected if u in self.graph}
+        for unique_id in self.graph.descendants_of(selected, depth=1):
+            if unique_id not in self._selectable or not unique_id.startswith("test."):
+                continue
+            parents = self.graph.parents(unique_id)
+            if mode == "eager" or all(p in selected for p in parents):
+                result.add(unique_id)
+        return result
+
+    def _select_spec(self, spec, indirect_selection: str) -> typing.Set[str]:
+        if spec is None:
+            return set(self._selectable)
+
+        if isinstance(spec, str):
+            spec = spec.split()
+
+        selected: typing.Set[str] = set()
+        for token in spec:
+            intersection = None
+            for raw in token.split(","):
+                found = self._select_criterion(Criterion.parse(raw), indirect_selection)
+                intersection = found if intersection is None else intersection & found
+            selected |= intersection or set()
+        return self._with_tests(selected, indirect_selection)
+
+    def _ordered(self, unique_ids: typing.Set[str]) -> typing.List[str]:
+        return [u for u in self.unique_ids if u in unique_ids]
+
+    def select(
+        self,
+        select: typing.Union[str, typing.List[str]] = None,
+        exclude: typing.Union[str, typing.List[str]] = None,
+        selector: str = None,
+        indirect_selection: str = "eager",
+    ) -> typing.List[str]:
+        """The unique_ids of the resources matching the selection, in the
+        order of the manifest.
+
+        Args:
+            select: Equivalent to dbt's :code:`--select` argument. Either a
+                    string of space-separated criteria, or a list of criteria.
+                    Defaults to selecting all resources.
+            exclude: Equivalent to dbt's :code:`--exclude` argument.
+            selector: The name of a YAML selector. Cannot be combined with
+                      `select` or `exclude`.
+            indirect_selection: Either "eager", to include the tests of any
+                                selected resource, or "cautious", to only
+                                include tests whose parents are all selected.
+        """
+
+        if selector is not None:
+            if select is not None or exclude is not None:
+                raise SelectionError(
+                    "The selector argument cannot be combined with select or exclude"
+                )
+            return self._ordered(self.select_selector(selector, indirect_selection))
+
+        selected = self._select_spec(select, indirect_selection)
+        if exclude is not None:
+            selected -= self._select_spec(exclude, indirect_selection)
+        return self._ordered(selected)
+
+    # YAML selectors
+
+    def select_selector(self, name: str, indirect_selection: str = "eager"):
+        """The unique_ids matching a YAML selector defined in the project."""
+
+        selectors = self.manifest.selectors
+        if name not in selectors:
+            raise SelectionError(f"Unknown selector: '{name}'")
+
+        definition = selectors[name]
+        if isinstance(definition, dict) and "definition" in definition:
+            definition = definition["definition"]
+        return self._select_definition(definition, indirect_selection)
+
+    def _select_definition(self, definition, indirect_selection):
+        if isinstance(definition, str):
+            return self._select_spec(definition, indirect_selection)
+
+        if not isinstance(definition, dict):
+            raise SelectionError(f"Invalid selector definition: {definition}")
+
+        if "union" in definition or "intersection" in definition:
+            operator = "union" if "union" in definition else "intersection"
+            included, excluded = list(), set()
+            for item in definition[operator]:
+                if isinstance(item, dict) and "exclude" in item:
+                    for excluded_item in item["exclude"]:
+                        excluded |= self._select_definition(
+                            excluded_item, indirect_selection
+                        )
+                else:
+                    included.append(self._select_definition(item, indirect_selection))
+
+            if not included:
+                result = set()
+            elif operator == "union":
+                result = set.union(*included)
+            else:
+                result = set.intersection(*included)
+            return result - excluded
+
+        if "method" in definition:
+            method, value = definition["method"], definition.get("value")
+        elif len(definition) == 1:
+            ((method, value),) = definition.items()
+        else:
+            raise SelectionError(f"Invalid selector definition: {definition}")
+
+        criterion = Criterion(
+            method=method,
+            value=str(value),
+            parents=bool(definition.get("parents")),
+            parents_depth=definition.get("parents_depth"),
+            children=bool(definition.get("children")),
+            children_depth=definition.get("children_depth"),
+            childrens_parents=bool(definition.get("childrens_parents")),
+        )
+        mode = definition.get("indirect_selection", indirect_selection)
+        selected = self._select_criterion(criterion, mode)
+        result = self._with_tests(selected, mode)
+
+        if "exclude" in definition:
+            for item in definition["exclude"]:
+                result -= self._select_definition(item, indirect_selection)
+        return result
@@ -0,0 +1,229 @@
+"""
+artefacts.simulation
+====================
+
+Predicts how long a dbt invocation would take with a number of threads, by
+replaying dbt's scheduling of the manifest's DAG with the runtimes of
+previous runs.
+
+dbt runs a node as soon as all of its parents have completed and a thread is
+free. When several nodes are ready, it runs the node with the lowest depth in
+the graph of selected nodes first, and breaks ties by unique_id. The
+simulation follows the same rules, without the overhead of dbt itself, so its
+predictions are a little lower than real runs.
+
+>>> from artefacts.simulation import simulate
+>>> simulation = simulate(threads=4)
+>>> simulation.duration == max(run.completed_at for run in simulation.runs)
+True
+>>> simulate(threads=1).duration >= simulation.duration
+True
+
+The runtimes default to the execution_time of each node in the project's
+run_results. The runtimes of many runs can be used instead, for example the
+median runtimes in a :class:`artefacts.history.RunHistory`:
+
+.. code-block:: python
+
+    percentiles = history.execution_time_percentiles(percentiles=[50])
+    runtimes = {unique_id: p[50] for unique_id, p in percentiles.items()}
+    simulate(threads=8, select="tag:nightly", execution_times=runtimes)
+
+"""
+
+import heapq
+import statistics
+import typing
+
+if typing.TYPE_CHECKING:
+    from .models import ManifestModel, RunResultsModel
+
+
+EXECUTED_RESOURCE_TYPES = {"model", "seed", "snapshot", "test"}
+"""The types of resources that occupy a thread when dbt builds them."""
+
+
+class SimulatedRun(typing.NamedTuple):
+    unique_id: str
+    thread: int
+    """The index of the thread that ran the node, from 0."""
+
+    started_at: float
+    """The seconds from the start of the simulation."""
+
+    completed_at: float
+
+
+class Simulation(typing.NamedTuple):
+    threads: int
+    """The number of threads that were simulated."""
+
+    duration: float
+    """The predicted wall-clock seconds of the invocation."""
+
+    runs: typing.List[SimulatedRun]
+    """The simulated runs, in the order they started."""
+
+    busy: typing.List[float]
+    """The seconds each thread spent running nodes."""
+
+    @property
+    def utilisation(self) -> float:
+        """The share of the available thread time spent running nodes."""
+
+        available = self.duration * self.threads
+        return sum(self.busy) / available if available else 0.0
+
+    def occupancy(self) -> typing.List[typing.Tuple[float, int]]:
+        """The number of busy threads over time, as a list of the times at
+        which the number changes and the number from that time on."""
+
+        changes: typing.Dict[float, int] = dict()
+        for run in self.runs:
+            if run.completed_at > run.started_at:
+                changes[run.started_at] = changes.get(run.started_at, 0) + 1
+                changes[run.completed_at] = changes.get(run.completed_at, 0) - 1
+
+        occupancy, busy = list(), 0
+        for time in sorted(changes):
+            if changes[time]:
+                busy += changes[time]
+                occupancy.append((time, busy))
+        return occupancy
+
+
+def _selected(manifest, select, exclude, selector) -> typing.List[str]:
+    selected = manifest.selector.select(
+        select=select, exclude=exclude, selector=selector
+    )
+    index = manifest.index
+    executed = list()
+    for unique_id in selected:
+        resource_type = unique_id.split(".", 1)[0]
+        if resource_type not in EXECUTED_RESOURCE_TYPES:
+            continue
+        # Ephemeral models are compiled into their children instead of run
+        if resource_type == "model":
+            config = index[unique_id].config or dict()
+            if config.get("materialized") == "ephemeral":
+                continue
+        executed.append(unique_id)
+    return executed
+
+
+def _execution_times(execution_times) -> typing.Mapping[str, float]:
+    if execution_times is None:
+        from .deserializers import RunResults
+
+        execution_times = RunResults()
+    if hasattr(execution_times, "results"):
+        return {r.unique_id: r.execution_time for r in execution_times.results}
+    return execution_times
+
+
+def simulate(
+    threads: int = 1,
+    select: typing.Union[str, typing.List[str]] = None,
+    exclude: typing.Union[str, typing.List[str]] = None,
+    selector: str = None,
+    manifest: "ManifestModel" = None,
+    execution_times: typing.Union[typing.Mapping[str, float], "RunResultsModel"] = None,
+    default_execution_time: float = None,
+) -> Simulation:
+    """Simulate a dbt invocation with a number of threads.
+
+    Args:
+        threads (int): Equivalent to dbt's `--threads` argument.
+        select: Equivalent to dbt's `--select` argument. Defaults to every
+                model, seed, snapshot and test, as run by :code:`dbt build`.
+        exclude: Equivalent to dbt's `--exclude` argument.
+        selector (str): The name of a YAML selector defined in the project.
+        manifest (ManifestModel): Defaults to the project's manifest.
+        execution_times: The runtime of each node in seconds, keyed by
+                         unique_id, or a run_results artifact. Defaults to the
+                         project's run_results.
+        default_execution_time (float): The runtime of the selected nodes
+                                        without a known runtime, like new
+                                        models. Defaults to the median of the
+                                        known runtimes.
+    """
+
+    if threads < 1:
+        raise ValueError("The number of threads must be at least 1")
+
+    if manifest is None:
+        from .deserializers import Manifest
+
+        manifest = Manifest()
+
+    graph = manifest.graph
+    execution_times = _execution_times(execution_times)
+    if default_execution_time is None:
+        known = list(execution_times.values())
+        default_execution_time = statistics.median(known) if known else 0.0
+
+    # Unselected resources complete instantly without taking a thread, so
+    # selected resources still wait for their selected ancestors
+    runtimes: typing.List[typing.Optional[float]] = [None] * len(graph)
+    for unique_id in _selected(manifest, select, exclude, selector):
+        if unique_id in graph:
+            runtimes[graph.position(unique_id)] = execution_times.get(
+                unique_id, default_execution_time
+            )
+
+    # dbt prioritises ready nodes by their depth in the graph of selected nodes
+    depths = [0] * len(graph)
+    waiting = [0] * len(graph)
+    ranks = graph.topological_ranks()
+    for position in sorted(range(len(graph)), key=ranks.__getitem__):
+        parents = graph.parent_positions(position)
+        waiting[position] = len(parents)
+        for parent in parents:
+            depth = depths[parent] + (runtimes[parent] is not None)
+            if depth > depths[position]:
+                depths[position] = depth
+
+    unique_ids = graph.unique_ids
+    ready: typing.List[typing.Tuple[int, str, int]] = list()
+    running: typing.List[typing.Tuple[float, int, int]] = list()
+    free_threads = list(range(threads))
+    runs: typing.List[SimulatedRun] = list()
+    busy = [0.0] * threads
+    now = 0.0
+
+    def complete(positions):
+        while positions:
+            position = positions.pop()
+            for child in graph.child_positions(position):
+                waiting[child] -= 1
+                if waiting[child] > 0:
+                    continue
+                if runtimes[child] is None:
+                    positions.append(child)
+                else:
+                    heapq.heappush(ready, (depths[child], unique_ids[child], child))
+
+    roots = [p for p in range(len(graph)) if waiting[p] == 0]
+    for position in roots:
+        if runtimes[position] is not None:
+            heapq.heappush(ready, (depths[position], unique_ids[position], position))
+    complete([p for p in roots if runtimes[p] is None])
+
+    while ready or running:
+        while ready and free_threads:
+            _, unique_id, position = heapq.heappop(ready)
+            thread = heapq.heappop(free_threads)
+            completed_at = now + runtimes[position]
+            runs.append(SimulatedRun(unique_id, thread, now, completed_at))
+            busy[thread] += runtimes[position]
+            heapq.heappush(running, (completed_at, thread, position))
+
+        now = running[0][0]
+        completed = list()
+        while running and running[0][0] == now:
+            _, thread, position = heapq.heappop(running)
+            heapq.heappush(free_threads, thread)
+            completed.append(position)
+        complete(completed)
+
+    return Simulation(threads=threads, duration=now, runs=runs, busy=busy)
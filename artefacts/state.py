@@ -8,32 +8,256 @@ the store, simply import the module directly.
 
 >>> import artefacts.state
 
-"""
+The module level functions operate on the current :class:`ArtifactStore`.
+Artifacts are stored per target directory, so a single store can hold the
+artifacts of several dbt projects. A process that serves several projects,
+like a server, can also create a store per project and activate it with
+:func:`use` while handling a request.
 
-# We'll need to think a lot more about how to handle state if we ever want to run
-# artefacts on a server. The server might want to load artifacts from different users
-# so this kind of state mechanism won't work, because the different users will override
-# each other.
+"""
 
+import contextlib
+import contextvars
+import threading
 import typing
+from collections import OrderedDict
+from collections.abc import Mapping
+
+StoreKey = typing.Tuple[typing.Optional[str], str]
+
+
+class _Entry(typing.NamedTuple):
+    value: typing.Any
+    fingerprint: typing.Any
+
+
+class _KeyLock:
+    """The lock of a key, and the number of threads holding or waiting for
+    it, so it is only discarded once no thread uses it."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+_MISSING = object()
+
+
+class ArtifactStore(Mapping):
+    """A thread-safe store of parsed artifacts, keyed by (target_dir, name).
+
+    The `config` key is not scoped to a target directory unless a
+    `target_dir` is passed, because the store's config determines the default
+    target directory of the store. Other keys use the target directory of the
+    stored config when no `target_dir` is passed. Configs are never evicted.
+
+    Loading an artifact through :meth:`get_or_load` holds a lock for its key,
+    so concurrent requests for the same artifact only parse it once, while
+    different artifacts can be loaded in parallel.
+
+    Args:
+        max_size (int): The maximum number of artifacts to keep. When the
+                        store is full, the least recently used artifact is
+                        evicted. Defaults to keeping every artifact.
+
+    >>> store = artefacts.state.ArtifactStore(max_size=2)
+    >>> store.set('manifest', 'a', target_dir='/projects/a')
+    'a'
+    >>> store.get('manifest', target_dir='/projects/a')
+    'a'
+    >>> store.get('manifest', target_dir='/projects/b') is None
+    True
+
+    """
+
+    def __init__(self, max_size: int = None):
+        self.max_size = max_size
+        self._entries: "OrderedDict[StoreKey, _Entry]" = OrderedDict()
+        self._locks: typing.Dict[StoreKey, _KeyLock] = dict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: StoreKey):
+        return self._entries[key].value
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, key: str, target_dir: typing.Optional[str]) -> StoreKey:
+        if key == "config":
+            return (target_dir, key)
+        if target_dir is None:
+            config = self._entries.get((None, "config"))
+            if config is not None:
+                target_dir = config.value.dbt_target_dir
+        return (target_dir, key)
+
+    def set(
+        self,
+        key: str,
+        value: typing.Any,
+        fingerprint: typing.Any = None,
+        target_dir: str = None,
+    ) -> typing.Any:
+        """Places an object in the store, and returns it. The `fingerprint`
+        identifies the version of the file the object was loaded from."""
+
+        with self._lock:
+            store_key = self._key(key, target_dir)
+            self._entries[store_key] = _Entry(value, fingerprint)
+            self._entries.move_to_end(store_key)
+            self._evict()
+        return value
+
+    def get(self, key: str, target_dir: str = None) -> typing.Any:
+        """Returns an object from the store, or `None` if it doesn't exist."""
+
+        value = self._lookup(self._key(key, target_dir))
+        return None if value is _MISSING else value
+
+    def _lookup(self, store_key: StoreKey, fingerprint: typing.Any = None):
+        # The entry is read once under the lock, so it can't be evicted
+        # between checking its fingerprint and returning its value
+        with self._lock:
+            entry = self._entries.get(store_key)
+            if entry is None:
+                return _MISSING
+            if fingerprint is not None and entry.fingerprint != fingerprint:
+                return _MISSING
+            self._entries.move_to_end(store_key)
+            return entry.value
+
+    def fingerprint(self, key: str, target_dir: str = None) -> typing.Any:
+        """Returns the fingerprint the object was stored with, if any."""
+
+        entry = self._entries.get(self._key(key, target_dir))
+        return None if entry is None else entry.fingerprint
+
+    def exists(
+        self, key: str, fingerprint: typing.Any = None, target_dir: str = None
+    ) -> bool:
+        """Returns `True` if the key exists in the store. If a `fingerprint` is
+        passed, the object must also have been stored with the same fingerprint.
+        """
+
+        entry = self._entries.get(self._key(key, target_dir))
+        if entry is None:
+            return False
+        return fingerprint is None or entry.fingerprint == fingerprint
+
+    def get_or_load(
+        self,
+        key: str,
+        load: typing.Callable[[], typing.Any],
+        fingerprint: typing.Any = None,
+        target_dir: str = None,
+    ) -> typing.Any:
+        """Returns an object from the store, calling `load` to create and store
+        it if it doesn't exist or its fingerprint has changed. Only one thread
+        loads a key at a time, and the others wait for its result."""
+
+        store_key = self._key(key, target_dir)
+        value = self._lookup(store_key, fingerprint)
+        if value is not _MISSING:
+            return value
+
+        with self._key_lock(store_key):
+            value = self._lookup(store_key, fingerprint)
+            if value is not _MISSING:
+                return value
+            value = load()
+            return self.set(key, value, fingerprint=fingerprint, target_dir=target_dir)
+
+    @contextlib.contextmanager
+    def _key_lock(self, store_key: StoreKey) -> typing.Iterator[None]:
+        with self._lock:
+            key_lock = self._locks.setdefault(store_key, _KeyLock())
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                yield
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if key_lock.users == 0:
+                    del self._locks[store_key]
+
+    def _evict(self):
+        if self.max_size is None:
+            return
 
-_state = dict()
+        # Configs are never evicted, and don't count towards the size.
+        evictable = [k for k in self._entries if k[1] != "config"]
+        for store_key in evictable[: max(len(evictable) - self.max_size, 0)]:
+            del self._entries[store_key]
 
+    def clear(self):
+        """Remove every object from the store."""
 
-def set(key: str, value: typing.Any) -> typing.Union[typing.Any, None]:
+        with self._lock:
+            self._entries.clear()
+
+
+# The store used when no other store has been activated with `use`.
+_state = ArtifactStore()
+
+_current: contextvars.ContextVar = contextvars.ContextVar("artefacts_store")
+
+
+def current() -> ArtifactStore:
+    """
+    Returns the store used by the current thread or task.
+
+    >>> artefacts.state.current() is artefacts.state._state
+    True
+
+    """
+
+    return _current.get(_state)
+
+
+@contextlib.contextmanager
+def use(store: ArtifactStore) -> typing.Iterator[ArtifactStore]:
+    """
+    Use a different store within a block. The store is local to the current
+    thread or asyncio task.
+
+    >>> with artefacts.state.use(artefacts.state.ArtifactStore()) as store:
+    ...     result = artefacts.state.set('myitem', {'a': 1})
+    >>> store.get('myitem')
+    {'a': 1}
+
+    """
+
+    token = _current.set(store)
+    try:
+        yield store
+    finally:
+        _current.reset(token)
+
+
+def set(
+    key: str,
+    value: typing.Any,
+    fingerprint: typing.Any = None,
+    target_dir: str = None,
+) -> typing.Union[typing.Any, None]:
     """
-    Places an object in the store.
+    Places an object in the store. The `fingerprint` identifies the version of
+    the file the object was loaded from.
 
     >>> artefacts.state.set('myitem', {'a': 1})
     {'a': 1}
 
     """
 
-    _state[key] = value
-    return _state[key]
+    return current().set(key, value, fingerprint=fingerprint, target_dir=target_dir)
 
 
-def get(key: str) -> typing.Union[typing.Any, None]:
+def get(key: str, target_dir: str = None) -> typing.Union[typing.Any, None]:
     """
     Returns an object from the store, if it exists.
 
@@ -43,18 +267,54 @@ def get(key: str) -> typing.Union[typing.Any, None]:
 
     """
 
-    return _state.get(key)
+    return current().get(key, target_dir=target_dir)
 
 
-def exists(key: str) -> bool:
+def fingerprint(key: str, target_dir: str = None) -> typing.Any:
     """
-    Returns `True` if the key exists in the store.
+    Returns the fingerprint the object was stored with, if any.
 
-    >>> result = artefacts.state.set('myitem', {'a': 1})
+    >>> result = artefacts.state.set('myitem', {'a': 1}, fingerprint=1)
+    >>> artefacts.state.fingerprint('myitem')
+    1
+
+    """
+
+    return current().fingerprint(key, target_dir=target_dir)
+
+
+def exists(key: str, fingerprint: typing.Any = None, target_dir: str = None) -> bool:
+    """
+    Returns `True` if the key exists in the store. If a `fingerprint` is
+    passed, the object must also have been stored with the same fingerprint.
+
+    >>> result = artefacts.state.set('myitem', {'a': 1}, fingerprint=1)
     >>> artefacts.state.exists('myitem')
     True
+    >>> artefacts.state.exists('myitem', fingerprint=2)
+    False
     >>> artefacts.state.exists('thisdoesnotexist')
     False
 
     """
-    return key in _state
+
+    return current().exists(key, fingerprint=fingerprint, target_dir=target_dir)
+
+
+def get_or_load(
+    key: str,
+    load: typing.Callable[[], typing.Any],
+    fingerprint: typing.Any = None,
+    target_dir: str = None,
+) -> typing.Any:
+    """
+    Returns an object from the store, loading it with `load` if necessary.
+
+    >>> artefacts.state.get_or_load('anotheritem', lambda: {'b': 2})
+    {'b': 2}
+
+    """
+
+    return current().get_or_load(
+        key, load, fingerprint=fingerprint, target_dir=target_dir
+    )
@@ -0,0 +1,289 @@
+"""
+artefacts.trusted
+=================
+
+Builds the models of an artifact without validating it, for artifacts that
+were written by dbt and are already valid.
+
+When the :code:`trusted` option is enabled, artifacts are built with
+:func:`construct` instead of pydantic's :code:`parse_obj`. The raw values are
+converted to the types of the model's fields, so nested models, the
+:code:`ManifestNode` union, field aliases like :code:`schema` and node
+references are built in the same way as when the artifact is validated, and
+the attributes of the models are the same. Values are not checked against the
+models' types though, so an invalid artifact may build models with invalid
+attributes instead of raising a :code:`ValidationError`.
+
+The values that can't be converted without validation, like datetimes, and
+fields with validators of their own, like the manifest's metadata, are still
+validated.
+
+>>> from artefacts.loaders import FileSystemLoader
+>>> from artefacts.models import ManifestModel
+>>> from artefacts.trusted import construct
+>>> raw = FileSystemLoader(config=artefacts.Config()).load('manifest')
+>>> manifest = construct(ManifestModel, raw)
+>>> {type(node).__name__ for node in manifest.iter_resource_type('model')}
+{'ManifestModelNode'}
+>>> nodes = manifest.nodes.values()
+>>> all(node.db_schema == raw['nodes'][node.unique_id]['schema'] for node in nodes)
+True
+>>> {type(p).__name__ for parents in manifest.parent_map.values() for p in parents}
+{'ManifestNodeReference'}
+
+"""
+
+import datetime
+import threading
+import typing
+
+import pydantic
+from pydantic.fields import MAPPING_LIKE_SHAPES, SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.typing import all_literal_values, is_literal_type
+
+Converter = typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+"""Converts a raw value to the type of a field. `None` when raw values don't
+need to be converted, so containers of them can be used as they are."""
+
+_UNCONVERTED_TYPES = {dict, list, typing.Any, object}
+
+_SCALAR_TYPES = {str, int, float, bool}
+
+_builders: typing.Dict[type, typing.Callable[[typing.Any], typing.Any]] = dict()
+_builders_lock = threading.RLock()
+
+
+def _validated(field, model) -> Converter:
+    def validate(value):
+        validated, error = field.validate(value, {}, loc=field.alias, cls=model)
+        if error:
+            raise pydantic.ValidationError([error], model)
+        return validated
+
+    return validate
+
+
+def _datetime(field, model) -> Converter:
+    validate = _validated(field, model)
+
+    # ISO 8601 strings, like the timestamps that dbt writes, are parsed by
+    # the standard library, which is much faster than pydantic's parser
+    def parse(value):
+        if type(value) is str:
+            try:
+                if value.endswith("Z"):
+                    return datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+                return datetime.datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        return validate(value)
+
+    return parse
+
+
+def _optional(field, convert: Converter, model) -> Converter:
+    if convert is None or not field.allow_none:
+        return convert
+
+    def optional(value):
+        return None if value is None else convert(value)
+
+    return optional
+
+
+def _model_type(field) -> typing.Optional[type]:
+    if isinstance(field.type_, type) and issubclass(field.type_, pydantic.BaseModel):
+        return field.type_
+    return None
+
+
+def _implicit_discriminator(sub_fields) -> typing.Optional[str]:
+    # A union of models that each have a different literal value for a field,
+    # like the resource_type of the manifest's nodes, is converted as if the
+    # field was its discriminator.
+    models = [_model_type(f) for f in sub_fields]
+    if not all(models):
+        return None
+    for name in models[0].__fields__:
+        values = list()
+        for model in models:
+            field = model.__fields__.get(name)
+            if field is None or not is_literal_type(field.outer_type_):
+                break
+            values.extend(all_literal_values(field.outer_type_))
+        else:
+            if len(values) == len(set(values)):
+                return name
+    return None
+
+
+def _discriminated(field, model) -> Converter:
+    if field.discriminator_key is not None:
+        key = field.discriminator_alias
+        mapping = dict(field.sub_fields_mapping)
+    else:
+        name = _implicit_discriminator(field.sub_fields)
+        if name is None:
+            return _validated(field, model)
+        mapping = dict()
+        for sub_field in field.sub_fields:
+            discriminator = _model_type(sub_field).__fields__[name]
+            key = discriminator.alias
+            for value in all_literal_values(discriminator.outer_type_):
+                mapping[value] = sub_field
+
+    builders = {value: _builder(_model_type(f)) for value, f in mapping.items()}
+    validate = _validated(field, model)
+
+    def discriminated(value):
+        try:
+            return builders[value[key]](value)
+        except (KeyError, TypeError):  # Let pydantic report the error
+            return validate(value)
+
+    return discriminated
+
+
+def _scalar_type(field) -> typing.Optional[type]:
+    if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+        if field.type_ in _SCALAR_TYPES and not field.class_validators:
+            return field.type_
+    return None
+
+
+def _converter(field, model) -> Converter:
+    if field.class_validators:
+        return _validated(field, model)
+
+    if field.shape == SHAPE_LIST:
+        item = _converter(field.sub_fields[0], model)
+        if item is None:
+            return None
+        scalar_type = _scalar_type(field.sub_fields[0])
+        if scalar_type is not None:
+            # Lists of scalars, like tags, are only copied when they need to
+            # be coerced
+            def scalars(value):
+                if all(type(v) is scalar_type for v in value):
+                    return value
+                return [item(v) for v in value]
+
+            return _optional(field, scalars, model)
+        return _optional(field, lambda value: [item(v) for v in value], model)
+
+    if field.shape in MAPPING_LIKE_SHAPES:
+        item = _converter(field.sub_fields[0], model)
+        if item is None:
+            return None
+        return _optional(
+            field, lambda value: {k: item(v) for k, v in value.items()}, model
+        )
+
+    if field.shape != SHAPE_SINGLETON:
+        return _validated(field, model)
+
+    if field.sub_fields:  # A union
+        return _optional(field, _discriminated(field, model), model)
+
+    type_ = field.type_
+    if type_ in _UNCONVERTED_TYPES or is_literal_type(type_):
+        return None
+    if type_ in _SCALAR_TYPES:
+        # Values of the wrong type, like booleans in a string field, are
+        # coerced by pydantic
+        validate = _validated(field, model)
+
+        def scalar(value):
+            return value if type(value) is type_ else validate(value)
+
+        return _optional(field, scalar, model)
+    if type_ is datetime.datetime:
+        return _optional(field, _datetime(field, model), model)
+    if _model_type(field) is not None:
+        return _optional(field, _builder(type_), model)
+
+    # Custom types, like ManifestNodeReference, are built by their own
+    # validators
+    if hasattr(type_, "__get_validators__") and not field.pre_validators:
+        validators = list(type_.__get_validators__())
+        if len(validators) == 1:
+            custom, validate = validators[0], _validated(field, model)
+
+            def custom_type(value):
+                try:
+                    return custom(value)
+                except (TypeError, ValueError, AssertionError):
+                    return validate(value)  # Let pydantic report the error
+
+            return _optional(field, custom_type, model)
+
+    return _validated(field, model)
+
+
+_MISSING = object()
+
+
+def _builder(model: typing.Type[pydantic.BaseModel]):
+    if model in _builders:
+        return _builders[model]
+
+    if model.__pre_root_validators__ or model.__post_root_validators__:
+        _builders[model] = model.parse_obj
+        return model.parse_obj
+
+    # The builder is registered before its fields are converted, so models
+    # that contain themselves can be built
+    fields: typing.List[tuple] = list()
+    names = frozenset(model.__fields__)
+    private = bool(model.__private_attributes__)
+    new = model.__new__
+    set_attribute = object.__setattr__
+
+    # Like `model.construct`, without the overhead of its keyword arguments.
+    # Values that need no conversion, like strings in a string field or
+    # nulls in an optional field, are used as they are.
+    def build(value):
+        if type(value) is not dict:
+            return model.validate(value)
+        get = value.get
+        values = dict()
+        missing = frozenset()
+        for name, alias, expected, nullable, convert, field in fields:
+            raw = get(alias, _MISSING)
+            if raw is _MISSING:
+                missing |= {name}
+                if not field.required:
+                    values[name] = field.get_default()
+            elif convert is None or type(raw) is expected:
+                values[name] = raw
+            elif raw is None and nullable:
+                values[name] = None
+            else:
+                values[name] = convert(raw)
+        instance = new(model)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__fields_set__", set(names - missing))
+        if private:
+            instance._init_private_attributes()
+        return instance
+
+    _builders[model] = build
+    for name, field in model.__fields__.items():
+        convert = _converter(field, model)
+        expected = _scalar_type(field)
+        fields.append((name, field.alias, expected, field.allow_none, convert, field))
+    return build
+
+
+def construct(model: typing.Type[pydantic.BaseModel], obj: dict):
+    """Build a model from a raw artifact without validating it.
+
+    Args:
+        model: The model of the artifact, like :code:`ManifestModel`.
+        obj (dict): The decoded JSON of the artifact.
+    """
+
+    # Builders are created once per model, and are only used once complete
+    with _builders_lock:
+        build = _builder(model)
+    return build(obj)
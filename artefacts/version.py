@@ -1,3 +1,9 @@
-import pkg_resources
+try:
+    from importlib.metadata import version
+except ImportError:  # pragma: no cover
+    # importlib.metadata was added in Python 3.8
+    from pkg_resources import get_distribution
 
-__version__ = pkg_resources.get_distribution("artefacts").version
+    __version__ = get_distribution("artefacts").version
+else:
+    __version__ = version("artefacts")
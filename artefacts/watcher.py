@@ -0,0 +1,136 @@
+"""
+artefacts.watcher
+=================
+
+Reloads the artifacts held in :mod:`artefacts.state` in a background thread
+when their files change on disk, so a long running process picks up the
+results of a new dbt invocation without blocking on the reparse.
+
+>>> from artefacts.watcher import ArtifactWatcher
+>>> with ArtifactWatcher(interval=0.1):
+...     manifest = artefacts.Manifest()
+
+"""
+
+import logging
+import threading
+import typing
+
+import artefacts.state
+from .loaders import FileSystemLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactWatcher:
+    """Polls the files of the loaded artifacts, and re-parses any that changed.
+
+    A changed file is only re-parsed once its fingerprint has been stable for
+    one polling interval, to avoid reading a file that dbt is still writing.
+    The new artifact is parsed in the watcher's thread and then swapped into
+    :mod:`artefacts.state` in a single assignment, so readers either see the
+    old artifact or the new one.
+
+    The artifacts of every target directory in the store are watched, and are
+    reloaded with the store's config for their target directory.
+
+    Args:
+        interval (float): The number of seconds between each check.
+        Loader: The loader class used for fingerprinting and re-parsing.
+        store (ArtifactStore): The store to watch. Defaults to the current store.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        Loader=FileSystemLoader,
+        store: artefacts.state.ArtifactStore = None,
+    ):
+        self.interval = interval
+        self.Loader = Loader
+        self.store = store or artefacts.state.current()
+        self._pending: typing.Dict[artefacts.state.StoreKey, typing.Any] = dict()
+        self._stopped = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @staticmethod
+    def deserializers():
+        from .deserializers import ARTIFACT_DESERIALIZERS
+
+        return list(ARTIFACT_DESERIALIZERS.values())
+
+    def check(self) -> typing.List[str]:
+        """Reload any loaded artifacts whose files have changed since they were
+        loaded, and return the names of the reloaded artifacts."""
+
+        with artefacts.state.use(self.store):
+            return self._check()
+
+    def _check(self) -> typing.List[str]:
+        reloaded = list()
+        for Artifact in self.deserializers():
+            name = Artifact.artifact_name
+            target_dirs = [t for t, key in self.store if key == name]
+            for target_dir in target_dirs:
+                if self._reload(Artifact, target_dir):
+                    reloaded.append(name)
+        return reloaded
+
+    def _reload(self, Artifact, target_dir: str) -> bool:
+        from .mixins import bind_target_dir
+
+        name = Artifact.artifact_name
+        key = (target_dir, name)
+        config = Artifact.config_for_target_dir(target_dir)
+        fingerprint = Artifact.fingerprint(Loader=self.Loader, config=config)
+        if fingerprint is None or self.store.exists(
+            name, fingerprint, target_dir=target_dir
+        ):
+            self._pending.pop(key, None)
+            return False
+
+        if self._pending.get(key) != fingerprint:
+            self._pending[key] = fingerprint
+            return False
+
+        try:
+            artifact = Artifact.deserialize(Loader=self.Loader, config=config)
+        except Exception:
+            logger.exception(f"Failed to reload the {name} artifact in {target_dir}")
+            return False
+
+        bind_target_dir(artifact, target_dir)
+        self.store.set(name, artifact, fingerprint=fingerprint, target_dir=target_dir)
+        self._pending.pop(key, None)
+        logger.info(f"Reloaded the {name} artifact in {target_dir}")
+        return True
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def start(self) -> "ArtifactWatcher":
+        """Start watching in a daemon thread."""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="artefacts-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching, and wait for the thread to exit."""
+
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,164 @@
+"""
+Generates synthetic dbt artifacts of any size by copying the resources of an
+existing project's artifacts, like poffertjes_shop or jaffle_shop.
+
+    $ python benchmarks/generate.py --nodes 10000 --output-dir /tmp/target-10k
+
+Each copy of the project's nodes gets a suffix on its unique_id and name, and
+keeps the dependencies of the original nodes within the copy. The models of
+each copy also depend on the same model in an earlier copy, so the DAG grows
+deeper as well as wider. The run_results and catalog artifacts get a result
+and an entry for each copied node, and the other resources are kept as they
+are.
+
+>>> import tempfile
+>>> from artefacts.config import Config
+>>> from artefacts.deserializers import Manifest
+>>> output_dir = tempfile.mkdtemp()
+>>> nodes = scale_artifacts(Config().dbt_target_dir, output_dir, nodes=30)
+>>> manifest = Manifest.deserialize(
+...     config=Config(dbt_project_dir=output_dir, dbt_target_dir=".")
+... )
+>>> len(manifest.nodes) == nodes >= 30
+True
+
+"""
+
+import argparse
+import json
+import math
+import os
+
+from artefacts.config import Config
+from artefacts.loaders import FileSystemLoader
+
+ARTIFACT_NAMES = ["manifest", "run_results", "catalog", "sources"]
+
+
+def _load(source_dir, artifact_name):
+    config = Config(dbt_project_dir=source_dir, dbt_target_dir=".")
+    try:
+        return FileSystemLoader(config=config).load(artifact_name)
+    except FileNotFoundError:
+        return None
+
+
+def _rename(value, renames):
+    # Also copies the value, so that the copies don't share containers
+    if isinstance(value, str):
+        return renames.get(value, value)
+    if isinstance(value, dict):
+        return {k: _rename(v, renames) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_rename(v, renames) for v in value]
+    return value
+
+
+def _suffix(copy):
+    return f"_{copy}" if copy else ""
+
+
+def _copy_node(node, renames, copy):
+    node = _rename(node, renames)
+    suffix = _suffix(copy)
+    for key in ["name", "alias"]:
+        if node.get(key):
+            node[key] += suffix
+    if node.get("fqn"):
+        node["fqn"][-1] += suffix
+    return node
+
+
+def _scale_manifest(manifest, copies):
+    nodes = manifest["nodes"]
+    parent_map = manifest.get("parent_map") or dict()
+    scaled_nodes, scaled_parent_map, renames_by_copy = dict(), dict(), list()
+
+    for copy in range(copies):
+        renames = {u: u + _suffix(copy) for u in nodes}
+        renames_by_copy.append(renames)
+        # Each copy also depends on a copy before it, so the depth of the
+        # graph grows logarithmically with the number of copies
+        upstream = renames_by_copy[(copy - 1) // 2] if copy else dict()
+
+        for unique_id, node in nodes.items():
+            copied = _copy_node(node, renames, copy)
+            parents = _rename(parent_map.get(unique_id, []), renames)
+            if upstream and node.get("resource_type") == "model":
+                parents.append(upstream[unique_id])
+                depends_on = copied.setdefault("depends_on", dict())
+                depends_on.setdefault("nodes", []).append(upstream[unique_id])
+            scaled_nodes[renames[unique_id]] = copied
+            scaled_parent_map[renames[unique_id]] = parents
+
+    # Resources other than nodes are not copied
+    for unique_id, parents in parent_map.items():
+        scaled_parent_map.setdefault(unique_id, parents)
+
+    child_map = {unique_id: [] for unique_id in scaled_parent_map}
+    for unique_id, parents in scaled_parent_map.items():
+        for parent in parents:
+            child_map.setdefault(parent, []).append(unique_id)
+
+    scaled = dict(manifest)
+    scaled.update(nodes=scaled_nodes, parent_map=scaled_parent_map)
+    scaled["child_map"] = child_map
+    return scaled, renames_by_copy
+
+
+def _scale_run_results(run_results, renames_by_copy):
+    results = list()
+    for renames in renames_by_copy:
+        for result in run_results["results"]:
+            results.append(_rename(result, renames))
+    return dict(run_results, results=results)
+
+
+def _scale_catalog(catalog, renames_by_copy):
+    nodes = dict()
+    for copy, renames in enumerate(renames_by_copy):
+        for unique_id, node in catalog["nodes"].items():
+            copied = _rename(node, renames)
+            copied["metadata"]["name"] += _suffix(copy)
+            nodes[renames.get(unique_id, unique_id)] = copied
+    return dict(catalog, nodes=nodes)
+
+
+def scale_artifacts(source_dir: str, output_dir: str, nodes: int) -> int:
+    """Write artifacts with at least `nodes` nodes to `output_dir`, based on
+    the artifacts in `source_dir`, and return the number of nodes written."""
+
+    manifest = _load(source_dir, "manifest")
+    copies = max(1, math.ceil(nodes / max(1, len(manifest["nodes"]))))
+    manifest, renames_by_copy = _scale_manifest(manifest, copies)
+
+    artifacts = {"manifest": manifest, "sources": _load(source_dir, "sources")}
+    run_results = _load(source_dir, "run_results")
+    if run_results is not None:
+        artifacts["run_results"] = _scale_run_results(run_results, renames_by_copy)
+    catalog = _load(source_dir, "catalog")
+    if catalog is not None:
+        artifacts["catalog"] = _scale_catalog(catalog, renames_by_copy)
+
+    os.makedirs(output_dir, exist_ok=True)
+    for artifact_name in ARTIFACT_NAMES:
+        if artifacts.get(artifact_name) is not None:
+            path = os.path.join(output_dir, f"{artifact_name}.json")
+            with open(path, "w") as fh:
+                json.dump(artifacts[artifact_name], fh)
+    return len(manifest["nodes"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source-dir", default=Config().dbt_target_dir)
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--nodes", type=int, default=10000)
+    args = parser.parse_args()
+
+    nodes = scale_artifacts(args.source_dir, args.output_dir, args.nodes)
+    print(f"Wrote artifacts with {nodes} nodes to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
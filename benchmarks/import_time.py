@@ -0,0 +1,58 @@
+"""
+Measures the time it takes to import artefacts in a new interpreter, for the
+CLI tools and serverless functions that import it on every start.
+
+    $ python benchmarks/import_time.py
+
+`import artefacts` only imports the package itself, and the models, pydantic
+and the config are imported when an artifact or the config is first used. The
+later statements measure the cost of those imports.
+
+"""
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import artefacts",
+    "from artefacts import Config",
+    "from artefacts import Manifest",
+    "import artefacts.api",
+]
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(statement, repeat):
+    timings = list()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        seconds = time_import(statement, args.repeat)
+        print(f"{statement:<36}{seconds * 1000:>10.1f}ms")
+
+    print(f"\nMinimum of {args.repeat} imports in new interpreters.")
+
+
+if __name__ == "__main__":
+    main()
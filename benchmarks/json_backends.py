@@ -0,0 +1,63 @@
+"""
+Compares the time it takes each installed JSON backend to load the artifacts
+in a target directory.
+
+    $ python benchmarks/json_backends.py --target-dir path/to/target
+
+"""
+
+import argparse
+import importlib
+import os
+import time
+
+from artefacts.config import Config
+from artefacts.loaders import JSON_BACKENDS, FileSystemLoader
+
+
+def installed_backends():
+    for name in JSON_BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        yield name
+
+
+def time_load(loader, artifact_name, repeat):
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader.load(artifact_name)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target-dir", default=Config().dbt_target_dir)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    target_dir = os.path.abspath(args.target_dir)
+    config = dict(dbt_project_dir=target_dir, dbt_target_dir=".")
+    backends = list(installed_backends())
+
+    print(f"{'artifact':<14}{'size (MB)':>10}" + "".join(f"{b:>12}" for b in backends))
+    for artifact_name in ["manifest", "run_results", "catalog", "sources"]:
+        path = os.path.join(target_dir, f"{artifact_name}.json")
+        if not os.path.exists(path):
+            continue
+
+        row = f"{artifact_name:<14}{os.path.getsize(path) / 2**20:>10.1f}"
+        for backend in backends:
+            loader = FileSystemLoader(config=Config(json_backend=backend, **config))
+            seconds = time_load(loader, artifact_name, args.repeat)
+            row += f"{seconds * 1000:>10.1f}ms"
+        print(row)
+
+    print(f"\nMinimum of {args.repeat} loads per backend.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Measures the import time of artefacts, and the load time, peak memory and
+query latency of artifacts with 1,000, 10,000 and 100,000 nodes, and compares
+the results with a previous run.
+
+    $ python benchmarks/suite.py --sizes 1000 10000
+    $ python benchmarks/suite.py --compare .benchmarks/20240101T120000.json
+
+The artifacts of each size are generated from the project's artifacts with
+benchmarks/generate.py, and are reused by later runs. Each artifact is
+deserialized, and the :code:`ManifestModel.resources` and
+:code:`iter_resource_type` lookups and every function in :code:`artefacts.api`
+are timed against the generated project. The results are written to a JSON
+file in the results directory, named after the time of the run. The import
+time is measured as in benchmarks/import_time.py.
+
+Config options, like :code:`--option lazy_load=true`, are applied to every
+artifact, so the options can be compared with each other as well.
+
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import artefacts.api
+import artefacts.state
+from artefacts.config import Config
+from artefacts.deserializers import Catalog, Manifest, RunResults, Sources
+from artefacts.state import ArtifactStore
+from artefacts.version import __version__
+
+from generate import scale_artifacts
+from import_time import STATEMENTS, time_import
+
+DESERIALIZERS = [Manifest, RunResults, Catalog, Sources]
+
+API_FUNCTIONS = [
+    "models",
+    "tests",
+    "seeds",
+    "snapshots",
+    "operations",
+    "sources",
+    "analyses",
+    "docs",
+    "macros",
+    "exposures",
+    "metrics",
+    "selectors",
+    "select",
+    "tags",
+]
+
+
+def time_call(func, repeat):
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_load(config, repeat):
+    results = dict()
+    for Artifact in DESERIALIZERS:
+        if not os.path.exists(
+            os.path.join(config.dbt_target_dir, f"{Artifact.artifact_name}.json")
+        ):
+            continue
+
+        def load():
+            return Artifact.deserialize(config=config)
+
+        results[Artifact.artifact_name] = {
+            "seconds": time_call(load, repeat),
+            "peak_bytes": peak_memory(load),
+        }
+    return results
+
+
+def bench_queries(config, repeat):
+    results = dict()
+    with artefacts.state.use(ArtifactStore()):
+        artefacts.state.set("config", config)
+        manifest = Manifest()
+
+        def resources():
+            manifest._index = None
+            return manifest.resources
+
+        def iter_resource_type():
+            manifest._index = None
+            return list(manifest.iter_resource_type("model"))
+
+        results["ManifestModel.resources"] = time_call(resources, repeat)
+        results["ManifestModel.iter_resource_type"] = time_call(
+            iter_resource_type, repeat
+        )
+
+        # The api functions reuse the stored manifest and its index, like
+        # repeated calls in an application would
+        for name in API_FUNCTIONS:
+            func = getattr(artefacts.api, name)
+            results[f"api.{name}"] = time_call(func, repeat)
+    return results
+
+
+def run(sizes, source_dir, work_dir, repeat, options):
+    results = {
+        "artefacts_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "started_at": datetime.datetime.now().isoformat(),
+        "repeat": repeat,
+        "options": options,
+        "imports": {s: time_import(s, repeat) for s in STATEMENTS},
+        "sizes": dict(),
+    }
+    for size in sizes:
+        target_dir = os.path.join(work_dir, f"nodes-{size}")
+        if not os.path.exists(os.path.join(target_dir, "manifest.json")):
+            print(f"Generating artifacts with {size} nodes in {target_dir}")
+            scale_artifacts(source_dir, target_dir, size)
+
+        config = Config(dbt_project_dir=target_dir, dbt_target_dir=".", **options)
+        print(f"Benchmarking artifacts with {size} nodes")
+        results["sizes"][str(size)] = {
+            "load": bench_load(config, repeat),
+            "queries": bench_queries(config, repeat),
+        }
+    return results
+
+
+def flatten(results):
+    rows = dict()
+    for statement, seconds in results.get("imports", dict()).items():
+        rows[("", statement, "ms")] = seconds * 1000
+    for size, result in results["sizes"].items():
+        for artifact_name, load in result["load"].items():
+            rows[(size, f"load.{artifact_name}", "ms")] = load["seconds"] * 1000
+            rows[(size, f"peak.{artifact_name}", "MB")] = load["peak_bytes"] / 2**20
+        for name, seconds in result["queries"].items():
+            rows[(size, name, "ms")] = seconds * 1000
+    return rows
+
+
+def report(results, previous=None):
+    rows = flatten(results)
+    previous_rows = flatten(previous) if previous else dict()
+
+    header = f"{'nodes':>8}  {'benchmark':<36}{'value':>12}"
+    print("\n" + header + (f"{'previous':>12}{'change':>9}" if previous else ""))
+    for (size, name, unit), value in rows.items():
+        row = f"{size:>8}  {name:<36}{value:>10.2f}{unit}"
+        if (size, name, unit) in previous_rows:
+            before = previous_rows[(size, name, unit)]
+            change = (value - before) / before * 100 if before else 0.0
+            row += f"{before:>10.2f}{unit}{change:>+8.1f}%"
+        print(row)
+
+
+def parse_options(options):
+    parsed = dict()
+    for option in options:
+        key, _, value = option.partition("=")
+        parsed[key] = value
+    return parsed
+
+
+def latest_results(results_dir):
+    if not os.path.isdir(results_dir):
+        return None
+    paths = sorted(p for p in os.listdir(results_dir) if p.endswith(".json"))
+    return os.path.join(results_dir, paths[-1]) if paths else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--source-dir", default=Config().dbt_target_dir)
+    parser.add_argument(
+        "--work-dir", default=os.path.join(tempfile.gettempdir(), "artefacts-bench")
+    )
+    parser.add_argument("--results-dir", default=".benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--option", action="append", default=[], help="A config option, as KEY=VALUE"
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const="latest",
+        help="A previous results file to compare with. Defaults to the latest.",
+    )
+    args = parser.parse_args()
+
+    compare = args.compare
+    if compare == "latest":
+        compare = latest_results(args.results_dir)
+    previous = None
+    if compare:
+        with open(compare) as fh:
+            previous = json.load(fh)
+
+    results = run(
+        args.sizes,
+        os.path.abspath(args.source_dir),
+        args.work_dir,
+        args.repeat,
+        parse_options(args.option),
+    )
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    path = os.path.join(args.results_dir, f"{timestamp}.json")
+    with open(path, "w") as fh:
+        json.dump(results, fh, indent=2)
+
+    report(results, previous)
+    print(f"\nMinimum of {args.repeat} runs. Results written to {path}")
+    if compare:
+        print(f"Compared with {compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+Search.setIndex({"docnames": ["alternatives", "api", "config", "index", "reference"], "filenames": ["alternatives.rst", "api.rst", "config.rst", "index.rst", "reference.rst"], "titles": ["Alternatives", "API", "Configuration", "artefacts", "Reference"], "terms": {"artefact": [0, 1, 2, 4], "i": [0, 1, 2, 3, 4], "built": [0, 4], "top": 0, "artifact": [0, 1, 2, 3, 4], "1": [0, 1, 2, 3], "2": [0, 1, 2, 4], "so": [0, 1, 2, 4], "ar": [0, 1, 2, 3, 4], "sever": [0, 1, 2, 3, 4], "trade": [0, 3], "off": [0, 3], "compar": [0, 1, 2, 4], "other": [0, 1, 2, 3, 4], "approach": 0, "work": [0, 2, 4], "your": [0, 2, 3], "project": [0, 1, 2, 3, 4], "we": [0, 3], "discuss": [0, 3, 4], "some": [0, 4], "associ": 0, "those": [0, 2], "below": 0, "The": [0, 1, 2, 3, 4], "librari": [0, 1, 2, 3, 4], "like": [0, 1, 2, 4], "better": 0, "long": [0, 2], "term": 0, "solut": 0, "alreadi": [0, 1, 4], "being": [0, 4], "fal": 0, "But": 0, "current": [0, 2, 4], "doe": 0, "provid": [0, 3], "first": [0, 2, 4], "class": [0, 1, 4], "support": [0, 2, 4], "python": [0, 2, 3], "interact": [0, 1], "3": 0, "lack": 0, "mean": 0, "document": [0, 1, 3, 4], "variou": [0, 1, 3, 4], "object": [0, 1, 2, 3, 4], "expos": [0, 3], "you": [0, 2, 4], "ll": 0, "need": 0, "read": [0, 1, 2, 4], "understand": 0, "complex": 0, "sourc": [0, 1, 4], "code": [0, 2], "accomplish": 0, "simpl": [0, 3], "task": 0, "iter": [0, 1, 4], "over": [0, 4], "model": [0, 1, 2, 3, 4], "also": [0, 2, 4], "mani": [0, 2, 4], "conveni": 0, "method": [0, 1, 3, 4], "publish": 0, "while": [0, 4], "possibl": 0, "same": [0, 1, 2, 4], "hope": 0, "make": [0, 3, 4], "easier": [0, 3], "eventu": 0, "expect": 0, "featur": [0, 3], "progress": 0, "lib": 0, "supplant": 0, "benefit": 0, "3rd": 0, "parti": 0, "until": [0, 2, 4], "fulli": 0, "releas": 0, "feel": 0, "can": [0, 2, 4], "analyt": 0, "engin": 0, "want": 0, "start": [0, 2, 3, 4], "build": [0, 1, 2, 3, 4], "new": [0, 1, 2, 4], "function": [0, 3, 4], "todai": 0, "anoth": 0, "wai": [0, 4], "programmat": 0, "avail": [0, 1, 2, 4], "thi": [0, 2, 4], "taken": 0, "packag": [0, 1, 2, 4], "includ": [0, 1, 3, 4], "dbt_meta_test": 0, "contain": [0, 1, 4], "graph": [0, 4], "which": [0, 1, 2, 4], "identifi": [0, 4], "miss": 0, "often": 0, "more": [0, 1, 4], "than": [0, 1, 4], "might": 0, "seem": 0, "follow": [0, 2], "two": [0, 1], "exampl": [0, 2, 3, 4], "both": [0, 4], "print": 0, "specif": [0, 4], "have": [0, 2, 3, 4], "an": [0, 1, 2, 3, 4], "increment": 0, "materi": 0, "execut": [0, 1], "node": [0, 1, 2, 4], "valu": [0, 1, 2, 4], "selectattr": 0, "resource_typ": [0, 1, 4], "equalto": 0, "package_nam": [0, 1, 4], "snowplow": 0, "do": 0, "log": [0, 2, 4], "unique_id": [0, 1, 4], "config": [0, 1, 2, 4], "info": 0, "true": [0, 1, 2, 4], "endfor": 0, "endif": 0, "import": [0, 1, 2, 3], "api": [0, 3], "tabl": [0, 1, 4], "f": 0, "embed": 0, "languag": 0, "fantast": 0, "write": [0, 4], "sql": [0, 4], "macro": [0, 1, 2, 4], "challeng": 0, "moder": 0, "case": 0, "maintain": 0, "program": 0, "last": [0, 2, 4], "raw": [0, 1, 2, 4], "directli": 0, "pars": [0, 1, 2, 4], "open": 0, "target": [0, 1, 2, 4], "manifest": [0, 1, 2, 4], "fh": 0, "abov": 0, "dictionari": [0, 1, 2, 4], "probabl": 0, "simplest": 0, "script": 0, "A": [0, 1, 2, 3, 4], "deseri": [0, 1, 2, 3], "essenti": 0, "extend": 0, "convert": [0, 2], "full": [0, 3, 4], "trivial": 0, "perform": [0, 4], "travers": 0, "For": [0, 2], "easili": 0, "pull": 0, "data": [0, 2, 4], "from": [0, 1, 2, 4], "catalog": [0, 1, 2, 4], "0": [0, 1, 2, 3, 4], "column_nam": 0, "column_detail": 0, "column": [0, 1, 2, 4], "item": 0, "node_typ": [0, 4], "footnot": 0, "see": [0, 2, 3, 4], "detail": [0, 3, 4], "about": [0, 3, 4], "type": [0, 1, 2, 4], "how": [0, 2, 3, 4], "thei": [0, 2, 4], "gener": [0, 2, 4], "http": [0, 2, 4], "doc": [0, 1, 4], "getdbt": [0, 4], "com": [0, 2, 4], "refer": [0, 1, 2, 3], "find": [0, 2], "quick": 0, "intro": 0, "excel": 0, "blog": 0, "post": 0, "guitton": 0, "io": 0, "schema": [0, 2, 4], "note": [0, 4], "run": [0, 1, 2, 4], "helper": 1, "dbt": [1, 2, 3, 4], "": [1, 2, 3, 4], "none": [1, 2, 4], "include_dis": [1, 4], "fals": [1, 2, 4], "list": [1, 2, 3, 4], "all": [1, 2, 3, 4], "arg": [1, 4], "str": [1, 4], "onli": [1, 2, 4], "return": [1, 2, 3, 4], "specifi": [1, 4], "default": [1, 2, 4], "bool": [1, 4], "disabl": [1, 2, 4], "manifestmodelnod": [1, 4], "union": [1, 4], "manifesttestnod": [1, 4], "manifestoperationnod": [1, 4], "manifestsnapshotnod": [1, 4], "manifestseednod": [1, 4], "manifestanalysisnod": [1, 4], "test": [1, 2, 3, 4], "seed": [1, 4], "snapshot": [1, 4], "oper": [1, 4], "manifestsourcenod": [1, 4], "analys": [1, 4], "analysi": [1, 4], "manifestdocsnod": [1, 4], "manifestmacronod": [1, 4], "exposur": [1, 4], "defin": [1, 4], "manifestexposurenod": [1, 4], "metric": [1, 4], "manifestmetricnod": [1, 4], "selector": [1, 4], "dict": [1, 4], "tag": [1, 2, 4], "map": [1, 2, 4], "resourc": [1, 2, 4], "intern": [1, 2], "through": [2, 4], "environ": 2, "variabl": 2, "pyproject": 2, "toml": 2, "file": [1, 2, 4], "pass": [2, 4], "each": [1, 2, 4], "If": [1, 2, 4], "set": [2, 3, 4], "multipl": 2, "locat": [2, 4], "select": [1, 2, 4], "order": [2, 4], "when": [1, 2, 4], "us": [1, 2, 3, 4], "usag": [2, 3], "continu": 2, "In": 2, "word": 2, "befor": [2, 4], "time": [1, 2, 4], "cannot": [1, 2, 4], "chang": [2, 4], "onc": [2, 4], "ha": [1, 2, 4], "been": [2, 4], "init": 2, "begin": 2, "artefacts_": 2, "option": [1, 2, 4], "artefacts_dbt_project_dir": 2, "directori": [1, 2, 4], "search": [2, 4], "dbt_project": 2, "poffertjes_shop": [2, 4], "export": 2, "compil": [1, 2, 4], "rel": 2, "artefacts_dbt_target_dir": 2, "pip": [2, 3], "instal": [2, 3], "aim": 3, "well": 3, "goal": 3, "linter": 3, "ci": 3, "cd": 3, "runner": 3, "notif": 3, "here": 3, "show": 3, "check": [2, 3, 4], "least": [3, 4], "assert": 3, "len": 3, "pleas": 3, "section": [2, 3, 4], "inform": 3, "There": 3, "altern": 3, "To": [2, 3], "get": [3, 4], "readm": 3, "github": [3, 4], "catalogmodel": 4, "metadata": 4, "attribut": [2, 4], "catalognod": 4, "error": [2, 4], "columninfo": 4, "name": [1, 2, 4], "descript": 4, "meta": 4, "data_typ": 4, "quot": 4, "properti": 4, "catalog_artifact": 4, "children": 4, "classmethod": 4, "construct": [1, 4], "_fields_set": 4, "creat": 4, "__dict__": 4, "__fields_set__": 4, "trust": [1, 4], "pre": 4, "valid": [1, 2, 4], "respect": 4, "behav": 4, "extra": 4, "allow": 4, "wa": [1, 2, 4], "sinc": [2, 4], "add": 4, "copi": [2, 4], "exclud": [1, 4], "updat": 4, "deep": 4, "duplic": 4, "choos": 4, "field": 4, "paramet": 4, "abstractsetintstr": 4, "mappingintstrani": 4, "take": [1, 2, 4], "preced": 4, "dictstrani": 4, "should": 4, "instanc": [2, 4], "by_alia": 4, "skip_default": 4, "exclude_unset": 4, "exclude_default": 4, "exclude_non": 4, "represent": 4, "whether": [2, 4], "freshness_check_result": 4, "ani": [1, 4], "fresh": 4, "result": [1, 4], "exist": [1, 4], "json": [1, 2, 4], "encod": 4, "models_as_dict": 4, "dumps_kwarg": 4, "argument": [1, 4], "per": [1, 4], "suppli": 4, "dump": 4, "manifest_artifact": 4, "manifestmodel": [1, 4], "parent": 4, "run_result": [1, 4], "run_results_artifact": 4, "runresult": 4, "runresultsmodel": 4, "sources_artifact": 4, "sourcesmodel": 4, "update_forward_ref": 4, "localn": 4, "try": 4, "forwardref": 4, "base": 4, "globaln": 4, "catalognodemetadata": 4, "catalognodecolumn": 4, "stat": [1, 2, 4], "catalognodestat": 4, "index": 4, "int": [1, 4], "comment": 4, "db_schema": [2, 4], "databas": 4, "owner": 4, "static": 4, "id": 4, "label": 4, "raw_dis": 4, "parent_map": [2, 4], "manifestnoderefer": 4, "child_map": [2, 4], "caveat": 4, "tjwaterman99": 4, "issu": 4, "89": 4, "iter_resource_typ": 4, "eg": [1, 4], "etc": 4, "root_path": 4, "path": [1, 2, 4], "original_filepath": 4, "block_cont": 4, "fqn": 4, "original_file_path": 4, "matur": 4, "url": 4, "ref": 4, "created_at": 4, "float": [1, 4], "depends_on": 4, "repres": 4, "raw_sql": [2, 4], "liter": 4, "alia": 4, "checksum": 4, "patch_path": 4, "compiled_path": 4, "build_path": 4, "defer": [2, 4], "unrendered_config": 4, "config_call_dict": 4, "compiled_sql": [2, 4], "extra_ctes_inject": 4, "extra_ct": 4, "relation_nam": 4, "macro_sql": 4, "macroargu": 4, "filter": 4, "metricfilt": 4, "time_grain": 4, "dimens": 4, "timestamp": [1, 4], "point": [2, 4], "source_nam": 4, "source_descript": 4, "loader": [1, 2, 4], "loaded_at_field": 4, "freshnessthreshold": 4, "extern": 4, "externalt": 4, "source_meta": 4, "sourceconfig": 4, "context": [1, 2, 4], "dbt_schema_version_raw": 4, "dbt_version_raw": 4, "generated_at": 4, "datetim": 4, "invocation_id": 4, "uuid": 4, "env": 4, "project_id": 4, "user_id": 4, "send_anonymous_usage_stat": 4, "adapter_typ": 4, "dbt_schema_vers": 4, "version": [2, 4], "dbt_version": 4, "runresultnod": 4, "statu": 4, "timingresult": 4, "thread_id": 4, "execution_tim": [1, 4], "adapter_respons": [1, 4], "messag": 4, "failur": 4, "elapsed_tim": 4, "sourcesfreshnessresult": 4, "max_loaded_at": 4, "snapshotted_at": 4, "max_loaded_at_time_ago_in_": 4, "criteria": 4, "started_at": 4, "completed_at": 4, "warn_aft": 4, "error_aft": 4, "interv": [2, 4], "configur": 4, "count": 4, "period": 4, "externalpartit": 4, "partit": 4, "file_format": 4, "row_format": 4, "tbl_properti": 4, "requir": 4, "compon": 4, "enabl": [2, 4], "access": [2, 4], "lazymap": [2, 4], "keep": [2, 4], "its": [1, 2, 4], "kei": [1, 2, 4], "greatli": 2, "reduc": 2, "load": [1, 2, 4], "larg": [1, 2], "few": 2, "artefacts_lazy_load": 2, "lazy_load": 4, "hold": 4, "onto": 4, "pydant": [2, 4], "look": 4, "up": [2, 4], "cost": 4, "never": 4, "paid": 4, "manifestindex": 4, "store": [1, 2, 4], "themselv": 4, "collect": [1, 4], "request": [2, 4], "cheap": 4, "unpars": 4, "format": [1, 4], "custom": [1, 4], "base_employe": 4, "by_resource_typ": 4, "by_package_nam": 4, "by_resource_type_and_package_nam": 4, "tupl": 4, "given": 4, "iter_unique_id": 4, "match": [1, 4], "disabled_resourc": 4, "resultsindex": 4, "belong": 4, "by_unique_id": 4, "empti": 4, "ancestor": 4, "depth": 4, "level": 4, "upstream": 4, "descend": 4, "downstream": 4, "dag": 4, "queri": 4, "shortest": 4, "topolog": 4, "direct": 4, "acycl": 4, "edg": 4, "posit": 4, "from_manifest": 4, "invers": 4, "integ": 4, "awai": 4, "shortest_path": 4, "chain": 4, "lead": 4, "down": 4, "end": 4, "topological_ord": 4, "sort": [1, 4], "everi": [1, 2, 4], "come": 4, "after": [2, 4], "consid": [], "between": [1, 2, 4], "them": [1, 2, 4], "whole": 4, "rais": [2, 4], "cycleerror": 4, "cycl": 4, "find_cycl": 4, "form": [1, 2, 4], "repeat": [2, 4], "still": [2, 4], "even": 4, "indirect_select": [1, 4], "eager": [1, 4], "syntax": [1, 4], "equival": [1, 2, 4], "nightli": 1, "model_a": 1, "yaml": [1, 4], "combin": [1, 2, 4], "either": [1, 4], "cautiou": [1, 4], "control": 1, "r": 1, "ancestors_of": 4, "descendants_of": 4, "nodeselector": 4, "evalu": 4, "against": 4, "l": 4, "state": [1, 4], "source_statu": 4, "depend": 4, "previou": 4, "string": [1, 2, 4], "space": 4, "separ": [2, 4], "whose": [1, 4], "select_selector": 4, "test_metadata": 4, "reload": [2, 4], "modif": 2, "size": [1, 2, 4], "ones": 2, "record": [2, 4], "re": [2, 4], "differ": [2, 4], "background": 2, "instead": 2, "next": 2, "artifactwatch": [2, 4], "watcher": [2, 4], "artefacts_reload_on_chang": 2, "filesystemload": [1, 4], "poll": 4, "fingerprint": 4, "stabl": 4, "one": [1, 2, 4], "avoid": 4, "thread": [1, 4], "swap": 4, "singl": [2, 4], "assign": 4, "reader": 4, "old": [1, 4], "number": [1, 2, 4], "second": [1, 2, 4], "were": 4, "watch": 4, "daemon": 4, "stop": 4, "wait": 4, "exit": 4, "artifactstor": 4, "max_siz": 4, "safe": 4, "target_dir": 4, "scope": 4, "becaus": [2, 4], "determin": 4, "get_or_load": 4, "lock": 4, "concurr": [1, 4], "parallel": 4, "maximum": 4, "recent": 4, "evict": 4, "b": 4, "place": [1, 2, 4], "doesn": 4, "t": [1, 2, 4], "must": [2, 4], "call": 4, "clear": 4, "remov": 4, "cach": [2, 4], "process": [1, 2, 4], "pickl": [2, 4], "hash": 2, "content": 2, "unchang": [1, 2], "again": [1, 2], "consider": 2, "faster": [2, 4], "unpickl": 2, "artefacts_cach": 2, "artefacts_cache_dir": 2, "artifactcach": 4, "cache_dir": 4, "It": 4, "from_config": 4, "variant": 4, "cachekei": 4, "isn": [2, 4], "replac": [2, 4], "older": 4, "entri": [1, 2, 4], "fail": 4, "load_al": 1, "artifact_nam": [1, 4], "max_work": [1, 4], "pool": [1, 4], "send": [1, 2], "back": [1, 2], "serial": 1, "gil": 1, "don": [1, 4], "skip": [1, 4], "overlap": 1, "spent": [1, 4], "cpu": [1, 4], "worker": 1, "decod": [1, 2, 4], "One": 2, "auto": [1, 2, 4], "orjson": 2, "simdjson": 2, "ujson": 2, "fall": 2, "modul": 2, "benchmark": 2, "py": 2, "own": 2, "artefacts_json_backend": 2, "s3": [2, 4], "compat": 2, "objectstoreload": [2, 4], "download": [2, 4], "etag": [2, 4], "sign": [2, 4], "credenti": [2, 4], "object_store_access_key_id": 2, "object_store_secret_access_kei": 2, "object_store_session_token": 2, "standard": 2, "aws_access_key_id": 2, "aws_secret_access_kei": 2, "aws_session_token": 2, "region": 2, "object_store_region": 2, "aws_region": 2, "u": 2, "east": 2, "object_stor": [2, 4], "my": [2, 4], "bucket": [2, 4], "amazonaw": [2, 4], "prod": [2, 4], "artefacts_object_store_url": 2, "object_store_url": 4, "localhost": 4, "9000": 4, "minio": 4, "folder": 4, "compress": [2, 4], "gz": 4, "uncompress": 4, "fetch": 4, "unless": 4, "filenotfounderror": 4, "cachedobject": 4, "artifact_path": 4, "local": 4, "read_rang": 4, "length": 4, "part": 4, "without": [1, 2, 4], "rang": 4, "byte": 4, "histori": 4, "runhistori": 4, "memori": [1, 2, 4], "sqlite": 4, "invoc": [1, 4], "close": 4, "connect": 4, "find_run_result": 4, "subdirectori": 4, "ingest": 4, "json_backend": [1, 4], "complet": 4, "oldest": 4, "newest": 4, "noderun": 4, "execution_time_percentil": 4, "percentil": 4, "50": 4, "90": 4, "99": 4, "status": 4, "calcul": 4, "100": 4, "success": 4, "failure_r": 4, "share": [1, 2, 4], "overal": 4, "group": 4, "hour": 4, "dai": 4, "week": 4, "month": 4, "failurer": 4, "columnar": 1, "results_t": 1, "row": 1, "result_column": 1, "adapter_response_rows_affect": 1, "utc": 1, "numpi": 1, "structur": 1, "arrai": 1, "arrow": 1, "pyarrow": 1, "timing_t": 1, "step": [1, 4], "timing_column": 1, "runanalysi": 4, "where": 4, "went": 4, "ran": 4, "total_work": 4, "sum": 4, "critical_path": 4, "largest": 4, "total": 4, "No": 4, "durat": 4, "critic": 4, "didn": 4, "around": 4, "criticalpath": 4, "threadinterv": 4, "makespan": 4, "thread_timelin": 4, "busi": 4, "idl": 4, "threadtimelin": 4, "utilis": 4, "averag": 4, "divid": 4, "most": [2, 4], "could": 4, "speedup": 4, "sped": 4, "With": [2, 4], "larger": 4, "bound": 4, "ignor": 4, "schedul": 4, "achiev": 4, "lower": 4, "unlimit": 4, "simul": [1, 4], "default_execution_tim": 1, "runtim": 1, "known": 1, "median": 1, "predict": 4, "from_child_map": 4, "diff": 1, "diff_manifest": 1, "comparison": 1, "usual": 1, "product": 1, "manifestdiff": 1, "compact": [2, 4], "compactnod": [2, 4], "__slots__": 2, "across": 2, "modifi": 2, "to_model": [2, 4], "artefacts_compact_nod": 2, "dedup": [1, 2], "dedupl": 1, "ident": [1, 2], "deduplicationreport": 1, "memory_report": [1, 2], "save": [1, 2], "measur": [1, 2, 4], "walk": [1, 2, 4], "moment": [1, 2], "memoryreport": 1, "especi": 2, "saved_byt": 2, "artefacts_dedupl": 2, "profil": [1, 2, 4], "insid": [1, 4], "loadstat": [1, 4], "load_stat": [1, 2], "phase": [2, 4], "logger": 2, "meant": 2, "investig": 2, "slow": 2, "manag": 2, "block": 2, "artefacts_profile_load": 2, "exclus": 4, "subtract": 4, "as_dict": 4, "builtin": 4, "event": 4, "summari": 4, "obj": 1, "written": 2, "itself": 2, "alias": 2, "invalid": 2, "mai": 2, "though": 2, "effect": 2, "stream": 2, "streamingfilesystemload": 2, "chosen": 2, "artefacts_trust": 2, "parent_posit": 4, "algorithm": 4, "sequenc": 4, "child_posit": 4, "topological_rank": 4, "rank": 4, "higher": 4, "minimum": 2, "condit": 2, "out": 2, "pick": 2, "late": 2, "60": 2, "artefacts_object_store_check_interv": 2, "haven": 4, "yet": 4, "by_tag": 4, "reus": 4, "later": 4, "get_valu": 4, "hasn": 4, "aren": 2}, "objects": {"artefacts.analysis": [[4, 0, 1, "", "RunAnalysis"]], "artefacts.analysis.RunAnalysis": [[4, 1, 1, "", "critical_path"], [4, 2, 1, "", "execution_times"], [4, 1, 1, "", "intervals"], [4, 3, 1, "", "makespan"], [4, 3, 1, "", "parallelism"], [4, 1, 1, "", "speedup"], [4, 1, 1, "", "thread_timelines"], [4, 3, 1, "", "total_work"], [4, 3, 1, "", "utilisation"]], "artefacts": [[1, 4, 0, "-", "api"]], "artefacts.api": [[1, 5, 1, "", "analyses"], [1, 5, 1, "", "docs"], [1, 5, 1, "", "exposures"], [1, 5, 1, "", "macros"], [1, 5, 1, "", "metrics"], [1, 5, 1, "", "models"], [1, 5, 1, "", "operations"], [1, 5, 1, "", "seeds"], [1, 5, 1, "", "select"], [1, 5, 1, "", "selectors"], [1, 5, 1, "", "snapshots"], [1, 5, 1, "", "sources"], [1, 5, 1, "", "tags"], [1, 5, 1, "", "tests"]], "artefacts.cache": [[4, 0, 1, "", "ArtifactCache"]], "artefacts.cache.ArtifactCache": [[4, 1, 1, "", "dump"], [4, 1, 1, "", "from_config"], [4, 1, 1, "", "key"], [4, 1, 1, "", "load"]], "artefacts.columnar": [[1, 5, 1, "", "results_table"], [1, 5, 1, "", "timing_table"]], "artefacts.compact": [[4, 0, 1, "", "CompactNode"]], "artefacts.compact.CompactNode": [[4, 1, 1, "", "dict"], [4, 1, 1, "", "to_model"]], "artefacts.dedup": [[1, 5, 1, "", "deduplicate"], [1, 5, 1, "", "memory_report"]], "artefacts.deserializers": [[1, 5, 1, "", "load_all"]], "artefacts.diff": [[1, 5, 1, "", "diff_manifests"]], "artefacts.graph": [[4, 0, 1, "", "Graph"]], "artefacts.graph.Graph": [[4, 1, 1, "", "ancestors"], [4, 1, 1, "", "ancestors_of"], [4, 1, 1, "", "child_positions"], [4, 1, 1, "", "children"], [4, 1, 1, "", "descendants"], [4, 1, 1, "", "descendants_of"], [4, 1, 1, "", "find_cycle"], [4, 1, 1, "", "from_child_map"], [4, 1, 1, "", "from_manifest"], [4, 1, 1, "", "parent_positions"], [4, 1, 1, "", "parents"], [4, 1, 1, "", "position"], [4, 1, 1, "", "shortest_path"], [4, 1, 1, "", "topological_order"], [4, 1, 1, "", "topological_ranks"], [4, 2, 1, "", "unique_ids"]], "artefacts.history": [[4, 0, 1, "", "RunHistory"]], "artefacts.history.RunHistory": [[4, 1, 1, "", "close"], [4, 1, 1, "", "execution_time_percentiles"], [4, 1, 1, "", "failure_rates"], [4, 1, 1, "", "find_run_results"], [4, 1, 1, "", "ingest"], [4, 1, 1, "", "ingested"], [4, 1, 1, "", "invocations"], [4, 1, 1, "", "runs"]], "artefacts.indexes": [[4, 0, 1, "", "ManifestIndex"], [4, 0, 1, "", "ResultsIndex"]], "artefacts.indexes.ManifestIndex": [[4, 2, 1, "", "by_package_name"], [4, 2, 1, "", "by_resource_type"], [4, 2, 1, "", "by_resource_type_and_package_name"], [4, 3, 1, "", "by_tag"], [4, 2, 1, "", "disabled"], [4, 3, 1, "", "disabled_resources"], [4, 1, 1, "", "get"], [4, 1, 1, "", "get_value"], [4, 1, 1, "", "iter_unique_ids"], [4, 3, 1, "", "resources"], [4, 2, 1, "", "unique_ids"]], "artefacts.indexes.ResultsIndex": [[4, 2, 1, "", "by_unique_id"], [4, 1, 1, "", "get"]], "artefacts.models": [[4, 0, 1, "", "CatalogModel"], [4, 0, 1, "", "CatalogNode"], [4, 0, 1, "", "CatalogNodeColumn"], [4, 0, 1, "", "CatalogNodeMetadata"], [4, 0, 1, "", "CatalogNodeStats"], [4, 0, 1, "", "ColumnInfo"], [4, 0, 1, "", "ExternalPartition"], [4, 0, 1, "", "ExternalTable"], [4, 0, 1, "", "FreshnessThreshold"], [4, 0, 1, "", "LazyMapping"], [4, 0, 1, "", "MacroArgument"], [4, 0, 1, "", "ManifestAnalysisNode"], [4, 0, 1, "", "ManifestDocsNode"], [4, 0, 1, "", "ManifestExposureNode"], [4, 0, 1, "", "ManifestMacroNode"], [4, 0, 1, "", "ManifestMetricNode"], [4, 0, 1, "", "ManifestModel"], [4, 0, 1, "", "ManifestModelNode"], [4, 0, 1, "", "ManifestNodeReference"], [4, 0, 1, "", "ManifestOperationNode"], [4, 0, 1, "", "ManifestSeedNode"], [4, 0, 1, "", "ManifestSnapshotNode"], [4, 0, 1, "", "ManifestSourceNode"], [4, 0, 1, "", "ManifestTestNode"], [4, 0, 1, "", "Metadata"], [4, 0, 1, "", "MetricFilter"], [4, 0, 1, "", "Quoting"], [4, 0, 1, "", "RunResultNode"], [4, 0, 1, "", "RunResultsModel"], [4, 0, 1, "", "SourceConfig"], [4, 0, 1, "", "SourcesFreshnessResult"], [4, 0, 1, "", "SourcesModel"], [4, 0, 1, "", "Time"], [4, 0, 1, "", "TimingResult"]], "artefacts.models.CatalogModel": [[4, 2, 1, "", "errors"], [4, 2, 1, "", "metadata"], [4, 2, 1, "", "nodes"], [4, 2, 1, "", "sources"]], "artefacts.models.CatalogNode": [[4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 1, 1, "", "descendants"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "metadata"], [4, 3, 1, "", "parents"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "stats"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.CatalogNodeColumn": [[4, 2, 1, "", "comment"], [4, 2, 1, "", "index"], [4, 2, 1, "", "name"], [4, 2, 1, "", "node_type"]], "artefacts.models.CatalogNodeMetadata": [[4, 2, 1, "", "comment"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "name"], [4, 2, 1, "", "node_type"], [4, 2, 1, "", "owner"]], "artefacts.models.CatalogNodeStats": [[4, 2, 1, "", "description"], [4, 2, 1, "", "id"], [4, 2, 1, "", "include"], [4, 2, 1, "", "label"], [4, 2, 1, "", "value"]], "artefacts.models.ColumnInfo": [[4, 2, 1, "", "data_type"], [4, 2, 1, "", "description"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "quote"], [4, 2, 1, "", "tags"]], "artefacts.models.ExternalPartition": [[4, 2, 1, "", "data_type"], [4, 2, 1, "", "description"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"]], "artefacts.models.ExternalTable": [[4, 2, 1, "", "file_format"], [4, 2, 1, "", "location"], [4, 2, 1, "", "partitions"], [4, 2, 1, "", "row_format"], [4, 2, 1, "", "tbl_properties"]], "artefacts.models.FreshnessThreshold": [[4, 2, 1, "", "error_after"], [4, 2, 1, "", "filter"], [4, 2, 1, "", "warn_after"]], "artefacts.models.MacroArgument": [[4, 2, 1, "", "description"], [4, 2, 1, "", "name"], [4, 2, 1, "", "type"]], "artefacts.models.ManifestAnalysisNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestDocsNode": [[4, 2, 1, "", "block_contents"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_filepath"], [4, 2, 1, "", "package_name"], [4, 2, 1, "", "path"], [4, 2, 1, "", "root_path"], [4, 2, 1, "", "unique_id"]], "artefacts.models.ManifestExposureNode": [[4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "maturity"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "node_type"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "owner"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "path"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"], [4, 2, 1, "", "url"]], "artefacts.models.ManifestMacroNode": [[4, 1, 1, "", "ancestors"], [4, 2, 1, "", "arguments"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 2, 1, "", "macro_sql"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestMetricNode": [[4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 2, 1, "", "dimensions"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "filters"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 2, 1, "", "label"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "model"], [4, 2, 1, "", "name"], [4, 2, 1, "", "node_type"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "path"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "sql"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "time_grains"], [4, 2, 1, "", "timestamp"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestModel": [[4, 2, 1, "", "child_map"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "exposures"], [4, 3, 1, "", "graph"], [4, 3, 1, "", "index"], [4, 1, 1, "", "iter_resource_type"], [4, 2, 1, "", "macros"], [4, 2, 1, "", "metadata"], [4, 2, 1, "", "metrics"], [4, 2, 1, "", "nodes"], [4, 2, 1, "", "parent_map"], [4, 2, 1, "", "raw_disabled"], [4, 3, 1, "", "resources"], [4, 3, 1, "", "selector"], [4, 2, 1, "", "selectors"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "tags"]], "artefacts.models.ManifestModelNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestNodeReference": [[4, 3, 1, "", "node"], [4, 3, 1, "", "resource_type"]], "artefacts.models.ManifestOperationNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestSeedNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestSnapshotNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestSourceNode": [[4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "config"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "external"], [4, 2, 1, "", "fqn"], [4, 2, 1, "", "freshness"], [4, 3, 1, "", "freshness_check_results"], [4, 2, 1, "", "identifier"], [4, 1, 1, "", "json"], [4, 2, 1, "", "loaded_at_field"], [4, 2, 1, "", "loader"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "quoting"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "source_description"], [4, 2, 1, "", "source_meta"], [4, 2, 1, "", "source_name"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.ManifestTestNode": [[4, 2, 1, "", "alias"], [4, 1, 1, "", "ancestors"], [4, 2, 1, "", "build_path"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 2, 1, "", "checksum"], [4, 3, 1, "", "children"], [4, 2, 1, "", "columns"], [4, 2, 1, "", "compiled"], [4, 2, 1, "", "compiled_path"], [4, 2, 1, "", "compiled_sql"], [4, 2, 1, "", "config"], [4, 2, 1, "", "config_call_dict"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "created_at"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "deferred"], [4, 2, 1, "", "depends_on"], [4, 1, 1, "", "descendants"], [4, 2, 1, "", "description"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "docs"], [4, 2, 1, "", "extra_ctes"], [4, 2, 1, "", "extra_ctes_injected"], [4, 2, 1, "", "fqn"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "meta"], [4, 2, 1, "", "name"], [4, 2, 1, "", "original_file_path"], [4, 2, 1, "", "package_name"], [4, 3, 1, "", "parents"], [4, 2, 1, "", "patch_path"], [4, 2, 1, "", "path"], [4, 2, 1, "", "raw_sql"], [4, 2, 1, "", "refs"], [4, 2, 1, "", "relation_name"], [4, 2, 1, "", "resource_type"], [4, 2, 1, "", "root_path"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "sources"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "tags"], [4, 2, 1, "", "test_metadata"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "unique_id"], [4, 2, 1, "", "unrendered_config"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.Metadata": [[4, 2, 1, "", "adapter_type"], [4, 3, 1, "", "dbt_schema_version"], [4, 2, 1, "", "dbt_schema_version_raw"], [4, 3, 1, "", "dbt_version"], [4, 2, 1, "", "dbt_version_raw"], [4, 2, 1, "", "env"], [4, 2, 1, "", "generated_at"], [4, 2, 1, "", "invocation_id"], [4, 2, 1, "", "project_id"], [4, 2, 1, "", "send_anonymous_usage_stats"], [4, 2, 1, "", "user_id"]], "artefacts.models.MetricFilter": [[4, 2, 1, "", "field"], [4, 2, 1, "", "operator"], [4, 2, 1, "", "value"]], "artefacts.models.Quoting": [[4, 2, 1, "", "column"], [4, 2, 1, "", "database"], [4, 2, 1, "", "db_schema"], [4, 2, 1, "", "identifier"]], "artefacts.models.RunResultNode": [[4, 2, 1, "", "adapter_response"], [4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 1, 1, "", "descendants"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "execution_time"], [4, 2, 1, "", "failures"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "message"], [4, 3, 1, "", "parents"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "status"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "thread_id"], [4, 2, 1, "", "timing"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.RunResultsModel": [[4, 2, 1, "", "args"], [4, 2, 1, "", "elapsed_time"], [4, 3, 1, "", "index"], [4, 2, 1, "", "metadata"], [4, 2, 1, "", "results"]], "artefacts.models.SourceConfig": [[4, 2, 1, "", "enabled"]], "artefacts.models.SourcesFreshnessResult": [[4, 2, 1, "", "adapter_response"], [4, 1, 1, "", "ancestors"], [4, 3, 1, "", "catalog"], [4, 3, 1, "", "catalog_artifact"], [4, 3, 1, "", "children"], [4, 1, 1, "", "construct"], [4, 1, 1, "", "copy"], [4, 2, 1, "", "criteria"], [4, 1, 1, "", "descendants"], [4, 1, 1, "", "dict"], [4, 3, 1, "", "disabled"], [4, 2, 1, "", "error"], [4, 2, 1, "", "execution_time"], [4, 3, 1, "", "freshness_check_results"], [4, 1, 1, "", "json"], [4, 3, 1, "", "manifest"], [4, 3, 1, "", "manifest_artifact"], [4, 2, 1, "", "max_loaded_at"], [4, 2, 1, "", "max_loaded_at_time_ago_in_s"], [4, 3, 1, "", "parents"], [4, 3, 1, "", "run_results"], [4, 3, 1, "", "run_results_artifact"], [4, 3, 1, "", "snapshots"], [4, 2, 1, "", "snapshotted_at"], [4, 3, 1, "", "sources_artifact"], [4, 2, 1, "", "status"], [4, 3, 1, "", "tests"], [4, 2, 1, "", "thread_id"], [4, 2, 1, "", "timing"], [4, 2, 1, "", "unique_id"], [4, 1, 1, "", "update_forward_refs"]], "artefacts.models.SourcesModel": [[4, 2, 1, "", "elapsed_time"], [4, 3, 1, "", "index"], [4, 2, 1, "", "metadata"], [4, 2, 1, "", "results"]], "artefacts.models.Time": [[4, 2, 1, "", "count"], [4, 2, 1, "", "period"]], "artefacts.models.TimingResult": [[4, 2, 1, "", "completed_at"], [4, 2, 1, "", "name"], [4, 2, 1, "", "started_at"]], "artefacts.object_store": [[4, 0, 1, "", "ObjectStoreLoader"]], "artefacts.object_store.ObjectStoreLoader": [[4, 1, 1, "", "artifact_path"], [4, 1, 1, "", "fetch"], [4, 1, 1, "", "fingerprint"], [4, 1, 1, "", "read_range"]], "artefacts.profiling": [[4, 0, 1, "", "LoadStats"], [1, 5, 1, "", "load_stats"], [1, 5, 1, "", "profile"]], "artefacts.profiling.LoadStats": [[4, 1, 1, "", "as_dict"], [4, 1, 1, "", "log"], [4, 1, 1, "", "measure"], [4, 1, 1, "", "phase"], [4, 3, 1, "", "seconds"]], "artefacts.selection": [[4, 0, 1, "", "NodeSelector"]], "artefacts.selection.NodeSelector": [[4, 1, 1, "", "select"], [4, 1, 1, "", "select_selector"]], "artefacts.simulation": [[1, 5, 1, "", "simulate"]], "artefacts.state": [[4, 0, 1, "", "ArtifactStore"]], "artefacts.state.ArtifactStore": [[4, 1, 1, "", "clear"], [4, 1, 1, "", "exists"], [4, 1, 1, "", "fingerprint"], [4, 1, 1, "", "get"], [4, 1, 1, "", "get_or_load"], [4, 1, 1, "", "set"]], "artefacts.trusted": [[1, 5, 1, "", "construct"]], "artefacts.watcher": [[4, 0, 1, "", "ArtifactWatcher"]], "artefacts.watcher.ArtifactWatcher": [[4, 1, 1, "", "check"], [4, 1, 1, "", "start"], [4, 1, 1, "", "stop"]]}, "objtypes": {"0": "py:class", "1": "py:method", "2": "py:attribute", "3": "py:property", "4": "py:module", "5": "py:function"}, "objnames": {"0": ["py", "class", "Python class"], "1": ["py", "method", "Python method"], "2": ["py", "attribute", "Python attribute"], "3": ["py", "property", "Python property"], "4": ["py", "module", "Python module"], "5": ["py", "function", "Python function"]}, "titleterms": {"altern": 0, "us": 0, "dbt": 0, "core": 0, "": 0, "jinja": 0, "context": 0, "json": 0, "load": 0, "api": 1, "configur": 2, "dbt_project_dir": 2, "dbt_target_dir": 2, "artefact": 3, "introduct": 3, "refer": 4, "lazy_load": 2, "reload_on_chang": 2, "cache_dir": 2, "json_backend": 2, "object_store_url": 2, "compact_nod": 2, "dedupl": 2, "profile_load": 2, "trust": 2, "object_store_check_interv": 2}, "envversion": {"sphinx.domains.c": 2, "sphinx.domains.changeset": 1, "sphinx.domains.citation": 1, "sphinx.domains.cpp": 8, "sphinx.domains.index": 1, "sphinx.domains.javascript": 2, "sphinx.domains.math": 2, "sphinx.domains.python": 3, "sphinx.domains.rst": 2, "sphinx.domains.std": 2, "sphinx.ext.viewcode": 1, "sphinx": 57}, "alltitles": {"Alternatives": [[0, "alternatives"]], "Using dbt-core": [[0, "using-dbt-core"]], "Using dbt\u2019s jinja context": [[0, "using-dbt-s-jinja-context"]], "Using json.load": [[0, "using-json-load"]], "artefacts": [[3, "artefacts"]], "Introduction": [[3, "introduction"]], "API": [[1, "module-artefacts.api"]], "Reference": [[4, "reference"]], "Configuration": [[2, "configuration"]], "dbt_project_dir": [[2, "dbt-project-dir"]], "dbt_target_dir": [[2, "dbt-target-dir"]], "lazy_load": [[2, "lazy-load"]], "compact_nodes": [[2, "compact-nodes"]], "deduplicate": [[2, "deduplicate"]], "profile_load": [[2, "profile-load"]], "trusted": [[2, "trusted"]], "reload_on_change": [[2, "reload-on-change"]], "cache_dir": [[2, "cache-dir"]], "json_backend": [[2, "json-backend"]], "object_store_url": [[2, "object-store-url"]], "object_store_check_interval": [[2, "object-store-check-interval"]]}, "indexentries": {}})
\ No newline at end of file
@@ -1,4 +1,6 @@
+import datetime
 import os
+import shutil
 import pytest
 
 from artefacts.deserializers import Manifest, RunResults, Catalog, Sources
@@ -41,9 +43,143 @@ def config():
     return Config()
 
 
+def copy_project(path):
+    """Copy the project's artifacts to `path`, and return a config pointing to
+    the copy."""
+
+    os.makedirs(path / "target")
+    for name in ["manifest", "run_results", "catalog", "sources"]:
+        filename = os.path.join(Config().dbt_target_dir, f"{name}.json")
+        shutil.copy(filename, path / "target")
+    return Config(dbt_project_dir=str(path))
+
+
+@pytest.fixture(scope="function")
+def tmp_project(tmp_path):
+    """A config pointing to a copy of the project's artifacts, which tests can
+    modify without affecting the other tests."""
+
+    return copy_project(tmp_path)
+
+
+@pytest.fixture(scope="function")
+def tmp_projects(tmp_path):
+    """Configs pointing to two copies of the project's artifacts, in different
+    target directories."""
+
+    return copy_project(tmp_path / "a"), copy_project(tmp_path / "b")
+
+
+METADATA = {
+    "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v4.json",
+    "dbt_version": "1.0.0",
+    "generated_at": "2022-03-01T10:00:00.000000Z",
+    "invocation_id": "00000000-0000-0000-0000-000000000000",
+    "env": {},
+}
+
+
+def raw_node(unique_id, **values):
+    """The raw dictionary of a manifest node, like `model.shop.orders`."""
+
+    resource_type, package_name, name = unique_id.split(".")[:3]
+    node = {
+        "raw_sql": f"select * from {name}",
+        "schema": "main",
+        "fqn": [package_name, name],
+        "unique_id": unique_id,
+        "package_name": package_name,
+        "root_path": f"/{package_name}",
+        "path": f"{name}.sql",
+        "original_file_path": f"models/{name}.sql",
+        "name": name,
+        "resource_type": resource_type,
+        "alias": name,
+        "checksum": {"name": "sha256", "checksum": name},
+        "config": {"materialized": "table"},
+        "tags": [],
+    }
+    node.update(values)
+    return node
+
+
+def raw_manifest(parent_map, nodes=None):
+    """The raw dictionary of a manifest with a node for each key of the
+    `parent_map`. The raw dictionaries of some of the nodes can be passed in
+    `nodes`, keyed by unique_id."""
+
+    child_map = {unique_id: [] for unique_id in parent_map}
+    for unique_id, parents in parent_map.items():
+        for parent in parents:
+            child_map.setdefault(parent, []).append(unique_id)
+
+    return {
+        "metadata": METADATA,
+        "nodes": {u: (nodes or {}).get(u) or raw_node(u) for u in parent_map},
+        "sources": {},
+        "macros": {},
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "selectors": {},
+        "disabled": {},
+        "parent_map": {u: list(parents) for u, parents in parent_map.items()},
+        "child_map": child_map,
+    }
+
+
+def raw_run_results(results, started_at="2022-03-01T10:00:00"):
+    """The raw dictionary of a run_results artifact. Each result is a tuple of
+    the node's unique_id, its thread and the seconds from `started_at` at
+    which it started and completed."""
+
+    start = datetime.datetime.fromisoformat(started_at)
+
+    def timestamp(seconds):
+        return (start + datetime.timedelta(seconds=seconds)).isoformat() + "Z"
+
+    raw_results = list()
+    for unique_id, thread_id, started, completed in results:
+        raw_results.append(
+            {
+                "unique_id": unique_id,
+                "status": "success",
+                "thread_id": thread_id,
+                "execution_time": float(completed - started),
+                "adapter_response": {},
+                "timing": [
+                    {
+                        "name": "execute",
+                        "started_at": timestamp(started),
+                        "completed_at": timestamp(completed),
+                    }
+                ],
+            }
+        )
+
+    ends = [completed for _, _, _, completed in results]
+    return {
+        "metadata": {
+            **METADATA,
+            "dbt_schema_version": (
+                "https://schemas.getdbt.com/dbt/run-results/v4.json"
+            ),
+        },
+        "results": raw_results,
+        "elapsed_time": float(max(ends, default=0)),
+    }
+
+
+def touch(filename, seconds=10):
+    """Change the modification time of a file"""
+
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
 @pytest.fixture(scope="function")
 def clean_state(monkeypatch):
-    monkeypatch.setattr(artefacts.state, "_state", dict())
+    monkeypatch.setattr(artefacts.state, "_state", artefacts.state.ArtifactStore())
 
 
 @pytest.fixture(scope="session")
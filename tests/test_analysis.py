@@ -0,0 +1,101 @@
+import pytest
+
+from artefacts.analysis import RunAnalysis
+from artefacts.models import ManifestModel, RunResultsModel
+from .conftest import raw_manifest, raw_run_results
+
+
+# raw -> base -> report -> not_null_report_id, raw -> wide -> report
+PARENT_MAP = {
+    "seed.shop.raw": [],
+    "model.shop.base": ["seed.shop.raw"],
+    "model.shop.wide": ["seed.shop.raw"],
+    "model.shop.report": ["model.shop.base", "model.shop.wide"],
+    "test.shop.not_null_report_id": ["model.shop.report"],
+}
+
+RESULTS = [
+    ("seed.shop.raw", "Thread-1", 0, 1),
+    ("model.shop.base", "Thread-1", 1, 3),
+    ("model.shop.wide", "Thread-2", 2, 6),
+    ("model.shop.report", "Thread-1", 6, 7),
+    ("test.shop.not_null_report_id", "Thread-2", 7, 8),
+]
+
+
+@pytest.fixture
+def analysis():
+    return RunAnalysis(
+        ManifestModel.parse_obj(raw_manifest(PARENT_MAP)),
+        RunResultsModel.parse_obj(raw_run_results(RESULTS)),
+    )
+
+
+def test_critical_path(analysis):
+    path = analysis.critical_path()
+    assert path.unique_ids == [
+        "seed.shop.raw",
+        "model.shop.wide",
+        "model.shop.report",
+        "test.shop.not_null_report_id",
+    ]
+    assert path.duration == 7.0
+
+
+def test_critical_path_skips_nodes_that_did_not_run(analysis):
+    analysis.execution_times.pop("seed.shop.raw")
+    analysis.execution_times["model.shop.base"] = 10.0
+
+    path = analysis.critical_path()
+    assert path.unique_ids == [
+        "model.shop.base",
+        "model.shop.report",
+        "test.shop.not_null_report_id",
+    ]
+    assert path.duration == 12.0
+
+
+def test_critical_path_includes_nodes_missing_from_the_manifest(analysis):
+    analysis.execution_times["model.other_project.slow"] = 60.0
+    path = analysis.critical_path()
+    assert path.unique_ids == ["model.other_project.slow"]
+    assert path.duration == 60.0
+
+
+def test_thread_timelines(analysis):
+    timelines = analysis.thread_timelines()
+    assert list(timelines) == ["Thread-1", "Thread-2"]
+
+    timeline = timelines["Thread-1"]
+    assert [i.unique_id for i in timeline.intervals] == [
+        "seed.shop.raw",
+        "model.shop.base",
+        "model.shop.report",
+    ]
+    assert (timeline.busy, timeline.idle) == (4.0, 4.0)
+    assert timeline.utilisation == 0.5
+    assert [(b.second, e.second) for b, e in timeline.gaps()] == [(3, 6)]
+
+    for timeline in timelines.values():
+        assert timeline.busy + timeline.idle == analysis.makespan
+
+
+def test_speedup(analysis):
+    assert analysis.makespan == 8.0
+    assert analysis.total_work == 9.0
+    assert analysis.parallelism == pytest.approx(9 / 7)
+    assert analysis.speedup() == pytest.approx(8 / 7)
+    assert analysis.speedup(1) == pytest.approx(8 / 9)
+    assert analysis.speedup(8) == analysis.speedup()
+    with pytest.raises(ValueError):
+        analysis.speedup(0)
+
+
+def test_defaults_to_project_artifacts():
+    analysis = RunAnalysis()
+    path = analysis.critical_path()
+    execution_times = [analysis.execution_times[u] for u in path.unique_ids]
+    assert path.duration == pytest.approx(sum(execution_times))
+    assert path.duration <= analysis.total_work
+    for timeline in analysis.thread_timelines().values():
+        assert 0.0 <= timeline.utilisation <= 1.0
@@ -0,0 +1,104 @@
+import os
+import pickle
+
+import pytest
+
+from artefacts.cache import ArtifactCache
+from artefacts.config import Config
+from artefacts.deserializers import Manifest, RunResults
+from artefacts.models import ManifestModel, RunResultsModel
+import artefacts.cache
+
+
+@pytest.fixture
+def cached_project(tmp_project, tmp_path):
+    return Config(
+        dbt_project_dir=tmp_project["dbt_project_dir"],
+        cache_dir=str(tmp_path / "cache"),
+    )
+
+
+def artifact_path(config, name):
+    return os.path.join(config.dbt_target_dir, f"{name}.json")
+
+
+def test_cache_key_depends_on_contents(tmp_project, tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    path = artifact_path(tmp_project, "run_results")
+    key = cache.key(path, RunResultsModel)
+    assert cache.key(path, RunResultsModel) == key
+    assert cache.key(path, RunResultsModel, True).prefix != key.prefix
+    assert cache.key(path, ManifestModel).prefix != key.prefix
+
+    with open(path, "a") as fh:
+        fh.write(" ")
+    assert cache.key(path, RunResultsModel).prefix == key.prefix
+    assert cache.key(path, RunResultsModel).digest != key.digest
+
+
+def test_cache_key_depends_on_version(tmp_project, tmp_path, monkeypatch):
+    cache = ArtifactCache(tmp_path / "cache")
+    path = artifact_path(tmp_project, "run_results")
+    key = cache.key(path, RunResultsModel)
+    monkeypatch.setattr(artefacts.cache, "__version__", "0.0.0-test")
+    assert cache.key(path, RunResultsModel) != key
+
+
+def test_cache_dump_replaces_stale_entries(tmp_project, tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    path = artifact_path(tmp_project, "run_results")
+    old_key = cache.key(path, RunResultsModel)
+    cache.dump(old_key, "old")
+
+    with open(path, "a") as fh:
+        fh.write(" ")
+    new_key = cache.key(path, RunResultsModel)
+    cache.dump(new_key, "new")
+
+    assert cache.load(old_key) is None
+    assert cache.load(new_key) == "new"
+    assert os.listdir(cache.cache_dir) == [new_key.filename]
+
+
+def test_cache_ignores_corrupt_entries(tmp_project, tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    key = cache.key(artifact_path(tmp_project, "run_results"), RunResultsModel)
+    os.makedirs(cache.cache_dir)
+    with open(os.path.join(cache.cache_dir, key.filename), "wb") as fh:
+        fh.write(b"not a pickle")
+
+    assert cache.load(key) is None
+    assert not os.path.exists(os.path.join(cache.cache_dir, key.filename))
+
+
+def test_deserializer_uses_cache(cached_project, monkeypatch):
+    parsed = RunResults.deserialize(config=cached_project)
+    assert len(os.listdir(cached_project.cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The artifact should be loaded from the cache")
+
+    monkeypatch.setattr(RunResults, "parse", fail)
+    cached = RunResults.deserialize(config=cached_project)
+    assert type(cached) is RunResultsModel
+    assert cached == parsed
+
+
+def test_deserializer_cache_preserves_lazy_load(cached_project):
+    config = Config(**{**cached_project, "lazy_load": True})
+    Manifest.deserialize(config=config)
+    manifest = Manifest.deserialize(config=config)
+    assert type(manifest.nodes).__name__ == "LazyMapping"
+    assert len(manifest.resources) > 0
+
+    eager = Manifest.deserialize(config=cached_project)
+    assert type(eager.nodes) is dict
+    assert len(os.listdir(cached_project.cache_dir)) == 2
+
+
+def test_cached_manifest_is_picklable_after_use(cached_project):
+    manifest = Manifest.deserialize(config=cached_project)
+    manifest.index
+    manifest.graph
+    restored = pickle.loads(pickle.dumps(manifest))
+    assert restored.index.unique_ids == manifest.index.unique_ids
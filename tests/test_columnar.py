@@ -0,0 +1,91 @@
+import json
+import sys
+
+import pytest
+
+from artefacts.columnar import RESULT_COLUMNS, results_table, timing_table
+from artefacts.config import Config
+from artefacts.loaders import compress_artifact
+
+
+@pytest.fixture
+def raw_run_results():
+    with open(f"{Config().dbt_target_dir}/run_results.json") as fh:
+        raw = json.load(fh)
+    raw["results"][0]["adapter_response"]["nested"] = {"a": 1}
+    raw["results"][0]["failures"] = None
+    raw["results"][1]["timing"] = []
+    return raw
+
+
+def compile_started_at(raw):
+    timing = raw["results"][0]["timing"]
+    return next(t["started_at"] for t in timing if t["name"] == "compile")
+
+
+def test_results_table_matches_models(run_results):
+    table = results_table()
+    assert table["unique_id"] == [r.unique_id for r in run_results.results]
+    assert table["status"] == [r.status for r in run_results.results]
+    assert table["execution_time"] == [r.execution_time for r in run_results.results]
+    for name, values in table.items():
+        assert len(values) == len(run_results.results), name
+
+
+def test_results_table_columns(raw_run_results):
+    table = results_table(raw_run_results)
+    assert list(table)[: len(RESULT_COLUMNS)] == list(RESULT_COLUMNS)
+    assert table["adapter_response_rows_affected"][0] == 0
+    assert table["adapter_response_nested"][0] == '{"a": 1}'
+    assert table["adapter_response_nested"][1] is None
+    assert table["execute_started_at"][1] is None
+    assert table["compile_started_at"][0] == compile_started_at(raw_run_results)
+
+
+def test_results_table_reads_paths(tmp_project):
+    path = f"{tmp_project.dbt_target_dir}/run_results.json"
+    expected = results_table(path)
+    assert results_table(compress_artifact(path)) == expected
+    assert results_table(config=tmp_project) == expected
+
+
+def test_timing_table(raw_run_results):
+    table = timing_table(raw_run_results)
+    expected = sum(len(r["timing"]) for r in raw_run_results["results"])
+    assert len(table["unique_id"]) == expected
+    assert set(table["name"]) == {"compile", "execute"}
+
+
+def test_invalid_format():
+    with pytest.raises(ValueError):
+        results_table(format="csv")
+
+
+@pytest.mark.parametrize("format,package", [("numpy", "numpy"), ("arrow", "pyarrow")])
+def test_missing_optional_packages(format, package, monkeypatch):
+    monkeypatch.setitem(sys.modules, package, None)
+    with pytest.raises(ImportError, match=package):
+        results_table(format=format)
+
+
+def test_results_table_numpy(raw_run_results):
+    np = pytest.importorskip("numpy")
+    table = results_table(raw_run_results, format="numpy")
+    assert len(table) == len(raw_run_results["results"])
+    assert table["execution_time"].dtype == np.float64
+    assert np.isnan(table["failures"][0])
+    started_at = compile_started_at(raw_run_results).rstrip("Z")
+    assert table["compile_started_at"][0] == np.datetime64(started_at)
+    assert np.isnat(table["execute_started_at"][1])
+
+
+def test_results_table_arrow(raw_run_results):
+    pa = pytest.importorskip("pyarrow")
+    table = results_table(raw_run_results, format="arrow")
+    assert table.num_rows == len(raw_run_results["results"])
+    assert table.schema.field("execution_time").type == pa.float64()
+    assert table.schema.field("compile_started_at").type == pa.timestamp("us", tz="UTC")
+    assert table.column("failures")[0].as_py() is None
+
+    timing = timing_table(raw_run_results, format="arrow")
+    assert timing.column_names == ["unique_id", "name", "started_at", "completed_at"]
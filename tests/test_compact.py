@@ -0,0 +1,76 @@
+import pickle
+
+import pytest
+
+from artefacts.compact import CompactNode, compact, compact_nodes
+from artefacts.config import Config
+from artefacts.deserializers import Manifest
+from artefacts.selection import NodeSelector
+
+
+@pytest.fixture
+def model(manifest):
+    return next(manifest.iter_resource_type("model"))
+
+
+def test_compact_nodes_match_models(manifest):
+    nodes = compact_nodes(manifest.nodes)
+    assert list(nodes) == list(manifest.nodes)
+    for unique_id, node in nodes.items():
+        model = manifest.nodes[unique_id]
+        assert isinstance(node, CompactNode)
+        assert node.model is type(model)
+        assert node.dict() == model.dict()
+        assert node.to_model() == model
+
+
+def test_compact_nodes_share_strings(manifest):
+    nodes = list(compact_nodes(manifest.nodes).values())
+    first, second = nodes[0], nodes[1]
+    assert first.package_name is second.package_name
+    assert first.db_schema is second.db_schema
+    assert first.fqn[0] is second.fqn[0]
+
+
+def test_compact_nodes_compress_long_sql(model):
+    model = model.copy(update={"raw_sql": "select 1\n" * 100})
+    node = compact(model)
+    assert isinstance(node._raw_sql, bytes)
+    assert len(node._raw_sql) < len(model.raw_sql)
+    assert node.raw_sql == model.raw_sql
+    assert node.compiled_sql == model.compiled_sql
+
+
+def test_compact_nodes_are_read_only(model):
+    node = compact(model)
+    with pytest.raises(AttributeError):
+        node.name = "renamed"
+    with pytest.raises(AttributeError):
+        del node.name
+    with pytest.raises(AttributeError):
+        node.__dict__
+
+
+def test_compact_returns_other_objects_unchanged(manifest, model):
+    node = compact(model)
+    assert compact(node) is node
+    macro = next(iter(manifest.macros.values()))
+    assert compact(macro) is macro
+
+
+def test_compact_nodes_can_be_pickled(model):
+    model = model.copy(update={"raw_sql": "select 1\n" * 100})
+    node = compact(model)
+    restored = pickle.loads(pickle.dumps(node))
+    assert type(restored) is type(node)
+    assert restored.dict() == node.dict()
+
+
+def test_compact_nodes_config(clean_state):
+    manifest = Manifest(config=Config(compact_nodes=True))
+    unique_id = next(manifest.index.iter_unique_ids(resource_type="model"))
+    node = manifest.nodes[unique_id]
+    assert isinstance(node, CompactNode)
+    assert manifest.index[unique_id] is node
+    assert node.parents == manifest.parent_map[unique_id]
+    assert unique_id in NodeSelector(manifest).select(f"{node.name}+")
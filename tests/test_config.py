@@ -34,3 +34,46 @@ def test_config_load_project_config(config):
 
     resp = config.load_pyproject_config(".", "dne")
     assert resp == dict()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("true", True), ("1", True), ("false", False), ("0", False), (True, True)],
+)
+def test_config_lazy_load(value, expected):
+    assert Config(lazy_load=value).lazy_load is expected
+
+
+def test_config_lazy_load_defaults_to_false(config):
+    assert config.lazy_load is False
+
+
+def test_config_compact_nodes(config):
+    assert config.compact_nodes is False
+    assert Config(compact_nodes="true").compact_nodes is True
+
+
+def test_config_deduplicate(config):
+    assert config.deduplicate is False
+    assert Config(deduplicate="1").deduplicate is True
+
+
+def test_config_profile_load(config):
+    assert config.profile_load is False
+    assert Config(profile_load="true").profile_load is True
+
+
+def test_config_trusted(config):
+    assert config.trusted is False
+    assert Config(trusted="yes").trusted is True
+
+
+def test_config_cache_dir_defaults_to_none(config):
+    assert config.cache_dir is None
+    assert Config(cache_dir="").cache_dir is None
+    assert Config(cache_dir=".cache").cache_dir == ".cache"
+
+
+def test_config_json_backend(config):
+    assert config.json_backend == "auto"
+    assert Config(json_backend=" ORJSON").json_backend == "orjson"
@@ -0,0 +1,98 @@
+import pickle
+
+from artefacts.compact import CompactNode
+from artefacts.config import Config
+from artefacts.dedup import deduplicate, memory_report
+from artefacts.deserializers import Catalog, Manifest
+from artefacts.loaders import FileSystemLoader
+
+
+def parse(Artifact, **options):
+    config = Config(**options)
+    return Artifact.parse(FileSystemLoader(config=config), config)
+
+
+def test_deduplicate_shares_identical_values():
+    manifest = parse(Manifest)
+    tests = list(manifest.iter_resource_type("test"))
+    assert tests[0].config == tests[1].config
+    assert tests[0].config is not tests[1].config
+
+    report = deduplicate(manifest)
+    assert tests[0].config is tests[1].config
+    assert tests[0].depends_on["macros"] is tests[1].depends_on["macros"]
+    assert report.structures_shared > 0
+    assert report.saved_bytes > 0
+    assert manifest._deduplication == report
+
+
+def test_deduplicate_preserves_values():
+    manifest = parse(Manifest)
+    deduplicate(manifest)
+    expected = parse(Manifest)
+    for unique_id, node in expected.nodes.items():
+        assert manifest.nodes[unique_id].dict() == node.dict()
+    assert manifest.sources.keys() == expected.sources.keys()
+    for unique_id, parents in expected.parent_map.items():
+        assert [p.unique_id for p in manifest.parent_map[unique_id]] == [
+            p.unique_id for p in parents
+        ]
+
+
+def test_deduplicate_shares_models_and_references():
+    catalog = parse(Catalog)
+    deduplicate(catalog)
+    stats = [n.stats["has_stats"] for n in catalog.nodes.values()]
+    assert all(s is stats[0] for s in stats)
+
+    manifest = parse(Manifest)
+    deduplicate(manifest)
+    # A node that is both a child and a parent is referenced by the same
+    # object in the child_map and the parent_map
+    parent_ids = {p.unique_id for ps in manifest.parent_map.values() for p in ps}
+    child = next(
+        c for cs in manifest.child_map.values() for c in cs if c.unique_id in parent_ids
+    )
+    parent_refs = [
+        p
+        for parents in manifest.parent_map.values()
+        for p in parents
+        if p.unique_id == child.unique_id
+    ]
+    assert all(r is child for r in parent_refs)
+
+
+def test_deduplicate_interns_strings():
+    manifest = parse(Manifest)
+    deduplicate(manifest)
+    nodes = list(manifest.nodes.values())
+    assert nodes[0].package_name is nodes[1].package_name
+    assert nodes[0].root_path is nodes[1].root_path
+
+
+def test_deduplicate_compact_nodes(clean_state):
+    manifest = Manifest(config=Config(compact_nodes=True, deduplicate=True))
+    nodes = list(manifest.nodes.values())
+    assert isinstance(nodes[0], CompactNode)
+    assert nodes[0].checksum["name"] is nodes[1].checksum["name"]
+    assert nodes[0].docs is nodes[1].docs
+
+
+def test_deduplicate_config(clean_state):
+    manifest = Manifest(config=Config(deduplicate=True))
+    report = memory_report(manifest)
+    assert report.total_bytes > report.saved_bytes > 0
+    assert report.deduplication.strings_interned > 0
+
+    restored = pickle.loads(pickle.dumps(manifest))
+    assert memory_report(restored).saved_bytes == report.saved_bytes
+
+
+def test_memory_report_without_deduplication():
+    catalog = parse(Catalog)
+    report = memory_report(catalog)
+    assert report.deduplication is None
+    assert report.saved_bytes == 0
+
+    deduplicate(catalog)
+    assert memory_report(catalog).total_bytes < report.total_bytes
@@ -1,6 +1,11 @@
-from artefacts.deserializers import Manifest, Catalog, RunResults, Sources
+import os
+
+import pytest
+
+from artefacts.deserializers import Manifest, Catalog, RunResults, Sources, load_all
 from artefacts.config import Config
 import artefacts.state
+from .conftest import touch
 
 
 def test_manifest_deserialize():
@@ -59,3 +64,89 @@ def test_loading_deserializer_uses_cached_config(clean_state):
     assert Manifest.get_or_set_config() == config
     RunResults()
     assert RunResults.get_or_set_config() == config
+
+
+def test_passed_config_after_stored_config(clean_state, tmp_project):
+    default = Manifest()
+    other = Manifest(config=tmp_project)
+    assert other is not default
+
+    # The store's config is kept, and the passed config is used for the
+    # artifacts of its target directory
+    assert Manifest.get_or_set_config() == Config()
+    assert Manifest() is default
+    target_dir = tmp_project.dbt_target_dir
+    assert Manifest.config_for_target_dir(target_dir) is tmp_project
+
+
+def test_passed_config_before_stored_config(clean_state, tmp_project):
+    other = Manifest(config=tmp_project)
+    assert Manifest.get_or_set_config() is tmp_project
+    assert Manifest() is other
+    assert Manifest.config_for_target_dir(tmp_project.dbt_target_dir) is tmp_project
+
+
+def test_lazy_load_config_deserializes_lazily(clean_state):
+    manifest = Manifest(config=Config(lazy_load=True))
+    assert type(manifest.nodes).__name__ == "LazyMapping"
+    assert len(manifest.resources) > 0
+
+
+def test_deserializer_reloads_changed_files(clean_state, tmp_project):
+    manifest = Manifest(config=tmp_project)
+    assert Manifest() is manifest
+
+    touch(os.path.join(tmp_project.dbt_target_dir, "manifest.json"))
+    reloaded = Manifest()
+    assert reloaded is not manifest
+    assert Manifest() is reloaded
+
+
+def test_deserializer_reload_on_change_can_be_disabled(clean_state, tmp_project):
+    config = Config(dbt_project_dir=tmp_project["dbt_project_dir"], reload_on_change=0)
+    manifest = Manifest(config=config)
+    touch(os.path.join(config.dbt_target_dir, "manifest.json"))
+    assert Manifest() is manifest
+
+
+def test_deserializer_fingerprint(clean_state, tmp_project):
+    fingerprint = RunResults.fingerprint(config=tmp_project)
+    assert fingerprint[0].endswith("run_results.json")
+    touch(fingerprint[0])
+    assert RunResults.fingerprint() != fingerprint
+
+
+@pytest.mark.parametrize("processes", [True, False])
+def test_load_all_fills_state(clean_state, processes):
+    loaded = load_all(processes=processes)
+    assert set(loaded) == {"manifest", "run_results", "catalog", "sources"}
+    for name, artifact in loaded.items():
+        assert artefacts.state.get(name) is artifact
+    assert Manifest() is loaded["manifest"]
+    assert type(loaded["manifest"]) is Manifest.model
+
+
+def test_load_all_skips_loaded_artifacts(clean_state):
+    manifest = Manifest()
+    loaded = load_all(["manifest", "run_results"], processes=False)
+    assert loaded["manifest"] is manifest
+    assert set(loaded) == {"manifest", "run_results"}
+
+
+def test_load_all_skips_missing_artifacts(clean_state, tmp_project):
+    os.remove(os.path.join(tmp_project.dbt_target_dir, "catalog.json"))
+    loaded = load_all(config=tmp_project, processes=False)
+    assert set(loaded) == {"manifest", "run_results", "sources"}
+
+
+def test_load_all_uses_the_callers_store(clean_state):
+    store = artefacts.state.ArtifactStore()
+    with artefacts.state.use(store):
+        load_all(["run_results"], processes=False)
+    assert store.exists("run_results")
+    assert not artefacts.state.exists("run_results")
+
+
+def test_load_all_rejects_invalid_names(clean_state):
+    with pytest.raises(ValueError):
+        load_all(["nodes"])
@@ -0,0 +1,150 @@
+import copy
+import os
+
+import pytest
+
+from artefacts.diff import diff_manifests
+from artefacts.loaders import compress_artifact
+from .conftest import raw_manifest as make_raw_manifest
+
+ORDERS = "source.shop.raw.orders"
+BASE_ORDERS = "model.shop.base_orders"
+BASE_CUSTOMERS = "model.shop.base_customers"
+CUSTOMERS = "model.shop.customers"
+UNIQUE_ORDER_ID = "test.shop.unique_base_orders_order_id"
+REVENUE = "exposure.shop.revenue"
+
+MACRO = "macro.shop.cents"
+STAR = "macro.dbt_utils.star"
+
+
+@pytest.fixture
+def raw_manifest():
+    # orders -> base_orders -> customers -> revenue, base_customers -> customers
+    # and base_orders -> unique_base_orders_order_id
+    parent_map = {
+        BASE_ORDERS: [ORDERS],
+        BASE_CUSTOMERS: [],
+        CUSTOMERS: [BASE_ORDERS, BASE_CUSTOMERS],
+        UNIQUE_ORDER_ID: [BASE_ORDERS],
+    }
+    manifest = make_raw_manifest(parent_map)
+    for unique_id, node in manifest["nodes"].items():
+        node["depends_on"] = {"macros": [], "nodes": parent_map[unique_id]}
+        node["unrendered_config"] = {}
+        node["description"] = ""
+        node["columns"] = {}
+
+    manifest["parent_map"].update({ORDERS: [], REVENUE: [CUSTOMERS]})
+    manifest["sources"][ORDERS] = {
+        "unique_id": ORDERS,
+        "database": "db",
+        "schema": "raw",
+        "identifier": "orders",
+        "config": {"enabled": True},
+        "created_at": 1.0,
+    }
+    manifest["exposures"][REVENUE] = {
+        "unique_id": REVENUE,
+        "depends_on": {"nodes": [CUSTOMERS]},
+        "created_at": 1.0,
+    }
+    for unique_id in (MACRO, STAR):
+        manifest["macros"][unique_id] = {
+            "unique_id": unique_id,
+            "macro_sql": "{% macro cents() %}{% endmacro %}",
+            "depends_on": {"macros": []},
+        }
+    return manifest
+
+
+@pytest.fixture
+def new_manifest(raw_manifest):
+    return copy.deepcopy(raw_manifest)
+
+
+def test_identical_manifests(raw_manifest):
+    diff = diff_manifests(raw_manifest, copy.deepcopy(raw_manifest))
+    assert diff == (set(), set(), {}, set())
+
+
+def test_new_and_removed(raw_manifest, new_manifest):
+    new_manifest["nodes"]["model.shop.new"] = new_manifest["nodes"].pop(CUSTOMERS)
+    diff = diff_manifests(raw_manifest, new_manifest)
+    assert diff.new == {"model.shop.new"}
+    assert diff.removed == {CUSTOMERS}
+    assert diff.changed == {"model.shop.new"}
+
+
+def test_modified_body_and_impact(raw_manifest, new_manifest):
+    new_manifest["nodes"][BASE_ORDERS]["checksum"]["checksum"] = "changed"
+    diff = diff_manifests(raw_manifest, new_manifest)
+    assert diff.modified == {BASE_ORDERS: ["body"]}
+    assert diff.impacted == {CUSTOMERS, UNIQUE_ORDER_ID, REVENUE}
+
+
+def test_modified_configs(raw_manifest, new_manifest):
+    nodes = new_manifest["nodes"]
+    nodes[CUSTOMERS]["config"]["schema"] = "dbt_dev_customers"
+    assert diff_manifests(raw_manifest, new_manifest).modified == {}
+
+    nodes[CUSTOMERS]["unrendered_config"]["schema"] = "marts"
+    nodes[BASE_ORDERS]["config"]["materialized"] = "view"
+    diff = diff_manifests(raw_manifest, new_manifest)
+    assert diff.modified_by("configs") == {CUSTOMERS, BASE_ORDERS}
+
+
+def test_modified_persisted_descriptions(raw_manifest, new_manifest):
+    node = new_manifest["nodes"][CUSTOMERS]
+    node["description"] = "Changed"
+    assert diff_manifests(raw_manifest, new_manifest).modified == {}
+
+    old_manifest = copy.deepcopy(raw_manifest)
+    for manifest in (old_manifest, new_manifest):
+        manifest["nodes"][CUSTOMERS]["config"]["persist_docs"] = {"relation": True}
+    diff = diff_manifests(old_manifest, new_manifest)
+    assert diff.modified == {CUSTOMERS: ["persisted_descriptions"]}
+
+
+def macro_manifests(raw_manifest, macros):
+    """Copies of the manifest where only the customers model uses `macros`."""
+
+    manifests = copy.deepcopy(raw_manifest), copy.deepcopy(raw_manifest)
+    for manifest in manifests:
+        manifest["nodes"][CUSTOMERS]["depends_on"]["macros"] = macros
+    return manifests
+
+
+def test_modified_macros(raw_manifest):
+    old_manifest, new_manifest = macro_manifests(raw_manifest, [STAR])
+    new_manifest["macros"][STAR]["macro_sql"] = "changed"
+    diff = diff_manifests(old_manifest, new_manifest)
+    assert diff.modified == {CUSTOMERS: ["macros"]}
+
+
+def test_modified_nested_macros(raw_manifest):
+    old_manifest, new_manifest = macro_manifests(raw_manifest, [MACRO])
+    for manifest in (old_manifest, new_manifest):
+        manifest["macros"][MACRO]["depends_on"]["macros"] = [STAR]
+    new_manifest["macros"][STAR]["macro_sql"] = "changed"
+    diff = diff_manifests(old_manifest, new_manifest)
+    assert diff.modified == {CUSTOMERS: ["macros"]}
+
+
+def test_modified_sources_and_exposures(raw_manifest, new_manifest):
+    new_manifest["sources"][ORDERS]["identifier"] = "orders_v2"
+    new_manifest["sources"][ORDERS]["created_at"] = 2.0
+    new_manifest["exposures"][REVENUE]["created_at"] = 2.0
+
+    diff = diff_manifests(raw_manifest, new_manifest)
+    assert diff.modified == {ORDERS: ["relation"]}
+    assert BASE_ORDERS in diff.impacted
+
+
+def test_reads_paths(tmp_project):
+    target_dir = tmp_project.dbt_target_dir
+    manifest_path = os.path.join(target_dir, "manifest.json")
+    assert diff_manifests(target_dir, manifest_path).changed == set()
+
+    compressed = compress_artifact(manifest_path)
+    assert diff_manifests(compressed, config=tmp_project).changed == set()
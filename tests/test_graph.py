@@ -0,0 +1,112 @@
+import pytest
+
+from artefacts.graph import Graph, CycleError
+from .conftest import testing_poffertjes_shop  # noqa
+
+
+@pytest.fixture
+def graph():
+    # a -> b -> d, a -> c -> d -> e, f is disconnected
+    return Graph(
+        {
+            "a": [],
+            "b": ["a"],
+            "c": ["a"],
+            "d": ["b", "c"],
+            "e": ["d"],
+            "f": [],
+        }
+    )
+
+
+def test_graph_neighbours(graph):
+    assert graph.parents("d") == ["b", "c"]
+    assert graph.children("a") == ["b", "c"]
+    assert graph.children("e") == []
+    assert len(graph) == 6
+    assert "a" in graph and "z" not in graph
+
+
+def test_graph_positions(graph):
+    d = graph.position("d")
+    assert [graph.unique_ids[p] for p in graph.parent_positions(d)] == ["b", "c"]
+    assert [graph.unique_ids[c] for c in graph.child_positions(d)] == ["e"]
+
+    ranks = graph.topological_ranks()
+    for position in range(len(graph)):
+        for parent in graph.parent_positions(position):
+            assert ranks[parent] < ranks[position]
+
+
+def test_graph_ancestors(graph):
+    assert graph.ancestors("e") == ["d", "b", "c", "a"]
+    assert graph.ancestors("e", depth=1) == ["d"]
+    assert graph.ancestors("e", depth=2) == ["d", "b", "c"]
+    assert graph.ancestors("a") == []
+
+
+def test_graph_descendants(graph):
+    assert graph.descendants("a") == ["b", "c", "d", "e"]
+    assert graph.descendants("a", depth=1) == ["b", "c"]
+    assert graph.descendants("f") == []
+
+
+def test_graph_unknown_unique_id(graph):
+    with pytest.raises(KeyError):
+        graph.ancestors("z")
+
+
+def test_graph_shortest_path(graph):
+    assert graph.shortest_path("a", "e") == ["a", "b", "d", "e"]
+    assert graph.shortest_path("a", "a") == ["a"]
+    assert graph.shortest_path("e", "a") is None
+    assert graph.shortest_path("a", "f") is None
+
+
+def test_graph_topological_order(graph):
+    order = graph.topological_order()
+    assert sorted(order) == sorted(graph.unique_ids)
+    for unique_id in order:
+        for parent in graph.parents(unique_id):
+            assert order.index(parent) < order.index(unique_id)
+
+
+def test_graph_topological_order_of_subset(graph):
+    assert graph.topological_order(["e", "b", "a"]) == ["a", "b", "e"]
+
+
+def test_graph_cycles(graph):
+    assert graph.find_cycle() is None
+
+    cyclic = Graph({"a": ["c"], "b": ["a"], "c": ["b"], "d": []})
+    cycle = cyclic.find_cycle()
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {"a", "b", "c"}
+    with pytest.raises(CycleError):
+        cyclic.topological_order()
+
+
+def test_manifest_graph(manifest):
+    assert manifest.graph is manifest.graph
+    for unique_id, parents in manifest.parent_map.items():
+        assert manifest.graph.parents(unique_id) == [p.unique_id for p in parents]
+    for unique_id, children in manifest.child_map.items():
+        assert set(manifest.graph.children(unique_id)) == {
+            c.unique_id for c in children
+        }
+
+
+def test_manifest_graph_is_acyclic(manifest):
+    assert manifest.graph.find_cycle() is None
+    assert len(manifest.graph.topological_order()) == len(manifest.graph)
+
+
+def test_node_ancestors_and_descendants(manifest):
+    for model in manifest.iter_resource_type("model"):
+        ancestors = {a.unique_id for a in model.ancestors()}
+        assert {p.unique_id for p in model.parents} <= ancestors
+        assert {p.unique_id for p in model.ancestors(depth=1)} == {
+            p.unique_id for p in model.parents
+        }
+        descendants = {d.unique_id for d in model.descendants()}
+        assert {c.unique_id for c in model.children} <= descendants
@@ -0,0 +1,125 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from artefacts.history import RunHistory, FailureRate
+from artefacts.loaders import compress_artifact
+from .conftest import raw_run_results
+
+
+CUSTOMERS = "model.shop.customers"
+PRODUCTS = "model.shop.products"
+
+
+@pytest.fixture
+def run_results_dir(tmp_path):
+    """Thirty days of archived run_results, where customers fails every third
+    day and gets slower each day."""
+
+    for day in range(30):
+        run_results = raw_run_results(
+            [(CUSTOMERS, "Thread-1", 0, day + 1), (PRODUCTS, "Thread-2", 0, 1)],
+            started_at=f"2022-03-{day + 1:02d}T09:00:00",
+        )
+        run_results["metadata"]["invocation_id"] = f"invocation-{day}"
+        run_results["metadata"]["generated_at"] = f"2022-03-{day + 1:02d}T10:00:00Z"
+        run_results["results"][0]["status"] = "error" if day % 3 == 0 else "success"
+
+        directory = tmp_path / "runs" / f"day-{day:02d}"
+        os.makedirs(directory)
+        with open(directory / "run_results.json", "w") as fh:
+            json.dump(run_results, fh)
+        if day % 2:
+            compress_artifact(str(directory / "run_results.json"), remove=True)
+
+    return str(tmp_path / "runs")
+
+
+@pytest.fixture
+def history(run_results_dir):
+    with RunHistory() as history:
+        history.ingest(run_results_dir, processes=False)
+        yield history
+
+
+def test_find_run_results(run_results_dir):
+    paths = RunHistory.find_run_results(run_results_dir)
+    assert len(paths) == 30
+    assert len([p for p in paths if p.endswith(".gz")]) == 15
+
+
+@pytest.mark.parametrize("processes", [True, False])
+def test_ingest_directory(run_results_dir, processes):
+    history = RunHistory()
+    ingested = history.ingest(run_results_dir, processes=processes, max_workers=2)
+    assert sorted(ingested) == sorted(f"invocation-{day}" for day in range(30))
+    assert len(history.invocations()) == 30
+    assert history.invocations()[0].invocation_id == "invocation-0"
+
+
+def test_ingest_skips_ingested_invocations(history, run_results_dir, tmp_path):
+    assert history.ingest(run_results_dir, processes=False) == []
+
+    # A copy of an ingested file, whose invocation_id isn't near its start
+    with open(RunHistory.find_run_results(run_results_dir)[0]) as fh:
+        run_results = json.load(fh)
+    copy = {"results": run_results["results"], "metadata": run_results["metadata"]}
+    with open(tmp_path / "copy_run_results.json", "w") as fh:
+        json.dump(copy, fh)
+
+    assert history.ingest(str(tmp_path / "copy_run_results.json")) == []
+    assert len(history.runs(CUSTOMERS)) == 30
+
+
+def test_ingest_persists(run_results_dir, tmp_path):
+    path = str(tmp_path / "history.db")
+    with RunHistory(path) as history:
+        history.ingest(run_results_dir, processes=False)
+    with RunHistory(path) as history:
+        assert len(history.invocations()) == 30
+        assert history.ingest(run_results_dir) == []
+
+
+def test_runs(history):
+    runs = history.runs(CUSTOMERS)
+    assert [r.execution_time for r in runs] == [float(d + 1) for d in range(30)]
+    assert runs[0].status == "error"
+    assert runs[0].started_at is not None
+
+
+def test_execution_time_percentiles(history):
+    percentiles = history.execution_time_percentiles([CUSTOMERS], [0, 50, 90, 100])
+    assert percentiles == {CUSTOMERS: {0: 1.0, 50: 15.5, 90: 27.1, 100: 30.0}}
+
+    march = history.execution_time_percentiles(
+        percentiles=[50],
+        since=datetime.datetime(2022, 3, 11),
+        until=datetime.date(2022, 3, 21),
+        statuses=["success"],
+    )
+    assert march[CUSTOMERS][50] == 15.0  # Excludes the errors on days 13, 16, 19
+    assert PRODUCTS in march
+
+
+def test_failure_rates(history):
+    assert history.failure_rates([CUSTOMERS, PRODUCTS]) == [
+        FailureRate(CUSTOMERS, None, 30, 10, 10 / 30),
+        FailureRate(PRODUCTS, None, 30, 0, 0.0),
+    ]
+
+
+@pytest.mark.parametrize(
+    "period,groups", [("hour", 30), ("day", 30), ("week", 5), ("month", 1)]
+)
+def test_failure_rates_by_period(history, period, groups):
+    rates = history.failure_rates([CUSTOMERS], period=period)
+    assert len(rates) == groups
+    assert sum(r.runs for r in rates) == 30
+    assert sum(r.failures for r in rates) == 10
+
+
+def test_failure_rates_rejects_unknown_periods(history):
+    with pytest.raises(ValueError):
+        history.failure_rates(period="fortnight")
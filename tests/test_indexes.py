@@ -0,0 +1,87 @@
+import pytest
+
+from artefacts.indexes import ManifestIndex
+from .conftest import testing_poffertjes_shop  # noqa
+
+
+def test_manifest_index_is_cached(manifest):
+    assert isinstance(manifest.index, ManifestIndex)
+    assert manifest.index is manifest.index
+    assert manifest.resources is manifest.resources
+
+
+def test_manifest_index_matches_resources(manifest):
+    index = manifest.index
+    merged = {
+        **manifest.nodes,
+        **manifest.sources,
+        **manifest.macros,
+        **manifest.exposures,
+        **manifest.metrics,
+        **{k: v[0] for k, v in manifest.raw_disabled.items()},
+    }
+    assert list(index.unique_ids) == list(merged)
+    assert len(index) == len(merged)
+    for unique_id, resource in merged.items():
+        assert unique_id in index
+        assert index[unique_id] is resource
+
+
+def test_manifest_index_by_resource_type(manifest):
+    for resource_type, unique_ids in manifest.index.by_resource_type.items():
+        for unique_id in unique_ids:
+            assert manifest.index[unique_id].resource_type == resource_type
+
+
+def test_manifest_index_by_package_name(manifest):
+    for package_name, unique_ids in manifest.index.by_package_name.items():
+        for unique_id in unique_ids:
+            assert manifest.index[unique_id].package_name == package_name
+
+
+def test_manifest_index_by_tag(manifest):
+    for tag, unique_ids in manifest.index.by_tag.items():
+        for unique_id in unique_ids:
+            assert tag in manifest.index[unique_id].tags
+    assert manifest.tags.keys() == manifest.index.by_tag.keys()
+
+
+def test_manifest_index_disabled(manifest):
+    assert manifest.index.disabled == set(manifest.disabled)
+    for unique_id in manifest.index.iter_unique_ids(include_disabled=False):
+        assert unique_id not in manifest.disabled
+
+
+def test_manifest_index_get(manifest):
+    assert manifest.index.get("model.does_not.exist") is None
+    with pytest.raises(KeyError):
+        manifest.index["model.does_not.exist"]
+
+
+@pytest.mark.skipif("not testing_poffertjes_shop")
+def test_manifest_index_iter_unique_ids(manifest):
+    unique_ids = list(
+        manifest.index.iter_unique_ids(
+            resource_type="model", package_name="poffertjes_shop"
+        )
+    )
+    assert len(unique_ids) > 0
+    assert all(u.startswith("model.poffertjes_shop.") for u in unique_ids)
+
+
+def test_run_results_index(run_results):
+    assert run_results.index is run_results.index
+    for result in run_results.results:
+        assert result in run_results.index.get(result.unique_id)
+    assert run_results.index.get("model.does_not.exist") == []
+
+
+def test_sources_index(sources):
+    for result in sources.results:
+        assert result in sources.index.get(result.unique_id)
+
+
+def test_results_index_returns_copies(run_results):
+    unique_id = run_results.results[0].unique_id
+    run_results.index.get(unique_id).clear()
+    assert len(run_results.index.get(unique_id)) > 0
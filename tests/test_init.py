@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import artefacts
+
+
+def test_import_is_lazy():
+    # The models, pydantic and the config are only imported when they are used
+    code = (
+        "import sys, artefacts; "
+        "print(sorted(m for m in sys.modules if m.startswith("
+        "('artefacts.', 'pydantic', 'pkg_resources', 'toml'))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_lazy_attributes():
+    from artefacts.config import Config
+    from artefacts.deserializers import Manifest, load_all
+
+    assert artefacts.Config is Config
+    assert artefacts.Manifest is Manifest
+    assert artefacts.load_all is load_all
+    assert {"Manifest", "Config", "__version__"} <= set(dir(artefacts))
+
+
+def test_submodules_are_imported_on_access():
+    code = "import artefacts; artefacts.state.get; print(artefacts.models.__name__)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "artefacts.models"
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        artefacts.Graph
+    with pytest.raises(AttributeError):
+        artefacts.does_not_exist
@@ -0,0 +1,194 @@
+import io
+import json
+import os
+import sys
+
+import pydantic
+import pytest
+
+from artefacts.deserializers import Manifest, RunResults, Catalog, Sources
+from artefacts.config import Config
+from artefacts.loaders import (
+    FileSystemLoader,
+    MmapFileSystemLoader,
+    StreamingFileSystemLoader,
+    JSONStream,
+    compress_artifact,
+    compress_artifacts,
+    json_decoder,
+)
+import artefacts.loaders
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(StreamingFileSystemLoader, "chunk_size", 7)
+
+
+def test_json_stream_iterates_objects():
+    doc = '{"a": 1.25, "b": {"c": [1, 2]}, "d": [{"e": null}, "f"], "g": {}}'
+    stream = JSONStream(io.StringIO(doc), chunk_size=3)
+    result = dict()
+    for key in stream.iter_object():
+        if key == "b":
+            result[key] = {k: stream.decode_value() for k in stream.iter_object()}
+        elif key == "d":
+            result[key] = list(stream.iter_array())
+        else:
+            result[key] = stream.decode_value()
+    assert result == json.loads(doc)
+
+
+def test_json_stream_does_not_truncate_numbers():
+    stream = JSONStream(io.StringIO('{"a": 123456789}'), chunk_size=8)
+    assert [(k, stream.decode_value()) for k in stream.iter_object()] == [
+        ("a", 123456789)
+    ]
+
+
+def test_json_stream_raises_on_invalid_documents():
+    stream = JSONStream(io.StringIO('{"a": 1 "b": 2}'), chunk_size=4)
+    with pytest.raises(json.JSONDecodeError):
+        for key in stream.iter_object():
+            stream.decode_value()
+
+
+@pytest.mark.parametrize("deserializer", [Manifest, RunResults, Catalog, Sources])
+def test_streaming_loader_matches_file_system_loader(deserializer, small_chunks):
+    streamed = deserializer.deserialize(Loader=StreamingFileSystemLoader)
+    loaded = deserializer.deserialize(Loader=FileSystemLoader)
+    assert type(streamed) is deserializer.model
+    assert streamed.metadata == loaded.metadata
+    for name, field in deserializer.model.__fields__.items():
+        if field.sub_fields and not field.allow_none:
+            assert streamed.dict()[name] == loaded.dict()[name]
+
+
+def test_streaming_loader_parses_node_references():
+    manifest = Manifest.deserialize(Loader=StreamingFileSystemLoader)
+    for k, v in manifest.parent_map.items():
+        for node_reference in v:
+            assert node_reference.node is not None
+
+
+def test_streaming_loader_raises_validation_errors(tmp_path, config):
+    (tmp_path / "run_results.json").write_text('{"results": [{"status": 1}]}')
+    loader = StreamingFileSystemLoader(config=config)
+    loader.artifact_path = lambda name: str(tmp_path / f"{name}.json")
+    with pytest.raises(pydantic.ValidationError):
+        loader.load_model("run_results", RunResults.model)
+
+
+@pytest.fixture
+def clean_json_decoder():
+    json_decoder.cache_clear()
+    yield
+    json_decoder.cache_clear()
+
+
+def test_json_decoder_prefers_installed_backends(clean_json_decoder):
+    orjson = pytest.importorskip("orjson")
+    assert json_decoder("auto") is orjson.loads
+    assert json_decoder("json") is json.loads
+
+
+def test_json_decoder_falls_back_to_json(clean_json_decoder, monkeypatch):
+    for name in ["orjson", "simdjson", "ujson"]:
+        monkeypatch.setitem(sys.modules, name, None)
+    assert json_decoder("auto") is json.loads
+    assert json_decoder("ujson") is json.loads
+
+
+def test_json_decoder_rejects_unknown_backends(clean_json_decoder):
+    with pytest.raises(ValueError):
+        json_decoder("yaml")
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "simdjson", "ujson", "json"])
+def test_loader_json_backends(clean_json_decoder, backend):
+    loader = FileSystemLoader(config=Config(json_backend=backend))
+    with open(loader.artifact_path("run_results")) as fh:
+        expected = json.load(fh)
+    assert loader.load("run_results") == expected
+
+
+def test_loader_accepts_nan(clean_json_decoder, tmp_project):
+    loader = FileSystemLoader(config=tmp_project)
+    with open(os.path.join(tmp_project.dbt_target_dir, "nan.json"), "w") as fh:
+        fh.write('{"value": NaN}')
+    assert loader.load("nan")["value"] != loader.load("nan")["value"]
+
+
+@pytest.mark.parametrize("backend", ["auto", "json"])
+@pytest.mark.parametrize("name", ["manifest", "run_results", "catalog", "sources"])
+def test_mmap_loader_matches_file_system_loader(clean_json_decoder, name, backend):
+    config = Config(json_backend=backend)
+    expected = FileSystemLoader(config=config).load(name)
+    assert MmapFileSystemLoader(config=config).load(name) == expected
+
+
+def test_mmap_loader_deserializes_artifacts(clean_state):
+    manifest = Manifest.deserialize(Loader=MmapFileSystemLoader)
+    assert manifest.nodes == Manifest.deserialize().nodes
+
+
+def test_mmap_loader_accepts_nan(clean_json_decoder, tmp_project):
+    loader = MmapFileSystemLoader(config=tmp_project)
+    with open(os.path.join(tmp_project.dbt_target_dir, "nan.json"), "w") as fh:
+        fh.write('{"value": NaN}')
+    assert loader.load("nan")["value"] != loader.load("nan")["value"]
+
+
+def test_mmap_loader_rejects_empty_files(tmp_project):
+    loader = MmapFileSystemLoader(config=tmp_project)
+    open(os.path.join(tmp_project.dbt_target_dir, "empty.json"), "w").close()
+    with pytest.raises(ValueError):
+        loader.load("empty")
+
+
+@pytest.mark.parametrize(
+    "Loader", [FileSystemLoader, MmapFileSystemLoader, StreamingFileSystemLoader]
+)
+def test_loaders_read_compressed_artifacts(clean_state, tmp_project, Loader):
+    compressed = compress_artifacts(tmp_project.dbt_target_dir, remove=True)
+    assert len(compressed) == 4
+    assert all(path.endswith(".json.gz") for path in compressed)
+
+    loader = Loader(config=tmp_project)
+    assert loader.artifact_path("manifest").endswith("manifest.json.gz")
+    assert loader.fingerprint("manifest")[0].endswith("manifest.json.gz")
+
+    manifest = Manifest.deserialize(Loader=Loader, config=tmp_project)
+    assert manifest.nodes == Manifest.deserialize(config=Config()).nodes
+
+
+def test_loader_prefers_uncompressed_artifacts(tmp_project):
+    loader = FileSystemLoader(config=tmp_project)
+    compress_artifact(loader.artifact_path("manifest"))
+    assert loader.artifact_path("manifest").endswith("manifest.json")
+    assert loader.artifact_path("manifest.json.gz").endswith("manifest.json.gz")
+
+
+def test_compress_artifact_zstd(tmp_project):
+    pytest.importorskip("zstandard")
+    loader = FileSystemLoader(config=tmp_project)
+    expected = loader.load("run_results")
+    compress_artifact(loader.artifact_path("run_results"), "zstd", remove=True)
+    assert loader.artifact_path("run_results").endswith("run_results.json.zst")
+    assert loader.load("run_results") == expected
+
+
+def test_zstd_requires_zstandard(tmp_project, monkeypatch):
+    monkeypatch.setattr(artefacts.loaders, "zstandard", None)
+    path = os.path.join(tmp_project.dbt_target_dir, "manifest.json")
+    with pytest.raises(ImportError):
+        compress_artifact(path, "zstd")
+    assert sorted(os.listdir(tmp_project.dbt_target_dir)) == sorted(
+        ["manifest.json", "run_results.json", "catalog.json", "sources.json"]
+    )
+
+
+def test_compress_artifact_rejects_unknown_compression(tmp_project):
+    path = os.path.join(tmp_project.dbt_target_dir, "manifest.json")
+    with pytest.raises(ValueError):
+        compress_artifact(path, "bz2")
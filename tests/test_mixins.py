@@ -1,5 +1,7 @@
 import pytest
 
+from artefacts.config import Config
+from artefacts.deserializers import Catalog, Manifest
 from .conftest import testing_poffertjes_shop  # noqa
 
 
@@ -48,3 +50,36 @@ def test_sources_have_snapshots(manifest):
 def test_models_have_tests(manifest):
     model = manifest.resources["model.poffertjes_shop.base_orders"]
     assert len(model.tests) > 0
+
+
+def test_node_readers_read_artifacts_of_their_target_dir(clean_state, tmp_projects):
+    config_a, config_b = tmp_projects
+    Manifest(config=config_a)
+    manifest = Manifest(config=config_b)
+    assert manifest is not Manifest(config=config_a)
+
+    unique_id = next(iter(manifest.nodes))
+    node = manifest.nodes[unique_id]
+    assert node.manifest is manifest.index[unique_id]
+    assert node.manifest_artifact is manifest
+    assert node.parents == manifest.parent_map[unique_id]
+    for parent in node.parents:
+        assert parent.manifest_artifact is manifest
+    for ancestor in node.ancestors():
+        assert ancestor.manifest_artifact is manifest
+
+    # Artifacts that aren't loaded yet are loaded from the node's target dir
+    catalog = node.catalog_artifact
+    assert catalog is Catalog(config=config_b)
+    assert catalog is not Catalog(config=config_a)
+    assert catalog.nodes[next(iter(catalog.nodes))].catalog_artifact is catalog
+
+
+def test_lazy_node_readers_read_artifacts_of_their_target_dir(
+    clean_state, tmp_projects
+):
+    config_a, config_b = tmp_projects
+    Manifest(config=config_a)
+    manifest = Manifest(config=Config(**{**config_b, "lazy_load": True}))
+    node = manifest.nodes[next(iter(manifest.nodes))]
+    assert node.manifest_artifact is manifest
@@ -1,9 +1,12 @@
+import pydantic
 import pytest
 from pydantic import BaseModel
 
 from .conftest import testing_poffertjes_shop  # noqa
 
-from artefacts.models import ManifestModel
+from artefacts.config import Config
+from artefacts.loaders import FileSystemLoader
+from artefacts.models import ManifestModel, LazyMapping
 
 
 def test_manifest_resources(manifest):
@@ -147,3 +150,42 @@ def test_models_have_attribute_docs(base_model, compiled_reference_docs):
 def test_manifest_tags(manifest):
     assert len(manifest.tags) > 0
     assert len(manifest.tags["internal"]) > 0
+
+
+@pytest.fixture
+def lazy_manifest():
+    loader = FileSystemLoader(config=Config())
+    return ManifestModel._parse_obj_lazy(loader.load("manifest"))
+
+
+def test_lazy_manifest_defers_validation(lazy_manifest):
+    assert isinstance(lazy_manifest.nodes, LazyMapping)
+    assert isinstance(lazy_manifest.macros, LazyMapping)
+    assert len(lazy_manifest.nodes._parsed) == 0
+    assert len(lazy_manifest.macros._parsed) == 0
+
+
+def test_lazy_manifest_matches_manifest(lazy_manifest, manifest):
+    assert list(lazy_manifest.nodes) == list(manifest.nodes)
+    for unique_id, node in manifest.nodes.items():
+        assert lazy_manifest.nodes[unique_id] == node
+        assert lazy_manifest.nodes[unique_id] is lazy_manifest.nodes[unique_id]
+    assert lazy_manifest.resources.keys() == manifest.resources.keys()
+
+
+def test_lazy_manifest_tags_keep_resources_unparsed(lazy_manifest, manifest):
+    unique_id = next(iter(lazy_manifest.nodes))
+    parsed = lazy_manifest.nodes[unique_id]
+    assert lazy_manifest.index.by_tag == manifest.index.by_tag
+    assert list(lazy_manifest.nodes._parsed.values()) == [parsed]
+    assert len(lazy_manifest.macros._parsed) == 0
+
+
+def test_lazy_mapping_raises_validation_errors():
+    field = ManifestModel.__fields__["macros"]
+    mapping = LazyMapping(ManifestModel, field, {"macro.a.b": {"name": "b"}})
+    assert len(mapping) == 1
+    with pytest.raises(pydantic.ValidationError):
+        mapping["macro.a.b"]
+    with pytest.raises(KeyError):
+        mapping["macro.a.c"]
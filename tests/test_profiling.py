@@ -0,0 +1,102 @@
+import logging
+
+import pytest
+
+from artefacts.config import Config
+from artefacts.deserializers import Catalog, Manifest, load_all
+from artefacts.loaders import StreamingFileSystemLoader
+from artefacts.profiling import LoadStats, load_stats, profile
+
+
+def test_profile_records_phases_and_sections():
+    with profile() as profiles:
+        manifest = Manifest.deserialize()
+
+    assert profiles == [load_stats(manifest)]
+    stats = profiles[0]
+    assert stats.artifact_name == "manifest"
+    assert list(stats.phases) == ["read", "decode", "validate"]
+    assert stats.seconds == pytest.approx(sum(stats.phases.values()))
+    assert stats.sections["nodes"].count == len(manifest.nodes)
+    assert stats.sections["disabled"].count == len(manifest.raw_disabled)
+    assert stats.sections["macros"].seconds > 0
+    assert stats.sections["macros"].memory_bytes > 0
+
+
+def test_profiled_artifacts_are_parsed_identically():
+    with profile():
+        profiled = Manifest.deserialize()
+    expected = Manifest.deserialize()
+
+    # Node references are compared by identity, so the graphs are compared
+    # by their unique_ids
+    exclude = {"parent_map", "child_map"}
+    assert profiled.dict(exclude=exclude) == expected.dict(exclude=exclude)
+    for unique_id, parents in expected.parent_map.items():
+        assert [p.unique_id for p in profiled.parent_map[unique_id]] == [
+            p.unique_id for p in parents
+        ]
+
+
+def test_artifacts_are_not_profiled_by_default():
+    assert load_stats(Manifest.deserialize()) is None
+
+
+def test_profile_load_config():
+    config = Config(profile_load=True, lazy_load=True)
+    stats = load_stats(Manifest.deserialize(config=config))
+    assert list(stats.phases) == ["read", "decode", "validate"]
+    assert stats.sections["nodes"].seconds is None
+
+
+def test_profile_records_optional_phases():
+    config = Config(compact_nodes=True, deduplicate=True)
+    with profile() as profiles:
+        Manifest.deserialize(config=config)
+        Catalog.deserialize(Loader=StreamingFileSystemLoader)
+    assert list(profiles[0].phases) == [
+        "read",
+        "decode",
+        "validate",
+        "compact",
+        "deduplicate",
+    ]
+    assert list(profiles[1].phases) == ["stream"]
+
+
+def test_profile_records_cache_phases(tmp_path):
+    config = Config(cache_dir=str(tmp_path))
+    with profile() as profiles:
+        Manifest.deserialize(config=config)
+        Manifest.deserialize(config=config)
+    assert "validate" in profiles[0].phases
+    assert list(profiles[1].phases) == ["cache"]
+
+
+def test_load_stats_phases_are_exclusive():
+    stats = LoadStats("manifest")
+    with stats.phase("read"):
+        with stats.phase("decode"):
+            pass
+    with stats.phase("read"):
+        pass
+    assert list(stats.phases) == ["read", "decode"]
+    assert stats.seconds == pytest.approx(sum(stats.phases.values()))
+
+
+@pytest.mark.parametrize("processes", [True, False])
+def test_profile_collects_load_all(clean_state, processes):
+    with profile() as profiles:
+        load_all(["manifest", "run_results"], processes=processes)
+    assert sorted(s.artifact_name for s in profiles) == ["manifest", "run_results"]
+
+
+def test_profiled_loads_are_logged(caplog):
+    with caplog.at_level(logging.DEBUG, logger="artefacts.profiling"):
+        with profile():
+            Manifest.deserialize()
+
+    events = [r.artefacts for r in caplog.records]
+    assert {"artifact_name": "manifest", "phase": "read"}.items() <= events[0].items()
+    assert events[-1]["sections"]["nodes"]["count"] > 0
+    assert caplog.records[-1].levelno == logging.INFO
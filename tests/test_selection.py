@@ -0,0 +1,190 @@
+import pytest
+
+from artefacts.api import select
+from artefacts.deserializers import Manifest
+from artefacts.models import ManifestModel
+from artefacts.selection import Criterion, NodeSelector, SelectionError
+from .conftest import raw_manifest, testing_poffertjes_shop  # noqa
+
+
+# raw -> base -> not_null_base_id, and raw -> other -> both_ids <- base
+PARENT_MAP = {
+    "seed.shop.raw": [],
+    "model.shop.base": ["seed.shop.raw"],
+    "model.shop.other": ["seed.shop.raw"],
+    "test.shop.not_null_base_id": ["model.shop.base"],
+    "test.shop.both_ids": ["model.shop.base", "model.shop.other"],
+}
+
+
+@pytest.fixture
+def raw_shop_manifest():
+    raw = raw_manifest(PARENT_MAP)
+    raw["selectors"] = {"bases": {"name": "bases", "definition": "base"}}
+    return raw
+
+
+@pytest.fixture
+def selector(manifest):
+    return NodeSelector(manifest)
+
+
+def test_criterion_parse():
+    assert Criterion.parse("2+tag:nightly+") == Criterion(
+        method="tag", value="nightly", parents=True, parents_depth=2, children=True
+    )
+    assert Criterion.parse("@model_a") == Criterion(
+        method="fqn", value="model_a", childrens_parents=True
+    )
+    assert Criterion.parse("models/marts").method == "path"
+    assert Criterion.parse("model_a.sql").method == "file"
+    assert Criterion.parse("config.materialized:view").method == "config.materialized"
+
+
+@pytest.mark.parametrize("raw", ["", "@+model_a", "tag:"])
+def test_criterion_parse_invalid(raw):
+    with pytest.raises(SelectionError):
+        Criterion.parse(raw)
+
+
+def test_select_all_excludes_disabled_and_macros(selector, manifest):
+    selected = selector.select()
+    assert len(selected) > 0
+    assert not any(u in manifest.disabled for u in selected)
+    assert not any(u.startswith("macro.") for u in selected)
+
+
+def test_select_parents_and_children(selector, manifest):
+    for model in manifest.iter_resource_type("model"):
+        selected = set(selector.select(f"+{model.name}", indirect_selection="cautious"))
+        assert model.unique_id in selected
+        assert {p.unique_id for p in model.parents} <= selected
+
+        selected = set(selector.select(f"{model.name}+"))
+        assert {c.unique_id for c in model.children} <= selected | set(
+            manifest.disabled
+        )
+
+
+def test_select_depth(selector, manifest):
+    model = next(manifest.iter_resource_type("model"))
+    selected = set(selector.select(f"1+{model.name}", indirect_selection="cautious"))
+    ancestors = {a.unique_id for a in model.ancestors(depth=1)}
+    assert {u for u in selected if not u.startswith("test.")} <= ancestors | {
+        model.unique_id
+    }
+
+
+def test_select_indirect_tests(selector, manifest):
+    for test in manifest.iter_resource_type("test"):
+        parent = test.parents[0].node
+        if parent.resource_type == "model":
+            assert test.unique_id in selector.select(parent.name)
+
+
+def test_select_resource_type_and_package(selector):
+    models = selector.select("resource_type:model")
+    assert len(models) > 0
+    assert all(u.startswith(("model.", "test.")) for u in models)
+    assert selector.select("package:does_not_exist") == []
+
+
+def test_select_intersection_and_exclude(selector, manifest):
+    selected = selector.select("resource_type:model,tag:internal")
+    for unique_id in selected:
+        if not unique_id.startswith("test."):
+            assert unique_id.startswith("model.")
+            assert "internal" in manifest.index[unique_id].tags
+
+    excluded = selector.select("resource_type:model", exclude="tag:internal")
+    assert not set(selected) & set(excluded)
+
+
+def test_select_unsupported_method(selector):
+    with pytest.raises(SelectionError):
+        selector.select("state:modified")
+
+
+def test_select_yaml_definitions(selector):
+    models = set(selector.select("resource_type:model"))
+    union = selector._select_definition(
+        {"union": [{"method": "resource_type", "value": "model"}]}, "eager"
+    )
+    assert models <= union
+
+    intersection = selector._select_definition(
+        {
+            "intersection": [
+                "resource_type:model",
+                {"resource_type": "model"},
+                {"exclude": [{"method": "tag", "value": "internal"}]},
+            ]
+        },
+        "eager",
+    )
+    assert intersection == set(
+        selector.select("resource_type:model", exclude="tag:internal")
+    )
+
+
+def test_select_manifest_selectors(selector, manifest):
+    for name in manifest.selectors:
+        selector.select(selector=name)
+
+    with pytest.raises(SelectionError):
+        selector.select(selector="does_not_exist")
+
+
+@pytest.mark.skipif("not testing_poffertjes_shop")
+def test_select_sources(selector):
+    assert "source.poffertjes_shop.raw.orders" in selector.select("source:raw.orders")
+    assert "source.poffertjes_shop.raw.orders" in selector.select("source:raw")
+    assert "source.poffertjes_shop.raw.orders" in selector.select("source:*")
+
+
+@pytest.mark.skipif("not testing_poffertjes_shop")
+def test_api_select():
+    resources = select("tag:internal")
+    assert len(resources) > 0
+    assert all("internal" in r.tags or r.resource_type == "test" for r in resources)
+
+
+def test_manifest_selector_is_cached(manifest):
+    assert isinstance(manifest.selector, NodeSelector)
+    assert manifest.selector is manifest.selector
+    assert manifest.selector.manifest is manifest
+
+
+def test_api_select_reuses_the_manifest_selector(clean_state):
+    manifest = Manifest()
+    select("resource_type:model")
+    assert manifest._selector is not None
+    assert select("resource_type:model") == [
+        manifest.index[u] for u in manifest.selector.select("resource_type:model")
+    ]
+
+
+@pytest.mark.parametrize(
+    "select", ["fqn:shop.base", "path:models/base.sql", "config.materialized:view"]
+)
+def test_select_keeps_lazy_resources_unparsed(raw_shop_manifest, select):
+    manifest = ManifestModel._parse_obj_lazy(raw_shop_manifest)
+    manifest.selector.select(select, exclude="resource_type:test")
+    assert len(manifest.nodes._parsed) == 0
+
+
+def test_select_from_lazy_manifest(raw_shop_manifest):
+    lazy_manifest = ManifestModel._parse_obj_lazy(raw_shop_manifest)
+    manifest = ManifestModel.parse_obj(raw_shop_manifest)
+    for criterion in ["fqn:shop.base", "path:models", "file:other.sql", "tag:*"]:
+        expected = manifest.selector.select(criterion)
+        assert lazy_manifest.selector.select(criterion) == expected
+
+
+def test_selector_method_indirect_selection(raw_shop_manifest):
+    selector = ManifestModel.parse_obj(raw_shop_manifest).selector
+    assert selector.select("selector:bases", indirect_selection="cautious") == [
+        "model.shop.base",
+        "test.shop.not_null_base_id",
+    ]
+    assert "test.shop.both_ids" in selector.select("selector:bases")
@@ -0,0 +1,114 @@
+import pytest
+
+from artefacts.models import ManifestModel, RunResultsModel
+from artefacts.simulation import simulate
+from .conftest import raw_manifest, raw_run_results
+
+
+# raw -> base -> report -> not_null_report_id, raw -> wide -> report, and
+# zones on its own
+PARENT_MAP = {
+    "seed.shop.raw": [],
+    "seed.shop.zones": [],
+    "model.shop.base": ["seed.shop.raw"],
+    "model.shop.wide": ["seed.shop.raw"],
+    "model.shop.report": ["model.shop.base", "model.shop.wide"],
+    "test.shop.not_null_report_id": ["model.shop.report"],
+}
+
+RESULTS = [
+    ("seed.shop.raw", "Thread-1", 0, 1),
+    ("seed.shop.zones", "Thread-2", 0, 1),
+    ("model.shop.base", "Thread-1", 1, 3),
+    ("model.shop.wide", "Thread-2", 1, 5),
+    ("model.shop.report", "Thread-1", 5, 6),
+    ("test.shop.not_null_report_id", "Thread-1", 6, 7),
+]
+
+
+@pytest.fixture
+def manifest():
+    return ManifestModel.parse_obj(raw_manifest(PARENT_MAP))
+
+
+@pytest.fixture
+def run_results():
+    return RunResultsModel.parse_obj(raw_run_results(RESULTS))
+
+
+def test_simulate_one_thread_runs_everything_in_series(manifest, run_results):
+    simulation = simulate(threads=1, manifest=manifest, execution_times=run_results)
+    assert simulation.duration == 10.0
+    assert simulation.utilisation == 1.0
+    for previous, run in zip(simulation.runs, simulation.runs[1:]):
+        assert run.started_at == previous.completed_at
+
+
+def test_simulate_respects_dependencies(manifest, run_results):
+    simulation = simulate(threads=8, manifest=manifest, execution_times=run_results)
+    runs = {r.unique_id: r for r in simulation.runs}
+    assert set(runs) == {r.unique_id for r in run_results.results}
+    for unique_id, run in runs.items():
+        for parent in manifest.graph.ancestors(unique_id):
+            if parent in runs:
+                assert runs[parent].completed_at <= run.started_at
+
+    # With enough threads the run takes as long as its critical path
+    assert simulation.duration == 7.0
+    assert simulation.occupancy() == [(0.0, 2), (3.0, 1), (7.0, 0)]
+
+
+def test_simulate_prioritises_shallow_nodes(manifest):
+    simulation = simulate(
+        threads=1,
+        select="raw zones base",
+        manifest=manifest,
+        execution_times={},
+        default_execution_time=1.0,
+    )
+    # zones runs before base, which is deeper in the graph, even though base
+    # sorts first by unique_id
+    assert [r.unique_id for r in simulation.runs] == [
+        "seed.shop.raw",
+        "seed.shop.zones",
+        "model.shop.base",
+    ]
+
+
+def test_simulate_selection(manifest):
+    simulation = simulate(
+        threads=2,
+        select="base+",
+        exclude="resource_type:test",
+        manifest=manifest,
+        execution_times={"model.shop.report": 5.0},
+        default_execution_time=2.0,
+    )
+    assert [(r.unique_id, r.started_at) for r in simulation.runs] == [
+        ("model.shop.base", 0.0),
+        ("model.shop.report", 2.0),
+    ]
+    assert simulation.duration == 7.0
+    assert simulation.busy == [7.0, 0.0]
+
+
+def test_simulate_unselected_ancestors_take_no_time(manifest):
+    simulation = simulate(
+        threads=1,
+        select="wide",
+        manifest=manifest,
+        execution_times={"model.shop.wide": 2.0},
+    )
+    assert simulation.runs[0].started_at == 0.0
+    assert simulation.duration == 2.0
+
+
+def test_simulate_invalid_threads(manifest):
+    with pytest.raises(ValueError):
+        simulate(threads=0, manifest=manifest)
+
+
+def test_simulate_defaults_to_project_artifacts():
+    simulation = simulate(threads=4)
+    assert simulation.duration == max(r.completed_at for r in simulation.runs)
+    assert simulate(threads=1).duration >= simulation.duration
@@ -0,0 +1,124 @@
+import threading
+import time
+
+from artefacts.config import Config
+from artefacts.deserializers import Manifest
+from artefacts.state import ArtifactStore
+import artefacts.state
+
+
+def test_store_is_keyed_by_target_dir():
+    store = ArtifactStore()
+    store.set("manifest", "a", target_dir="/projects/a")
+    store.set("manifest", "b", target_dir="/projects/b")
+    assert store.get("manifest", target_dir="/projects/a") == "a"
+    assert store.get("manifest", target_dir="/projects/b") == "b"
+    assert store.get("manifest") is None
+    assert len(store) == 2
+
+
+def test_store_defaults_to_target_dir_of_config():
+    store = ArtifactStore()
+    config = store.set("config", Config(dbt_project_dir="/projects/a"))
+    store.set("manifest", "a")
+    assert store.get("manifest", target_dir=config.dbt_target_dir) == "a"
+    assert (config.dbt_target_dir, "manifest") in store
+
+
+def test_store_evicts_least_recently_used():
+    store = ArtifactStore(max_size=2)
+    store.set("config", Config())
+    store.set("manifest", "a", target_dir="a")
+    store.set("manifest", "b", target_dir="b")
+    store.get("manifest", target_dir="a")
+    store.set("manifest", "c", target_dir="c")
+
+    assert store.exists("manifest", target_dir="a")
+    assert not store.exists("manifest", target_dir="b")
+    assert store.exists("manifest", target_dir="c")
+    assert store.exists("config")
+
+
+def test_store_loads_each_key_once():
+    store = ArtifactStore()
+    calls = list()
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = list()
+    threads = [
+        threading.Thread(target=lambda: results.append(store.get_or_load("k", load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_store_get_or_load_while_evicting():
+    store = ArtifactStore(max_size=1)
+
+    def load():
+        time.sleep(0.01)
+        return object()
+
+    def get_or_load():
+        results.append(store.get_or_load("k", load))
+        store.set("other", object(), target_dir="other")
+
+    results = list()
+    threads = [threading.Thread(target=get_or_load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The key may be evicted and loaded again, but is always returned, and
+    # its lock is discarded once no thread uses it
+    assert len(results) == 8 and all(r is not None for r in results)
+    assert store._locks == dict()
+
+
+def test_store_keeps_configs_of_target_dirs():
+    store = ArtifactStore(max_size=1)
+    default = store.set("config", Config())
+    other = store.set("config", Config(dbt_target_dir="other"), target_dir="other")
+    store.set("manifest", "a", target_dir="a")
+    store.set("manifest", "b", target_dir="b")
+    assert store.get("config") is default
+    assert store.get("config", target_dir="other") is other
+
+
+def test_store_reloads_on_new_fingerprint():
+    store = ArtifactStore()
+    assert store.get_or_load("k", lambda: 1, fingerprint="x") == 1
+    assert store.get_or_load("k", lambda: 2, fingerprint="x") == 1
+    assert store.get_or_load("k", lambda: 3, fingerprint="y") == 3
+    assert store.fingerprint("k") == "y"
+
+
+def test_use_activates_store(clean_state):
+    store = ArtifactStore()
+    with artefacts.state.use(store):
+        manifest = Manifest()
+        assert artefacts.state.current() is store
+    assert store.get("manifest") is manifest
+    assert artefacts.state.get("manifest") is None
+
+
+def test_deserializers_load_several_projects(clean_state, tmp_project):
+    default = Manifest()
+    other = Manifest(config=tmp_project)
+    assert other is not default
+    assert Manifest() is default
+    assert Manifest(config=tmp_project) is other
+    assert (
+        artefacts.state.get("manifest", target_dir=tmp_project.dbt_target_dir) is other
+    )
@@ -0,0 +1,112 @@
+import json
+import os
+
+import pydantic
+import pytest
+
+from artefacts.config import Config
+from artefacts.deserializers import ARTIFACT_DESERIALIZERS, Manifest, RunResults
+from artefacts.loaders import FileSystemLoader
+from artefacts.models import (
+    CatalogNodeStats,
+    ManifestModel,
+    ManifestNodeReference,
+    ManifestTestNode,
+)
+from artefacts.profiling import profile
+from artefacts.trusted import construct
+
+
+def comparable(value):
+    # Node references are compared by identity, so they are compared by their
+    # unique_ids instead
+    if isinstance(value, dict):
+        return {k: comparable(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [comparable(v) for v in value]
+    if isinstance(value, ManifestNodeReference):
+        return ("ManifestNodeReference", value.unique_id)
+    return (type(value), value)
+
+
+@pytest.mark.parametrize("name", list(ARTIFACT_DESERIALIZERS))
+def test_construct_matches_validation(name):
+    model = ARTIFACT_DESERIALIZERS[name].model
+    loader = FileSystemLoader(config=Config())
+    validated = model.parse_obj(loader.load(name))
+    constructed = construct(model, loader.load(name))
+
+    assert type(constructed) is model
+    assert constructed.__fields_set__ == validated.__fields_set__
+    assert comparable(constructed.dict()) == comparable(validated.dict())
+
+
+def test_construct_builds_the_node_union():
+    manifest = Manifest.deserialize(trusted=True)
+    validated = Manifest.deserialize(trusted=False)
+    for unique_id, node in manifest.nodes.items():
+        assert type(node) is type(validated.nodes[unique_id])
+        assert type(node).__fields__["resource_type"].type_.__args__ == (
+            node.resource_type,
+        )
+        assert node.db_schema == validated.nodes[unique_id].db_schema
+        assert [p.unique_id for p in manifest.parent_map[unique_id]] == [
+            p.unique_id for p in validated.parent_map[unique_id]
+        ]
+    for nodes in manifest.raw_disabled.values():
+        assert all(isinstance(n, pydantic.BaseModel) for n in nodes)
+
+    tests = list(manifest.iter_resource_type("test"))
+    assert all(type(test) is ManifestTestNode for test in tests)
+
+
+def test_construct_coerces_values_like_validation():
+    raw = {"id": "a", "include": False, "label": "A", "value": False}
+    stats = construct(CatalogNodeStats, raw)
+    assert stats.value == "False"
+    assert stats.description is None
+    assert stats.__fields_set__ == {"id", "include", "label", "value"}
+
+
+def test_construct_runs_validators():
+    raw = FileSystemLoader(config=Config()).load("manifest")
+    raw["metadata"]["dbt_version"] = "0.21.0"
+    with pytest.raises(pydantic.ValidationError):
+        construct(ManifestModel, raw)
+
+
+def test_trusted_config():
+    with profile() as profiles:
+        run_results = RunResults.deserialize(config=Config(trusted=True))
+        Manifest.deserialize(config=Config(trusted=True), trusted=False)
+    assert run_results.results[0].timing[0].started_at.tzinfo is not None
+    assert list(profiles[0].phases) == ["read", "decode", "construct"]
+    assert list(profiles[1].phases) == ["read", "decode", "validate"]
+
+
+def test_construct_reports_invalid_values():
+    raw = FileSystemLoader(config=Config()).load("manifest")
+    unique_id = next(iter(raw["nodes"]))
+    raw["nodes"][unique_id]["resource_type"] = "invalid"
+    with pytest.raises(pydantic.ValidationError):
+        construct(ManifestModel, raw)
+
+    raw = FileSystemLoader(config=Config()).load("manifest")
+    raw["parent_map"][unique_id] = [1]
+    with pytest.raises(pydantic.ValidationError):
+        construct(ManifestModel, raw)
+
+
+def test_trusted_artifacts_are_cached_separately(tmp_path, tmp_project):
+    path = os.path.join(tmp_project.dbt_target_dir, "run_results.json")
+    with open(path) as fh:
+        raw = json.load(fh)
+    del raw["results"][0]["status"]
+    with open(path, "w") as fh:
+        json.dump(raw, fh)
+
+    config = Config(**{**tmp_project, "cache_dir": str(tmp_path / "cache")})
+    trusted = RunResults.deserialize(config=config, trusted=True)
+    assert "status" not in trusted.results[0].__fields_set__
+    with pytest.raises(pydantic.ValidationError):
+        RunResults.deserialize(config=config)
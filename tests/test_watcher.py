@@ -0,0 +1,72 @@
+import os
+import time
+
+from artefacts.deserializers import Manifest, RunResults
+from artefacts.watcher import ArtifactWatcher
+import artefacts.state
+from .conftest import touch
+
+
+def test_watcher_reloads_changed_artifacts(clean_state, tmp_project):
+    manifest = Manifest(config=tmp_project)
+    run_results = RunResults()
+    watcher = ArtifactWatcher()
+    assert watcher.check() == []
+
+    touch(os.path.join(tmp_project.dbt_target_dir, "manifest.json"))
+
+    # The change is only picked up once the file has been stable for a check
+    assert watcher.check() == []
+    assert artefacts.state.get("manifest") is manifest
+    assert watcher.check() == ["manifest"]
+    assert artefacts.state.get("manifest") is not manifest
+    assert artefacts.state.get("run_results") is run_results
+    assert Manifest() is artefacts.state.get("manifest")
+
+
+def test_watcher_ignores_unloaded_artifacts(clean_state, tmp_project):
+    Manifest(config=tmp_project)
+    touch(os.path.join(tmp_project.dbt_target_dir, "catalog.json"))
+    watcher = ArtifactWatcher()
+    assert watcher.check() == []
+    assert watcher.check() == []
+    assert not artefacts.state.exists("catalog")
+
+
+def test_watcher_keeps_artifact_when_reload_fails(clean_state, tmp_project):
+    manifest = Manifest(config=tmp_project)
+    with open(os.path.join(tmp_project.dbt_target_dir, "manifest.json"), "w") as fh:
+        fh.write("{")
+
+    watcher = ArtifactWatcher()
+    assert watcher.check() == []
+    assert watcher.check() == []
+    assert artefacts.state.get("manifest") is manifest
+
+
+def test_watcher_thread(clean_state, tmp_project):
+    manifest = Manifest(config=tmp_project)
+    with ArtifactWatcher(interval=0.01):
+        touch(os.path.join(tmp_project.dbt_target_dir, "manifest.json"))
+        deadline = time.time() + 10
+        while artefacts.state.get("manifest") is manifest and time.time() < deadline:
+            time.sleep(0.01)
+    assert artefacts.state.get("manifest") is not manifest
+
+
+def test_watcher_reloads_artifacts_of_each_target_dir(clean_state, tmp_projects):
+    config_a, config_b = tmp_projects
+    manifest_a = Manifest(config=config_a)
+    manifest_b = Manifest(config=config_b)
+    watcher = ArtifactWatcher()
+    assert watcher.check() == []
+
+    touch(os.path.join(config_b.dbt_target_dir, "manifest.json"))
+    assert watcher.check() == []
+    assert watcher.check() == ["manifest"]
+    assert Manifest(config=config_a) is manifest_a
+
+    reloaded = Manifest(config=config_b)
+    assert reloaded is not manifest_b
+    node = reloaded.nodes[next(iter(reloaded.nodes))]
+    assert node.manifest_artifact is reloaded